@@ -1,6 +1,5 @@
 #pylint: disable=logging-fstring-interpolation
 #Standart library imports
-import time
 from pathlib import Path
 from typing import Tuple
 from packaging import version
@@ -34,7 +33,7 @@ class ChromeDriver(DriverBase):
 
         self.chromedriver_path = self.driver_path
 
-        kwargs.update(path=self.chromedriver_path)
+        kwargs.update(path=self.chromedriver_path, setting=self.setting)
         self.chromebrowser = ChromeBrowser(**kwargs)
 
     def main(self) -> str:
@@ -249,28 +248,30 @@ class ChromeDriver(DriverBase):
             Path(out_path).unlink()
 
         logger.info(f'Started download chromedriver by url: {url}')
-        archive_path = super()._wget_download_driver(url, out_path)
-        time.sleep(2)
 
-        logger.info(f'\r\nChromedriver was downloaded to path: {archive_path}')
+        if not super()._stream_extract_archive(url):
 
-        out_path : str = self.path
+            archive_path = super()._download_archive(url, out_path)
 
-        parameters = dict(archive_path=archive_path, out_path=out_path)
+            logger.info(f'\r\nChromedriver was downloaded to path: {archive_path}')
 
-        if not self.filename:
+            out_path : str = self.path
 
-            self.extractor.extract_and_detect_archive_format(**parameters)
+            parameters = dict(archive_path=archive_path, out_path=out_path)
 
-        else:
+            if not self.filename:
+
+                self.extractor.extract_and_detect_archive_format(**parameters)
 
-            filename = self.setting['ChromeDriver']['LastReleasePlatform']
-            parameters.update(dict(filename=filename, filename_replace=self.filename))
+            else:
 
-            self.extractor.extract_all_zip_archive_with_specific_name(**parameters)
+                filename = self.setting['ChromeDriver']['LastReleasePlatform']
+                parameters.update(dict(filename=filename, filename_replace=self.filename))
 
-        if Path(archive_path).exists():
-            Path(archive_path).unlink()
+                self.extractor.extract_all_zip_archive_with_specific_name(**parameters)
+
+            if Path(archive_path).exists():
+                Path(archive_path).unlink()
 
         driver_path = self.chromedriver_path
 
@@ -280,4 +281,6 @@ class ChromeDriver(DriverBase):
 
             super()._chmod_driver()
 
+        super()._save_install_manifest()
+
         return driver_path
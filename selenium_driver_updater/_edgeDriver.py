@@ -1,6 +1,5 @@
 #pylint: disable=logging-fstring-interpolation
 #Standart library imports
-import time
 from pathlib import Path
 from packaging import version
 
@@ -30,7 +29,7 @@ class EdgeDriver(DriverBase):
             self.system_name = f"edgedriver_{specific_system}.zip"
 
         self.edgedriver_path = self.driver_path
-        kwargs.update(path=self.edgedriver_path)
+        kwargs.update(path=self.edgedriver_path, setting=self.setting)
         self.edgebrowser = EdgeBrowser(**kwargs)
 
     def main(self) -> str:
@@ -191,29 +190,31 @@ class EdgeDriver(DriverBase):
             Path(out_path).unlink()
 
         logger.info(f'Started download edgedriver by url: {url}')
-        archive_path = super()._wget_download_driver(url, out_path)
-        time.sleep(2)
 
-        logger.info(f'Edgedriver was downloaded to path: {archive_path}')
+        if not super()._stream_extract_archive(url):
 
-        out_path = self.path
+            archive_path = super()._download_archive(url, out_path)
 
-        parameters = dict(archive_path=archive_path, out_path=out_path)
+            logger.info(f'Edgedriver was downloaded to path: {archive_path}')
 
-        if not self.filename:
+            out_path = self.path
 
-            self.extractor.extract_and_detect_archive_format(**parameters)
+            parameters = dict(archive_path=archive_path, out_path=out_path)
 
-        else:
+            if not self.filename:
+
+                self.extractor.extract_and_detect_archive_format(**parameters)
 
+            else:
 
-            filename = str(self.setting['EdgeDriver']['LastReleasePlatform'])
-            parameters.update(dict(filename=filename, filename_replace=self.filename))
 
-            self.extractor.extract_all_zip_archive_with_specific_name(**parameters)
+                filename = str(self.setting['EdgeDriver']['LastReleasePlatform'])
+                parameters.update(dict(filename=filename, filename_replace=self.filename))
 
-        if Path(archive_path).exists():
-            Path(archive_path).unlink()
+                self.extractor.extract_all_zip_archive_with_specific_name(**parameters)
+
+            if Path(archive_path).exists():
+                Path(archive_path).unlink()
 
         driver_path = self.edgedriver_path
 
@@ -223,5 +224,7 @@ class EdgeDriver(DriverBase):
 
             super()._chmod_driver()
 
+        super()._save_install_manifest()
+
         return driver_path
         
\ No newline at end of file
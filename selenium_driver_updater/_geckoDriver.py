@@ -1,6 +1,5 @@
 #pylint: disable=logging-fstring-interpolation
 #Standart library imports
-import time
 import re
 from pathlib import Path
 
@@ -38,7 +37,7 @@ class GeckoDriver(DriverBase):
 
         self.geckodriver_path = self.driver_path
 
-        kwargs.update(path=self.geckodriver_path)
+        kwargs.update(path=self.geckodriver_path, setting=self.setting)
         self.firefoxbrowser = FirefoxBrowser(**kwargs)
 
     def main(self) -> str:
@@ -128,19 +127,10 @@ class GeckoDriver(DriverBase):
 
         """
         archive_name : str = url.split("/")[len(url.split("/"))-1]
-        is_found : bool = False
         find_string = re.findall(self.setting["Program"]["wedriverVersionPattern"], url)
         driver_version = find_string[0] if len(find_string) > 0 else ''
 
-        json_data = self.github_viewer.get_all_releases_data_by_repo_name(GeckoDriver._repo_name)
-
-        for data in json_data:
-            if data.get('name') == driver_version:
-                for asset in data.get('assets'):
-                    if asset.get('name') == archive_name:
-                        is_found = True
-                        break
-                break
+        is_found = self.github_viewer.is_release_asset_available(GeckoDriver._repo_name, driver_version, archive_name)
 
         if not is_found:
             message = f'Wrong version or system_name was specified. driver_version: {driver_version} url: {url}'
@@ -206,27 +196,29 @@ class GeckoDriver(DriverBase):
             Path(out_path).unlink()
 
         logger.info(f'Started download geckodriver by url: {url}')
-        archive_path = super()._wget_download_driver(url, out_path)
-        time.sleep(2)
 
-        logger.info(f'Geckodriver was downloaded to path: {archive_path}')
+        if not super()._stream_extract_archive(url):
 
-        out_path = self.path
+            archive_path = super()._download_archive(url, out_path)
 
-        parameters = dict(archive_path=archive_path, out_path=out_path)
+            logger.info(f'Geckodriver was downloaded to path: {archive_path}')
 
-        if not self.filename:
+            out_path = self.path
 
-            self.extractor.extract_and_detect_archive_format(**parameters)
+            parameters = dict(archive_path=archive_path, out_path=out_path)
 
-        else:
-            filename = self.setting['GeckoDriver']['LastReleasePlatform']
-            parameters.update(dict(filename=filename, filename_replace=self.filename))
+            if not self.filename:
+
+                self.extractor.extract_and_detect_archive_format(**parameters)
 
-            self.extractor.extract_all_zip_archive_with_specific_name(**parameters)
+            else:
+                filename = self.setting['GeckoDriver']['LastReleasePlatform']
+                parameters.update(dict(filename=filename, filename_replace=self.filename))
+
+                self.extractor.extract_all_zip_archive_with_specific_name(**parameters)
 
-        if Path(archive_path).exists():
-            Path(archive_path).unlink()
+            if Path(archive_path).exists():
+                Path(archive_path).unlink()
 
         driver_path = self.geckodriver_path
 
@@ -236,5 +228,7 @@ class GeckoDriver(DriverBase):
 
             super()._chmod_driver()
 
+        super()._save_install_manifest()
+
         return driver_path
         
\ No newline at end of file
@@ -2,7 +2,6 @@
 #Standart library imports
 import shutil
 import os
-import time
 from shutil import copyfile
 from pathlib import Path
 import re
@@ -37,7 +36,7 @@ class OperaDriver(DriverBase):
 
         self.operadriver_path = self.driver_path
 
-        kwargs.update(path=self.operadriver_path)
+        kwargs.update(path=self.operadriver_path, setting=self.setting)
         self.operabrowser = OperaBrowser(**kwargs)
 
     def main(self) -> str:
@@ -150,19 +149,11 @@ class OperaDriver(DriverBase):
 
         """
         archive_name : str = url.split("/")[len(url.split("/"))-1]
-        is_found : bool = False
 
         find_string = re.findall(self.setting["Program"]["wedriverVersionPattern"], url)
         driver_version = 'v' + find_string[0] if len(find_string) > 0 else ''
 
-        json_data = self.github_viewer.get_all_releases_data_by_repo_name(OperaDriver._repo_name)
-
-        for data in json_data:
-            if data.get('tag_name') == driver_version or data.get('name') == driver_version:
-                for asset in data.get('assets'):
-                    if asset.get('name') == archive_name:
-                        is_found = True
-                        break
+        is_found = self.github_viewer.is_release_asset_available(OperaDriver._repo_name, driver_version, archive_name)
 
         if not is_found:
             message = f'Wrong version or system_name was specified. driver_version: {driver_version} url: {url}'
@@ -230,31 +221,33 @@ class OperaDriver(DriverBase):
             Path(out_path).unlink()
 
         logger.info(f'Started download operadriver by url: {url}')
-        archive_path = super()._wget_download_driver(url, out_path)
-        time.sleep(2)
-        
-        logger.info(f'Operadriver was downloaded to path: {archive_path}')
 
-        out_path = self.path
+        if not super()._stream_extract_archive(url):
 
-        parameters = dict(archive_path=archive_path, out_path=out_path)
+            archive_path = super()._download_archive(url, out_path)
 
-        if not self.filename:
+            logger.info(f'Operadriver was downloaded to path: {archive_path}')
 
-            self.extractor.extract_and_detect_archive_format(**parameters)
+            out_path = self.path
 
-        else:
+            parameters = dict(archive_path=archive_path, out_path=out_path)
+
+            if not self.filename:
 
-            filename = str(self.setting['OperaDriver']['LastReleasePlatform'])
-            parameters.update(dict(filename=filename, filename_replace=self.filename))
+                self.extractor.extract_and_detect_archive_format(**parameters)
 
-            self.extractor.extract_all_zip_archive_with_specific_name(**parameters)
+            else:
 
-        if Path(archive_path).exists():
-            shutil.rmtree(archive_path)
+                filename = str(self.setting['OperaDriver']['LastReleasePlatform'])
+                parameters.update(dict(filename=filename, filename_replace=self.filename))
 
-        if Path(archive_path).exists():
-            shutil.rmtree(archive_path)
+                self.extractor.extract_all_zip_archive_with_specific_name(**parameters)
+
+            if Path(archive_path).exists():
+                shutil.rmtree(archive_path)
+
+            if Path(archive_path).exists():
+                shutil.rmtree(archive_path)
 
         driver_path = self.operadriver_path
 
@@ -264,5 +257,7 @@ class OperaDriver(DriverBase):
 
             super()._chmod_driver()
 
+        super()._save_install_manifest()
+
         return driver_path
         
\ No newline at end of file
@@ -1,11 +1,8 @@
 #pylint: disable=logging-fstring-interpolation
 #Standart library imports
-import shutil
 import os
-import time
 from typing import Tuple
 from pathlib import Path
-import re
 from shutil import copyfile
 
 # Local imports
@@ -185,23 +182,9 @@ class PhantomJS(DriverBase):
 
         """
         latest_previous_version : str = ''
-        all_versions = []
 
         url = self.setting["PhantomJS"]["LinkAllReleases"]
-        json_data = self.requests_getter.get_result_by_request(url=url, is_json=True)
-
-        values = json_data.get('values')
-        for value in values:
-            value_name = value.get('name')
-            if not 'beta' in value_name:
-
-                find_string = re.findall(self.setting["Program"]["wedriverVersionPattern"], value_name)
-                version = find_string[0] if len(find_string) > 0 else ''
-
-                all_versions.append(version)
-
-        all_versions = list(set(all_versions))
-        all_versions.sort(key=lambda s: list(map(int, s.split('.'))))
+        all_versions = self.bitbucket_catalog.get_versions(url)
 
         latest_previous_version = all_versions[len(all_versions)-2]
 
@@ -219,20 +202,8 @@ class PhantomJS(DriverBase):
 
         archive_name : str = url.split("/")[len(url.split("/"))-1]
         url_releases : str = self.setting["PhantomJS"]["LinkAllReleases"]
-        is_found : bool = False
-
-        while is_found is False:
-
-            json_data = self.requests_getter.get_result_by_request(url=url_releases, is_json=True)
 
-            for data in json_data.get('values'):
-                if data.get('name') == archive_name:
-                    is_found = True
-                    break
-
-            url_releases = json_data.get('next')
-            if not url_releases:
-                break
+        is_found = self.bitbucket_catalog.is_available(url_releases, archive_name)
 
         if not is_found:
             message = f'Wrong version or system_name was specified. archive_name: {archive_name} url: {url}'
@@ -301,28 +272,30 @@ class PhantomJS(DriverBase):
             Path(out_path).unlink()
 
         logger.info(f'Started download phantomjs by url: {url}')
-        archive_path = super()._wget_download_driver(url, out_path)
-        time.sleep(2)
 
-        logger.info(f'PhantomJS was downloaded to path: {archive_path}')
+        if not super()._stream_extract_archive(url):
 
-        out_path = self.path
+            archive_path = super()._download_archive(url, out_path)
 
-        parameters = dict(archive_path=archive_path, out_path=out_path)
+            logger.info(f'PhantomJS was downloaded to path: {archive_path}')
 
-        if not self.filename:
+            out_path = self.path
 
-            self.extractor.extract_and_detect_archive_format(**parameters)
+            parameters = dict(archive_path=archive_path, out_path=out_path)
 
-        else:
+            if not self.filename:
+
+                self.extractor.extract_and_detect_archive_format(**parameters)
 
-            filename = str(self.setting['PhantomJS']['LastReleasePlatform'])
-            parameters.update(dict(filename=filename, filename_replace=self.filename))
+            else:
+
+                filename = str(self.setting['PhantomJS']['LastReleasePlatform'])
+                parameters.update(dict(filename=filename, filename_replace=self.filename))
 
-            self.extractor.extract_all_zip_archive_with_specific_name(**parameters)
+                self.extractor.extract_all_zip_archive_with_specific_name(**parameters)
 
-        if Path(archive_path).exists():
-            shutil.rmtree(archive_path)
+            if Path(archive_path).exists():
+                Path(archive_path).unlink()
 
         driver_path = self.phantomjs_path
 
@@ -332,4 +305,6 @@ class PhantomJS(DriverBase):
 
             super()._chmod_driver()
 
+        super()._save_install_manifest()
+
         return driver_path
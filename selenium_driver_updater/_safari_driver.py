@@ -1,10 +1,7 @@
-#pylint: disable=logging-fstring-interpolation
+#pylint: disable=logging-fstring-interpolation, import-outside-toplevel
 #Standart library imports
 import platform
 
-#Third library imports
-from bs4 import BeautifulSoup
-
 # Local imports
 from selenium_driver_updater.util.logger import logger
 
@@ -18,6 +15,9 @@ class SafariDriver(DriverBase):
         kwargs.update(path='/usr/bin/')
         DriverBase.__init__(self, **kwargs)
 
+        #safaridriver is never installed, so there is nothing to lock
+        self.lock_path = ''
+
     def main(self) -> str:
         """Main function, checks for the latest version of safaridriver.
 
@@ -63,6 +63,8 @@ class SafariDriver(DriverBase):
 
         """
 
+        from bs4 import BeautifulSoup
+
         latest_version : str = ''
         url = self.setting["SafariDriver"]["LinkLastRelease"]
 
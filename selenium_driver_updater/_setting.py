@@ -2,15 +2,16 @@
 #Standart library imports
 import os
 import platform
+import struct
 
 base_dir = os.path.dirname(os.path.abspath(__file__)) + os.path.sep
 
-os_bit = platform.architecture()[0][:-3]
+cache_dir = os.environ.get('SELENIUM_DRIVER_UPDATER_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'selenium-driver-updater')) + os.path.sep
+
+os_bit = str(struct.calcsize('P') * 8)
 os_bit_phantom_js = 'x86_64' if os_bit == '64' else "i686"
 
-is_arm = 'arm' in platform.processor().lower()
-if os.name != 'nt':  # Check if not on Windows
-    is_arm = is_arm or 'arm' in str(os.uname().machine)
+is_arm = 'arm' in platform.machine().lower()
 
 os_type = {
     'Windows': {
@@ -88,12 +89,47 @@ browser_paths = {
     }
 }
 
+#only files which are part of installed browser are used, files in user profile like "Last Version" describe the last started browser
+browser_metadata_paths = {
+    'Darwin': {
+        'chrome': ['/Applications/Google Chrome.app/Contents/Info.plist'],
+        'firefox': ['/Applications/Firefox.app/Contents/Resources/application.ini',
+                    '/Applications/Firefox.app/Contents/Info.plist'],
+        'edge': ['/Applications/Microsoft Edge.app/Contents/Info.plist'],
+        'opera': ['/Applications/Opera.app/Contents/Info.plist'],
+    },
+    #chromium based browsers on Windows keep files of installed version in folder named by the version
+    'Windows': {
+        'chrome': [r'%PROGRAMFILES%\Google\Chrome\Application',
+                   r'%PROGRAMFILES(X86)%\Google\Chrome\Application',
+                   r'%LOCALAPPDATA%\Google\Chrome\Application'],
+        'firefox': [r'%PROGRAMFILES%\Mozilla Firefox\application.ini',
+                    r'%PROGRAMFILES(X86)%\Mozilla Firefox\application.ini'],
+        'edge': [r'%PROGRAMFILES(X86)%\Microsoft\Edge\Application',
+                 r'%PROGRAMFILES%\Microsoft\Edge\Application'],
+        'opera': [r'%LOCALAPPDATA%\Programs\Opera',
+                  r'%PROGRAMFILES%\Opera'],
+    },
+    #linux packages of chrome, edge and opera do not contain any file with version, so their version is got from terminal
+    'Linux': {
+        'firefox': ['/usr/lib/firefox/application.ini',
+                    '/usr/lib64/firefox/application.ini',
+                    '/opt/firefox/application.ini',
+                    '/snap/firefox/current/usr/lib/firefox/application.ini'],
+    }
+}
+
 chrome_browser_path = browser_paths[os_name].get('chrome', '')
 firefox_browser_path = browser_paths[os_name].get('firefox', '')
 edge_browser_path = browser_paths[os_name].get('edge', '')
 edge_browser_release = browser_paths[os_name].get('edge_release', '')
 opera_browser_path = browser_paths[os_name].get('opera', '')
 
+chrome_browser_metadata_paths = browser_metadata_paths.get(os_name, {}).get('chrome', [])
+firefox_browser_metadata_paths = browser_metadata_paths.get(os_name, {}).get('firefox', [])
+edge_browser_metadata_paths = browser_metadata_paths.get(os_name, {}).get('edge', [])
+opera_browser_metadata_paths = browser_metadata_paths.get(os_name, {}).get('opera', [])
+
 from dataclasses import dataclass
 
 @dataclass
@@ -117,6 +153,7 @@ setting = dict(
             "LastReleasePlatform"               : 'chromedriver',
             "LinkLatestReleaseSpecificVersion"  : "https://googlechromelabs.github.io/chrome-for-testing/LATEST_RELEASE_{}",
             "LinkCheckVersionIsValid"           : "https://googlechromelabs.github.io/chrome-for-testing/known-good-versions-with-downloads.json",
+            "LinkVersionDownloads"              : "https://googlechromelabs.github.io/chrome-for-testing/{}.json",
         },
         "GeckoDriver":
         {
@@ -150,25 +187,32 @@ setting = dict(
         "ChromeBrowser":
         {
             "Path"                      : chrome_browser_path,
+            "MetadataPaths"             : chrome_browser_metadata_paths,
+            "LinkLatestReleaseFeed"     : "https://versionhistory.googleapis.com/v1/chrome/platforms/{}/channels/stable/versions",
             "LinkAllLatestRelease"      : 'https://chromereleases.googleblog.com/search/label/Stable%20updates',
             "LinkAllLatestReleaseFile"  : 'https://dl.google.com/chrome/mac/universal/stable/GGRO/googlechrome.dmg',
         },
         "FirefoxBrowser":
         {
             "Path"                          : firefox_browser_path,
+            "MetadataPaths"                 : firefox_browser_metadata_paths,
+            "LinkLatestReleaseFeed"         : 'https://product-details.mozilla.org/1.0/firefox_versions.json',
             "LinkAllLatestReleases"         : 'https://www.mozilla.org/en-US/firefox/releases/',
             "LinkAllLatestRelease"          : 'https://download-installer.cdn.mozilla.net/pub/firefox/releases/{}/{}/{}/Firefox {}.{}',
         },
         "EdgeBrowser":
         {
             "Path"                          : edge_browser_path,
+            "MetadataPaths"                 : edge_browser_metadata_paths,
             "LinkAllLatestRelease"          : 'https://docs.microsoft.com/en-us/deployedge/microsoft-edge-relnote-stable-channel',
             "LinkAllLatestReleaseFile"      : edge_browser_release,
         },
         "OperaBrowser":
         {
             "Path"                          : opera_browser_path,
+            "MetadataPaths"                 : opera_browser_metadata_paths,
             "LinkAllLatestRelease"          : 'https://get.geo.opera.com/pub/opera/desktop/',
+            "ProbeWindowSize"               : 8,
         },
         "JsonSchema":
         {
@@ -180,11 +224,71 @@ setting = dict(
         {
             "linkLatestReleaseBySpecificRepoName"   : 'https://api.github.com/repos/{}/releases/latest',
             "linkAllReleasesTags"                   : 'https://api.github.com/repos/{}/git/refs/tags',
-            "linkAllReleases"                       : 'https://api.github.com/repos/{}/releases?per_page=100000',
+            "linkAllReleases"                       : 'https://api.github.com/repos/{}/releases?per_page=100',
+            "Token"                                 : os.environ.get('GITHUB_TOKEN', ''),
+            "MaxWait"                               : 15,
+            "SpreadBelow"                           : 10,
         },
         "PyPi":
         {
             'urlProjectJson'    : 'https://pypi.python.org/pypi/selenium-driver-updater/json',
+            'WaitAfterInstall'  : 2,
+        },
+        "Requests":
+        {
+            "ConnectTimeout"    : 10,
+            "ReadTimeout"       : 60,
+            "Retries"           : 3,
+            "BackoffFactor"     : 0.5,
+            "RetryStatusCodes"  : [429, 500, 502, 503, 504],
+            "PoolMaxSize"       : 10,
+        },
+        "Downloader":
+        {
+            "ChunkSize"         : 1024 * 64,
+            "Segments"          : 1,
+            "SegmentMinSize"    : 1024 * 1024 * 8,
+            "StreamExtract"     : os.environ.get('SELENIUM_DRIVER_UPDATER_STREAM_EXTRACT', '0') == '1',
+            "SpoolMaxSize"      : 1024 * 1024 * 64,
+        },
+        "ArtifactStore":
+        {
+            "Enabled"           : os.environ.get('SELENIUM_DRIVER_UPDATER_ARTIFACT_STORE', '1') != '0',
+            "Path"              : cache_dir + 'artifacts' + os.path.sep,
+            "MaxSize"           : 1024 * 1024 * 1024,
+        },
+        "MetadataCache":
+        {
+            "Enabled"       : os.environ.get('SELENIUM_DRIVER_UPDATER_CACHE', '1') != '0',
+            "Path"          : cache_dir + 'metadata' + os.path.sep,
+            "DefaultTTL"    : 0,
+            "TTL"           :
+            {
+                'last-known-good-versions.json'             : 3600,
+                'known-good-versions-with-downloads.json'   : 86400,
+                'LATEST_RELEASE_'                           : 3600,
+                'LATEST_STABLE'                             : 3600,
+                'api.github.com'                            : 3600,
+                'api.bitbucket.org'                         : 86400,
+                'pypi.python.org'                           : 86400,
+                'firefox_versions.json'                     : 3600,
+                'versionhistory.googleapis.com'             : 3600,
+                'get.geo.opera.com'                         : 3600,
+            },
+        },
+        "Mirror":
+        {
+            "BaseUrl"       : os.environ.get('SELENIUM_DRIVER_UPDATER_MIRROR', ''),
+            "SyncPath"      : '',
+        },
+        "FileLock":
+        {
+            "Timeout"       : 600,
+            "PollInterval"  : 0.2,
+        },
+        "Freshness":
+        {
+            "TrustManifestFor"  : int(os.environ.get('SELENIUM_DRIVER_UPDATER_TRUST_MANIFEST_FOR', '0')),
         },
     }
 )
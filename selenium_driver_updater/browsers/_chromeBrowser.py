@@ -1,4 +1,4 @@
-#pylint: disable=logging-fstring-interpolation
+#pylint: disable=logging-fstring-interpolation, import-outside-toplevel, broad-except
 #Standart library imports
 import subprocess
 import os
@@ -8,32 +8,27 @@ from typing import Tuple, Any
 from pathlib import Path
 import shutil
 
-# Third party imports
-from bs4 import BeautifulSoup
-import wget
-
-# Selenium imports
-from selenium import webdriver
-from selenium.common.exceptions import SessionNotCreatedException
-from selenium.common.exceptions import WebDriverException
-
 # Local imports
 from selenium_driver_updater._setting import setting
 
 from selenium_driver_updater.util.extractor import Extractor
 from selenium_driver_updater.util.requests_getter import RequestsGetter
+from selenium_driver_updater.util.downloader import Downloader
+from selenium_driver_updater.util.browser_metadata import BrowserMetadata
 from selenium_driver_updater.util.logger import logger
 
 class ChromeBrowser():
     """Class for working with Chrome browser"""
 
     def __init__(self, **kwargs):
-        self.setting : Any = setting
+        self.setting : Any = kwargs.get('setting') or setting
         self.check_browser_is_up_to_date = bool(kwargs.get('check_browser_is_up_to_date'))
 
         self.chromedriver_path = str(kwargs.get('path'))
         self.extractor = Extractor
         self.requests_getter = RequestsGetter
+        self.downloader = Downloader
+        self.browser_metadata = BrowserMetadata
 
     def main(self) -> None:
         """Main function, checks for the latest version, downloads or updates chrome browser"""
@@ -113,16 +108,27 @@ class ChromeBrowser():
 
         """
 
-        browser_version : str = ''
+        #metadata and terminal are tried first, selenium is imported only if the browser has to be started via chromedriver
+        browser_version : str = self.browser_metadata.get_version(self.setting["ChromeBrowser"]["MetadataPaths"])
 
         try:
 
-            browser_version = self._get_current_version_chrome_browser_selenium_via_terminal()
             if not browser_version:
-                message = 'Trying to get current version of chrome browser via chromedriver'
-                logger.info(message)
+                browser_version = self._get_current_version_chrome_browser_selenium_via_terminal()
+
+        except OSError:
+            pass
 
-            if Path(self.chromedriver_path).exists() and not browser_version:
+        if not browser_version and Path(self.chromedriver_path).exists():
+
+            message = 'Trying to get current version of chrome browser via chromedriver'
+            logger.info(message)
+
+            from selenium import webdriver
+            from selenium.common.exceptions import SessionNotCreatedException
+            from selenium.common.exceptions import WebDriverException
+
+            try:
 
                 chrome_options = webdriver.ChromeOptions()
 
@@ -131,10 +137,10 @@ class ChromeBrowser():
                 with webdriver.Chrome(executable_path = self.chromedriver_path, options = chrome_options) as driver:
                     browser_version = str(driver.capabilities['browserVersion'])
 
-            logger.info(f'Current version of chrome browser: {browser_version}')
+            except (WebDriverException, SessionNotCreatedException, OSError):
+                pass #[Errno 86] Bad CPU type in executable:
 
-        except (WebDriverException, SessionNotCreatedException, OSError):
-            pass #[Errno 86] Bad CPU type in executable:
+        logger.info(f'Current version of chrome browser: {browser_version}')
 
         return browser_version
 
@@ -189,7 +195,10 @@ class ChromeBrowser():
         return browser_version
 
     def _get_latest_version_chrome_browser(self, no_messages : bool = False) -> str:
-        """Gets latest chrome browser version
+        """Gets latest stable chrome browser version of current OS from Chrome VersionHistory API, release blog is parsed only if it is not available
+
+        VersionHistory describes released browser and does not depend on Chrome for Testing feed of chromedriver,
+        so chromedriver can still detect that its new major version is not released for the browser yet.
 
 
         Returns:
@@ -199,6 +208,56 @@ class ChromeBrowser():
 
         """
 
+        latest_version : str = ''
+
+        try:
+
+            url = str(self.setting["ChromeBrowser"]["LinkLatestReleaseFeed"]).format(self._get_version_history_platform())
+            json_data = self.requests_getter.get_result_by_request(url=url, is_json=True)
+
+            latest_version = str(json_data.get('versions')[0].get('version'))
+
+        except Exception as error:
+            logger.warning(f'Could not get latest version of chrome browser from release feed: {error}, trying release blog instead')
+            return self._get_latest_version_chrome_browser_via_site(no_messages=no_messages)
+
+        if not no_messages:
+
+            logger.info(f'Latest version of chrome browser: {latest_version}')
+
+        return latest_version
+
+    @staticmethod
+    def _get_version_history_platform() -> str:
+        """Gets name of current OS in Chrome VersionHistory API like win64, win_arm64, mac_arm64 or linux"""
+
+        system = platform.system()
+        is_64bit = platform.machine().endswith('64')
+        is_arm = 'arm' in platform.machine().lower()
+
+        if system == 'Windows':
+            if is_arm:
+                return 'win_arm64'
+            return 'win64' if is_64bit else 'win'
+
+        if system == 'Darwin':
+            return 'mac_arm64' if platform.machine() == 'arm64' else 'mac'
+
+        return 'linux'
+
+    def _get_latest_version_chrome_browser_via_site(self, no_messages : bool = False) -> str:
+        """Gets latest chrome browser version via parsing of chrome release blog
+
+
+        Returns:
+            str
+
+            latest_version (str)    : Latest version of chrome browser.
+
+        """
+
+        from bs4 import BeautifulSoup
+
         latest_version : str = ''
         latest_stable_version_element : Any = ''
 
@@ -257,7 +316,7 @@ class ChromeBrowser():
             Path(path + archive_name).unlink()
 
         logger.info(f'Started to download chrome browser by url: {url_release}')
-        archive_path = wget.download(url=url_release, out=path + archive_name)
+        archive_path = self.downloader.download(url=url_release, out_path=path + archive_name, progress=self.downloader.console_progress, resume=True)
 
         logger.info(f'Chrome browser was downloaded to path: {archive_path}')
 
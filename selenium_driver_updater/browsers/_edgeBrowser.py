@@ -1,4 +1,4 @@
-#pylint: disable=logging-fstring-interpolation
+#pylint: disable=logging-fstring-interpolation, import-outside-toplevel
 #Standart library imports
 import subprocess
 import time
@@ -9,30 +9,26 @@ from pathlib import Path
 import platform
 import shutil
 
-#Third party imports
-import wget
-
-# Selenium imports
-from selenium import webdriver
-from selenium.common.exceptions import SessionNotCreatedException
-from selenium.common.exceptions import WebDriverException
-
 # Local imports
 from selenium_driver_updater._setting import setting
 
 from selenium_driver_updater.util.requests_getter import RequestsGetter
+from selenium_driver_updater.util.downloader import Downloader
+from selenium_driver_updater.util.browser_metadata import BrowserMetadata
 from selenium_driver_updater.util.logger import logger
 
 class EdgeBrowser():
     """Class for working with Edge browser"""
 
     def __init__(self, **kwargs):
-        self.setting : Any = setting
+        self.setting : Any = kwargs.get('setting') or setting
         self.check_browser_is_up_to_date = bool(kwargs.get('check_browser_is_up_to_date'))
 
         self.edgedriver_path = str(kwargs.get('path'))
 
         self.requests_getter = RequestsGetter
+        self.downloader = Downloader
+        self.browser_metadata = BrowserMetadata
 
     def main(self):
         """Main function, checks for the latest version, downloads or updates edge browser"""
@@ -81,26 +77,37 @@ class EdgeBrowser():
 
         """
 
-        browser_version : str = ''
+        #metadata and terminal are tried first, selenium is imported only if the browser has to be started via edgedriver
+        browser_version : str = self.browser_metadata.get_version(self.setting["EdgeBrowser"]["MetadataPaths"])
 
         try:
 
-            browser_version = self._get_current_version_edge_browser_selenium_via_terminal()
             if not browser_version:
-                message = 'Trying to get current version of edge browser via edgedriver'
-                logger.info(message)
+                browser_version = self._get_current_version_edge_browser_selenium_via_terminal()
+
+        except OSError:
+            pass
+
+        if not browser_version and Path(self.edgedriver_path).exists():
+
+            message = 'Trying to get current version of edge browser via edgedriver'
+            logger.info(message)
+
+            from selenium import webdriver
+            from selenium.common.exceptions import SessionNotCreatedException
+            from selenium.common.exceptions import WebDriverException
 
-            if Path(self.edgedriver_path).exists() and not browser_version:
+            try:
 
                 desired_cap = {}
 
                 with webdriver.Edge(executable_path = self.edgedriver_path, capabilities=desired_cap) as driver:
                     browser_version = str(driver.capabilities['browserVersion'])
 
-            logger.info(f'Current version of edge browser: {browser_version}')
+            except (WebDriverException, SessionNotCreatedException, OSError):
+                pass #[Errno 86] Bad CPU type in executable:
 
-        except (WebDriverException, SessionNotCreatedException, OSError):
-            pass #[Errno 86] Bad CPU type in executable:
+        logger.info(f'Current version of edge browser: {browser_version}')
 
         return browser_version
 
@@ -146,7 +153,7 @@ class EdgeBrowser():
             Path(path + archive_name).unlink()
 
         logger.info(f'Started to download edge browser by url: {url_release}')
-        package_path = wget.download(url=url_release, out=path + archive_name)
+        package_path = self.downloader.download(url=url_release, out_path=path + archive_name, progress=self.downloader.console_progress, resume=True)
 
         logger.info(f'Edge browser was downloaded to path: {package_path}')
 
@@ -1,4 +1,4 @@
-#pylint: disable=logging-fstring-interpolation
+#pylint: disable=logging-fstring-interpolation, import-outside-toplevel, broad-except
 #Standart library imports
 import subprocess
 import re
@@ -9,33 +9,27 @@ from pathlib import Path
 import shutil
 import locale
 
-# Third party imports
-from bs4 import BeautifulSoup
-import wget
-
-# Selenium imports
-from selenium import webdriver
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.common.exceptions import SessionNotCreatedException
-from selenium.common.exceptions import WebDriverException
-
 # Local imports
 from selenium_driver_updater._setting import setting
 
 from selenium_driver_updater.util.requests_getter import RequestsGetter
+from selenium_driver_updater.util.downloader import Downloader
 from selenium_driver_updater.util.extractor import Extractor
+from selenium_driver_updater.util.browser_metadata import BrowserMetadata
 from selenium_driver_updater.util.logger import logger
 
 class FirefoxBrowser():
     """Class for working with Firefox browser"""
 
     def __init__(self, **kwargs):
-        self.setting : Any = setting
+        self.setting : Any = kwargs.get('setting') or setting
         self.check_browser_is_up_to_date = bool(kwargs.get('check_browser_is_up_to_date'))
 
         self.geckodriver_path = str(kwargs.get('path'))
 
         self.requests_getter = RequestsGetter
+        self.downloader = Downloader
+        self.browser_metadata = BrowserMetadata
         self.extractor = Extractor
 
     def main(self) -> None:
@@ -95,16 +89,28 @@ class FirefoxBrowser():
 
         """
 
-        browser_version : str = ''
+        #metadata and terminal are tried first, selenium is imported only if the browser has to be started via geckodriver
+        browser_version : str = self.browser_metadata.get_version(self.setting["FirefoxBrowser"]["MetadataPaths"])
 
         try:
 
-            browser_version = self._get_current_version_firefox_browser_selenium_via_terminal()
             if not browser_version:
-                message = 'Trying to get current version of firefox browser via geckodriver'
-                logger.info(message)
+                browser_version = self._get_current_version_firefox_browser_selenium_via_terminal()
+
+        except OSError:
+            pass
+
+        if not browser_version and Path(self.geckodriver_path).exists():
+
+            message = 'Trying to get current version of firefox browser via geckodriver'
+            logger.info(message)
 
-            if Path(self.geckodriver_path).exists() and not browser_version:
+            from selenium import webdriver
+            from selenium.webdriver.firefox.options import Options as FirefoxOptions
+            from selenium.common.exceptions import SessionNotCreatedException
+            from selenium.common.exceptions import WebDriverException
+
+            try:
 
                 options = FirefoxOptions()
                 options.add_argument("--headless")
@@ -112,15 +118,43 @@ class FirefoxBrowser():
                 with webdriver.Firefox(executable_path = self.geckodriver_path, options=options) as driver:
                     browser_version = str(driver.capabilities['browserVersion'])
 
-            logger.info(f'Current version of firefox browser: {browser_version}')
+            except (WebDriverException, SessionNotCreatedException, OSError):
+                pass #[Errno 86] Bad CPU type in executable:
 
-        except (WebDriverException, SessionNotCreatedException, OSError):
-            pass #[Errno 86] Bad CPU type in executable:
+        logger.info(f'Current version of firefox browser: {browser_version}')
 
         return browser_version
 
     def _get_latest_version_firefox_browser(self) -> str:
-        """Gets latest firefox browser version
+        """Gets latest firefox browser version from Mozilla product details json feed, releases page is parsed only if the feed is not available
+
+
+        Returns:
+            str
+
+            latest_version (str)    : Latest version of firefox browser.
+
+        """
+
+        latest_version : str = ''
+
+        try:
+
+            url = self.setting["FirefoxBrowser"]["LinkLatestReleaseFeed"]
+            json_data = self.requests_getter.get_result_by_request(url=url, is_json=True)
+
+            latest_version = str(json_data['LATEST_FIREFOX_VERSION'])
+
+        except Exception as error:
+            logger.warning(f'Could not get latest version of firefox browser from release feed: {error}, trying releases page instead')
+            return self._get_latest_version_firefox_browser_via_site()
+
+        logger.info(f'Latest version of firefox browser: {latest_version}')
+
+        return latest_version
+
+    def _get_latest_version_firefox_browser_via_site(self) -> str:
+        """Gets latest firefox browser version via parsing of firefox releases page
 
 
         Returns:
@@ -133,6 +167,8 @@ class FirefoxBrowser():
 
         """
 
+        from bs4 import BeautifulSoup
+
         latest_version : str = ''
 
         url = self.setting["FirefoxBrowser"]["LinkAllLatestReleases"]
@@ -181,7 +217,7 @@ class FirefoxBrowser():
             Path(path + archive_name).unlink()
 
         logger.info(f'Started to download firefox browser by url: {url_release}')
-        archive_path = wget.download(url=url_release, out=path + archive_name)
+        archive_path = self.downloader.download(url=url_release, out_path=path + archive_name, progress=self.downloader.console_progress, resume=True)
 
         logger.info(f'Firefox browser was downloaded to path: {archive_path}')
 
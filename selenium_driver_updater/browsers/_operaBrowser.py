@@ -1,4 +1,4 @@
-#pylint: disable=logging-fstring-interpolation
+#pylint: disable=logging-fstring-interpolation, import-outside-toplevel
 #Standart library imports
 import subprocess
 import os
@@ -8,32 +8,29 @@ from typing import Tuple,Any
 from pathlib import Path
 import shutil
 
-# Third party imports
-from bs4 import BeautifulSoup
-import wget
-
-# Selenium imports
-from selenium import webdriver
-from selenium.common.exceptions import SessionNotCreatedException
-from selenium.common.exceptions import WebDriverException
-
 # Local imports
 from selenium_driver_updater._setting import setting
 
 from selenium_driver_updater.util.requests_getter import RequestsGetter
+from selenium_driver_updater.util.downloader import Downloader
 from selenium_driver_updater.util.extractor import Extractor
+from selenium_driver_updater.util.browser_metadata import BrowserMetadata
+from selenium_driver_updater.util.release_prober import ReleaseProber
 from selenium_driver_updater.util.logger import logger
 
 class OperaBrowser():
     """Class for working with Opera browser"""
 
     def __init__(self, **kwargs):
-        self.setting : Any = setting
+        self.setting : Any = kwargs.get('setting') or setting
         self.check_browser_is_up_to_date = bool(kwargs.get('check_browser_is_up_to_date'))
 
         self.operadriver_path = str(kwargs.get('path'))
 
         self.requests_getter = RequestsGetter
+        self.downloader = Downloader
+        self.browser_metadata = BrowserMetadata
+        self.release_prober = ReleaseProber
         self.extractor = Extractor
         self.system_name = ''
         self.url_release = ''
@@ -90,16 +87,27 @@ class OperaBrowser():
 
         """
 
-        browser_version : str = ''
+        #metadata and terminal are tried first, selenium is imported only if the browser has to be started via operadriver
+        browser_version : str = self.browser_metadata.get_version(self.setting["OperaBrowser"]["MetadataPaths"])
 
         try:
 
-            browser_version = self._get_current_version_opera_browser_selenium_via_terminal()
             if not browser_version:
-                message = 'Trying to get current version of opera browser via operadriver'
-                logger.info(message)
+                browser_version = self._get_current_version_opera_browser_selenium_via_terminal()
+
+        except OSError:
+            pass
+
+        if not browser_version and Path(self.operadriver_path).exists():
+
+            message = 'Trying to get current version of opera browser via operadriver'
+            logger.info(message)
+
+            from selenium import webdriver
+            from selenium.common.exceptions import SessionNotCreatedException
+            from selenium.common.exceptions import WebDriverException
 
-            if Path(self.operadriver_path).exists() and not browser_version:
+            try:
 
                 with webdriver.Opera(executable_path = self.operadriver_path) as driver:
                     browser_version = driver.execute_script("return navigator.userAgent")
@@ -107,15 +115,17 @@ class OperaBrowser():
                 find_string = re.findall('OPR/' + self.setting["Program"]["wedriverVersionPattern"], browser_version)
                 browser_version = find_string[0] if len(find_string) > 0 else ''
 
-            logger.info(f'Current version of opera browser: {browser_version}')
+            except (WebDriverException, SessionNotCreatedException, OSError):
+                pass #[Errno 86] Bad CPU type in executable:
 
-        except (WebDriverException, SessionNotCreatedException, OSError):
-            pass #[Errno 86] Bad CPU type in executable:
+        logger.info(f'Current version of opera browser: {browser_version}')
 
         return browser_version
 
     def _get_latest_version_opera_browser(self) -> str:
-        """Gets latest opera browser version
+        """Gets latest opera browser version which has build for current OS
+
+        Release folders are probed in parallel windows via ReleaseProber, platforms of already probed releases are taken from its index.
 
 
         Returns:
@@ -128,6 +138,8 @@ class OperaBrowser():
 
         """
 
+        from bs4 import BeautifulSoup
+
         latest_version : str = ''
         version : str = ''
 
@@ -141,20 +153,14 @@ class OperaBrowser():
         system_name = system_name.replace('Windows', 'win')
         self.system_name = system_name.lower() + '/' #mac -> mac/ or Linux -> linux/
 
-        elements = soup.findAll('a')
-        for i,_ in enumerate(elements, 1):
-            version = elements[-i].attrs.get('href')
-            self.url_release = url + version
+        releases = [element.attrs.get('href', '').strip('/') for element in reversed(soup.findAll('a'))]
+        releases = [release for release in releases if re.fullmatch(self.setting["Program"]["wedriverVersionPattern"], release)]
 
-            json_data = self.requests_getter.get_result_by_request(url=self.url_release)
-
-            if not self.system_name in json_data:
-                continue
-
-            else:
-                break
+        version = self.release_prober.get_latest_release(url=url, releases=releases, platform=system_name.lower(),
+                                                        window_size=self.setting["OperaBrowser"]["ProbeWindowSize"])
+        self.url_release = url + version + '/'
 
-        latest_version = version.replace('/', '')
+        latest_version = version
 
         logger.info(f'Latest version of opera browser: {latest_version}')
 
@@ -200,7 +206,7 @@ class OperaBrowser():
             Path(path + archive_name).unlink()
 
         logger.info(f'Started to download opera browser by url: {url_full_release}')
-        archive_path = wget.download(url=url_full_release, out=path + archive_name)
+        archive_path = self.downloader.download(url=url_full_release, out_path=path + archive_name, progress=self.downloader.console_progress, resume=True)
 
         logger.info(f'Opera browser was downloaded to path: {archive_path}')
 
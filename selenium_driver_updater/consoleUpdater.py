@@ -1,5 +1,6 @@
 #Standart library imports
 import argparse
+import sys
 
 #Local imports
 from selenium_driver_updater._setting import setting
@@ -105,9 +106,86 @@ class ConsoleUpdater():
         help="Specific OS for driver",
         default='',
         )
+        parser.add_argument(
+        "--parallel",
+        type=ConsoleUpdater.string_to_bool,
+        action="store",
+        dest="parallel",
+        metavar="BOOLEAN",
+        help="If true, all specified drivers will be installed at the same time",
+        default=False,
+        )
+        parser.add_argument(
+        "--max_workers",
+        type=int,
+        action="store",
+        dest="max_workers",
+        metavar="MAX_WORKERS",
+        help="Maximum number of drivers installed at the same time if parallel is true",
+        default=4,
+        )
         parser.add_argument("--version", action="version", version=str(setting["Program"]["version"]))
         return parser.parse_args()
     
+    @staticmethod
+    def parse_mirror_command_line(args : list):
+        "Function for parsing arguments of \"mirror sync\" command"
+
+        parser = argparse.ArgumentParser(
+            prog='selenium-driver-updater mirror sync',
+            description="Fill local mirror with metadata and archives of specified drivers, versions and OSes.\n"
+            "Installs from the mirror are enabled via SELENIUM_DRIVER_UPDATER_MIRROR environment variable.",
+            formatter_class=argparse.RawTextHelpFormatter
+        )
+        parser.add_argument(
+        "--driver_name",
+        "-d",
+        type=ConsoleUpdater.comma_separated_string,
+        action="store",
+        dest="driver_name",
+        metavar="DRIVER_NAME",
+        help="Specified driver name/names which will be recorded to the mirror, if you want to specify multiple drivers, use commas",
+        required=True,
+        )
+        parser.add_argument(
+        "--path",
+        "-p",
+        action="store",
+        dest="path",
+        metavar="DIR",
+        help="Folder of the mirror",
+        required=True,
+        )
+        parser.add_argument(
+        "--driver_version",
+        "-v",
+        type=ConsoleUpdater.comma_separated_string,
+        action="store",
+        dest="version",
+        metavar="VERSION",
+        help="Versions of every driver which will be recorded, if you want to specify multiple versions, use commas. Defaults to the latest version",
+        default='',
+        )
+        parser.add_argument(
+        "--system_name",
+        type=ConsoleUpdater.comma_separated_string,
+        action="store",
+        dest="system_name",
+        metavar="SYSTEM_NAME",
+        help="OSes of every driver which will be recorded, if you want to specify multiple OSes, use commas. Defaults to current OS",
+        default='',
+        )
+        parser.add_argument(
+        "--info_messages",
+        "-im",
+        action="store",
+        dest="info_messages",
+        metavar="BOOLEAN",
+        help="If false, it will disable all info messages",
+        default=True,
+        )
+        return parser.parse_args(args)
+
     @staticmethod
     def comma_separated_string(value):
         """Convert a comma-separated string into a list or return as a string if no comma."""
@@ -115,10 +193,23 @@ class ConsoleUpdater():
             return value.split(',')
         return value
 
+    @staticmethod
+    def string_to_bool(value):
+        """Convert a string like "true", "1", "yes" or "false", "0", "no" into a bool."""
+        if value.lower() in ('true', '1', 'yes', 'y'):
+            return True
+        if value.lower() in ('false', '0', 'no', 'n'):
+            return False
+        raise argparse.ArgumentTypeError(f'Boolean value was expected, got: {value}')
+
     @staticmethod
     def install():
         "Main function that initializes all variables and pass it to main module (driver Updater)"
 
+        if sys.argv[1:3] == ['mirror', 'sync']:
+            ConsoleUpdater.sync_mirror(sys.argv[3:])
+            return
+
         args = ConsoleUpdater.parse_command_line()
         kwargs = vars(args)
         
@@ -127,3 +218,11 @@ class ConsoleUpdater():
                 kwargs['filename'] = [kwargs['filename']]
 
         DriverUpdater.install(**kwargs)
+
+    @staticmethod
+    def sync_mirror(args : list):
+        "Function that fills local mirror via \"mirror sync\" command"
+
+        kwargs = vars(ConsoleUpdater.parse_mirror_command_line(args))
+
+        DriverUpdater.sync_mirror(**kwargs)
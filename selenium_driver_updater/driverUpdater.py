@@ -1,13 +1,18 @@
-#pylint: disable=logging-fstring-interpolation, protected-access, broad-except
+#pylint: disable=logging-fstring-interpolation, protected-access, broad-except, import-outside-toplevel
 #Standart library imports
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 import os
-from typing import Any
+from typing import Any, Optional
 import time
 import sys
 import traceback
-from packaging import version
+import threading
+import tempfile
+import contextvars
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 # Local imports
 
@@ -15,28 +20,39 @@ from selenium_driver_updater.util import ALL_DRIVERS
 
 from selenium_driver_updater._setting import setting
 
-from selenium_driver_updater.util.requests_getter import RequestsGetter
-
+from selenium_driver_updater.util.mirror import Mirror
+from selenium_driver_updater.util.file_lock import FileLock
+from selenium_driver_updater.util.resolution_context import ResolutionContext
+from selenium_driver_updater.util.cancellation import Cancellation
+from selenium_driver_updater.util.install_manifest import InstallManifest
+from selenium_driver_updater.util.exceptions import InstallCancelledException
 from selenium_driver_updater.util.logger import logger
-from selenium_driver_updater.util.logger import levels
+from selenium_driver_updater.util.logger import info_messages as log_info_messages
 
-@dataclass
+@dataclass(frozen=True)
 class _info():
+    """Parameters of one call of DriverUpdater.install, new object is created for every call and it is never changed,
+    so several installs can run at the same time in different threads"""
 
     driver_name: Any = ''
 
-    path = ''
-    filename = ''
-    version = ''
+    path: str = ''
+    filename: Any = ''
+    version: Any = ''
     system_name: Any = ''
 
-    upgrade = False
-    chmod = True
-    check_driver_is_up_to_date = True
-    info_messages = False
+    upgrade: bool = False
+    chmod: bool = True
+    check_driver_is_up_to_date: bool = True
+    info_messages: bool = False
+
+    check_browser_is_up_to_date: bool = False
+    enable_library_update_check: bool = True
 
-    check_browser_is_up_to_date = False
-    enable_library_update_check = True
+    parallel: bool = False
+    max_workers: int = 4
+
+    trust_manifest_for: float = 0
 
 class DriverUpdater():
     """Main class for working with all drivers"""
@@ -63,6 +79,9 @@ class DriverUpdater():
 
     arm = 'arm64'
 
+    _library_check_thread : Optional[threading.Thread] = None
+    _library_check_lock = threading.Lock()
+
     @staticmethod
     def install(driver_name, **kwargs):
         """Function for install or update Selenium driver binary
@@ -78,7 +97,12 @@ class DriverUpdater():
             version (str)                       : Specific version for driver. If given, it will downloads given version. Defaults to empty string.
             check_browser_is_up_to_date (bool)  : If true, it will check browser version before specific driver update or upgrade. Defaults to False.
             enable_library_update_check (bool)  : If true, it will enable checking for library update while starting. Defaults to True.
+                                                  Install waits for the check at most setting["PyPi"]["WaitAfterInstall"] seconds before return.
             system_name (Union[str, list[str]]) : Specific OS for driver. Defaults to empty string.
+            parallel (bool)                     : If true and driver_name is a list, all drivers will be installed at the same time. Defaults to False.
+            max_workers (int)                   : Maximum number of drivers installed at the same time if parallel is True. Defaults to 4.
+            trust_manifest_for (float)          : Seconds during which driver checked to be up to date is trusted without any network calls and processes.
+                                                  Defaults to setting["Freshness"]["TrustManifestFor"] (0 - driver is checked every time).
 
         Returns:
             str
@@ -87,76 +111,101 @@ class DriverUpdater():
 
         """
 
+        #info messages are disabled only for current install and threads started by it, level of the logger is not changed
+        with log_info_messages(bool(kwargs.get('info_messages', True))):
+            driver_path = DriverUpdater.__install(driver_name, **kwargs)
+
+            #library update check runs in daemon thread which is killed when short script exits, so it gets a bit of time to report
+            DriverUpdater.__wait_library_update_check()
+
+            return driver_path
+
+    @staticmethod
+    def __install(driver_name, **kwargs):
+        """Private function for install or update Selenium driver binary, see install for all parameters"""
+
         #Initialize all variables
         message_run:str = ''
 
         driver_path = ''
 
-        _info.driver_name = driver_name
-
-        _info.info_messages = bool(kwargs.get('info_messages', True))
-
-        if _info.info_messages:
-            logger.setLevel(levels['info'])
-        else:
-            logger.setLevel(levels['error'])
+        info_messages = bool(kwargs.get('info_messages', True))
 
         path = kwargs.get('path')
         if not path:
             path = os.getcwd()
             logger.info('You have not specified the path - so used default folder path instead')
 
-        _info.path = str(os.path.abspath(path) + os.path.sep)
-
-        _info.filename = str(kwargs.get('filename', '')).replace('.', '') if type(kwargs.get('filename', '')) not in [list, dict, tuple] else kwargs.get('filename', '')
-
-        _info.enable_library_update_check = bool(kwargs.get('enable_library_update_check', True))
-        _info.upgrade = bool(kwargs.get('upgrade', False))
-        _info.chmod = bool(kwargs.get('chmod', True))
-        _info.check_driver_is_up_to_date = bool(kwargs.get('check_driver_is_up_to_date', True))
-
-        _info.version = str(kwargs.get('version', '')) if type(kwargs.get('version', '')) not in [list, dict, tuple] else kwargs.get('version', '')
-
-        _info.check_browser_is_up_to_date = bool(kwargs.get('check_browser_is_up_to_date', False))
-
-        _info.system_name = kwargs.get('system_name', '')
-
         try:
 
-            DriverUpdater.__check_enviroment_and_variables()
+            #values of kwargs are converted inside try, so wrong ones are reported like any other invalid parameter
+            info = _info(
+                driver_name=driver_name,
+                path=str(os.path.abspath(path) + os.path.sep),
+                filename=str(kwargs.get('filename', '')).replace('.', '') if type(kwargs.get('filename', '')) not in [list, dict, tuple] else kwargs.get('filename', ''),
+                version=str(kwargs.get('version', '')) if type(kwargs.get('version', '')) not in [list, dict, tuple] else kwargs.get('version', ''),
+                system_name=kwargs.get('system_name', ''),
+                upgrade=bool(kwargs.get('upgrade', False)),
+                chmod=bool(kwargs.get('chmod', True)),
+                check_driver_is_up_to_date=bool(kwargs.get('check_driver_is_up_to_date', True)),
+                info_messages=info_messages,
+                check_browser_is_up_to_date=bool(kwargs.get('check_browser_is_up_to_date', False)),
+                enable_library_update_check=bool(kwargs.get('enable_library_update_check', True)),
+                parallel=bool(kwargs.get('parallel', False)),
+                max_workers=int(kwargs.get('max_workers', 4)),
+                trust_manifest_for=float(kwargs.get('trust_manifest_for', setting["Freshness"]["TrustManifestFor"])),
+            )
 
-            if isinstance(_info.driver_name, str):
+            info = DriverUpdater.__check_enviroment_and_variables(info)
 
-                driver_path = DriverUpdater.__run_specific_driver()
+            if isinstance(info.driver_name, str):
 
-            elif isinstance(_info.driver_name, list):
+                driver_path = DriverUpdater.__run_specific_driver(info)
 
-                list_of_paths : list[str] = []
+            elif isinstance(info.driver_name, list):
 
-                for i, driver in enumerate(_info.driver_name):
+                list_of_parameters : list[dict] = []
 
-                    time.sleep(1) #small sleep
+                for i, driver in enumerate(info.driver_name):
 
                     try:
-                        filename_driver = str(_info.filename[i])
+                        filename_driver = str(info.filename[i])
                         filename_driver = filename_driver.replace('.', '')
                     except IndexError:
                         filename_driver = ''
 
                     try:
-                        system_name_driver = str(_info.system_name[i])
+                        system_name_driver = str(info.system_name[i])
                     except IndexError:
                         system_name_driver = ''
 
                     try:
-                        version_driver = str(_info.version[i])
+                        version_driver = str(info.version[i])
                     except IndexError:
                         version_driver = ''
 
-                    driver_path = DriverUpdater.__run_specific_driver(driver_name=driver, filename=filename_driver, system_name=system_name_driver, version=version_driver, index=i)
-                    list_of_paths.append(driver_path)
+                    list_of_parameters.append(dict(driver_name=driver, filename=filename_driver, system_name=system_name_driver, version=version_driver, index=i))
+
+                if info.parallel:
+
+                    driver_path = DriverUpdater.__run_drivers_in_parallel(info, list_of_parameters)
+
+                else:
 
-                    driver_path = list_of_paths
+                    list_of_paths : list[str] = []
+
+                    for parameters in list_of_parameters:
+
+                        time.sleep(1) #small sleep
+
+                        driver_path = DriverUpdater.__run_specific_driver(info, **parameters)
+                        list_of_paths.append(driver_path)
+
+                        driver_path = list_of_paths
+
+        except InstallCancelledException:
+
+            logger.warning(f'Install of {driver_name} was cancelled')
 
         except Exception:
 
@@ -166,60 +215,269 @@ class DriverUpdater():
         return driver_path
 
     @staticmethod
-    def __check_all_input_parameteres() -> None:
-        """Private function for checking all input parameters"""
+    async def install_async(driver_name, timeout : Optional[float] = None, **kwargs):
+        """Asynchronous version of install which can be awaited inside event loop
+
+        Versions of already installed drivers are probed on the event loop with get_driver_version_async and written to their manifests,
+        then install runs in worker thread, so event loop is not blocked while metadata is fetched, archives are downloaded and extracted.
+        If timeout is reached or the task is cancelled, install stops before the next request or downloaded chunk.
+        Every install has its own parameters and setting, so several installs can be awaited at the same time.
+
+        Args:
+            driver_name (Union[str, list[str]]) : Specified driver name/names which will be downloaded or updated. Like "DriverUpdater.chromedriver" or etc.
+            timeout (float)                     : Seconds to wait for the install, if it is reached asyncio.TimeoutError is raised. Defaults to None (no limit).
+            **kwargs                            : All other parameters of install.
+
+        Returns:
+            str
+
+            driver_path (str)       : Path where Selenium driver binary was downloaded or updated.
+
+        """
+
+        import asyncio
+
+        cancel_event = threading.Event()
+
+        def run_install():
+
+            Cancellation.set_event(cancel_event)
+
+            Cancellation.check()
+
+            return DriverUpdater.install(driver_name, **kwargs)
+
+        async def run():
+
+            #versions of existing drivers are probed here, so install finds them in manifests and does not start processes in worker thread
+            for driver_path in DriverUpdater.__get_driver_paths(driver_name, **kwargs):
+                await DriverUpdater.get_driver_version_async(driver_path)
+
+            return await asyncio.to_thread(run_install)
+
+        try:
+
+            return await asyncio.wait_for(run(), timeout)
+
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+
+            cancel_event.set()
+            raise
+
+    @staticmethod
+    async def get_driver_version_async(driver_path : str, timeout : float = 10) -> str:
+        """Gets version of installed driver from its install manifest or by running it without blocking event loop
+
+        Version got by running the driver is written to its manifest, so next install does not run it again.
+
+        Args:
+            driver_path (str)   : Path to driver binary.
+            timeout (float)     : Seconds to wait for "<driver> --version", if it is reached asyncio.TimeoutError is raised. Defaults to 10.
+
+        Returns:
+            str
+
+            driver_version (str)    : Version of the driver or empty string if driver does not exist or could not be started.
+
+        """
+
+        import asyncio
+
+        manifest = InstallManifest.load(driver_path)
+
+        if manifest.get('version'):
+            return str(manifest['version'])
+
+        if not Path(driver_path).exists():
+            return ''
+
+        try:
+            process = await asyncio.create_subprocess_exec(driver_path, '--version', stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL)
+        except OSError:
+            return '' #[Errno 86] Bad CPU type in executable:
+
+        try:
+
+            output = (await asyncio.wait_for(process.communicate(), timeout))[0]
+
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+
+            process.kill()
+            await process.wait()
+            raise
+
+        find_string = re.findall(setting["Program"]["wedriverVersionPattern"], output.decode('UTF-8'))
+        driver_version = find_string[0] if len(find_string) > 0 else ''
+
+        if driver_version:
+            InstallManifest.save(driver_path, driver_version)
+
+        return driver_version
+
+    @staticmethod
+    def __get_driver_paths(driver_name, **kwargs) -> list:
+        """Private function for getting paths of drivers which will be checked by install, without initializing drivers classes
+
+        Drivers for specific system_name are skipped, because they are always downloaded and can not be started on current OS.
+
+        Args:
+            driver_name (Union[str, list[str]]) : Specified driver name/names.
+            **kwargs                            : All other parameters of install.
+
+        Returns:
+            list[str]
+
+            driver_paths (list[str]) : Paths of drivers binaries.
+
+        """
+
+        driver_paths : list[str] = []
+
+        path = str(os.path.abspath(kwargs.get('path') or os.getcwd()) + os.path.sep)
+
+        driver_names = driver_name if isinstance(driver_name, list) else [driver_name]
+
+        for i, driver in enumerate(driver_names):
+
+            filename = kwargs.get('filename', '')
+            system_name = kwargs.get('system_name', '')
+
+            if isinstance(driver_name, list):
+                filename = filename[i] if isinstance(filename, (list, tuple)) and i < len(filename) else ''
+                system_name = system_name[i] if isinstance(system_name, (list, tuple)) and i < len(system_name) else ''
+
+            if not isinstance(driver, str) or driver not in ALL_DRIVERS or system_name:
+                continue
+
+            filename = str(filename).replace('.', '') or ('ms' + driver if driver == 'edgedriver' else driver)
+
+            driver_paths.append(path + filename + setting["Program"]["DriversFileFormat"])
+
+        return driver_paths
+
+    @staticmethod
+    def sync_mirror(driver_name, path : str, **kwargs) -> list:
+        """Function for filling local mirror with metadata and archives of specific drivers
+
+        Every driver is installed into temporary folder for every given version and system name,
+        while all urls fetched by the install are recorded to the mirror.
+
+        Args:
+            driver_name (Union[str, list[str]]) : Specified driver name/names which will be recorded to the mirror.
+            path (str)                          : Folder of the mirror.
+            version (Union[str, list[str]])     : Versions of every driver which will be recorded. Defaults to the latest version.
+            system_name (Union[str, list[str]]) : OSes of every driver which will be recorded. Defaults to current OS.
+            info_messages (bool)                : If false, it will disable all info messages. Defaults to True.
+
+        Returns:
+            list[str]
+
+            urls (list[str])    : Urls which were recorded to the mirror by this call.
+
+        """
+
+        driver_names = driver_name if isinstance(driver_name, list) else [driver_name]
+
+        versions = kwargs.get('version') or ['']
+        versions = versions if isinstance(versions, list) else [versions]
 
+        system_names = kwargs.get('system_name') or ['']
+        system_names = system_names if isinstance(system_names, list) else [system_names]
 
-        if not Path(_info.path).exists() and _info.path.endswith(os.path.sep):
-            message = f"The specified path does not exist current path is: {_info.path}, trying to create this directory"
+        tmp_folder = tempfile.mkdtemp()
+
+        try:
+
+            with Mirror.sync_to(path) as recorded:
+
+                for driver in driver_names:
+                    for version_driver in versions:
+                        for system_name_driver in system_names:
+
+                            driver_path = DriverUpdater.install(driver_name=driver, path=tmp_folder, version=version_driver, system_name=system_name_driver,
+                                                                upgrade=True, chmod=False, check_driver_is_up_to_date=False,
+                                                                enable_library_update_check=False, info_messages=kwargs.get('info_messages', True))
+
+                            if not driver_path:
+                                message = f'Could not sync {driver} version: "{version_driver}" system_name: "{system_name_driver}" to the mirror'
+                                logger.error(message)
+
+        finally:
+
+            shutil.rmtree(tmp_folder, ignore_errors=True)
+
+        return list(recorded)
+
+    @staticmethod
+    def __check_all_input_parameteres(info : _info) -> _info:
+        """Private function for checking all input parameters
+
+        Args:
+            info (_info)    : Parameters of current install.
+
+        Returns:
+            _info
+
+            info (_info)    : Checked parameters of current install with normalized filename.
+
+        """
+
+
+        if not Path(info.path).exists() and info.path.endswith(os.path.sep):
+            message = f"The specified path does not exist current path is: {info.path}, trying to create this directory"
             logger.error(message)
-            Path(_info.path).mkdir()
-            logger.info(f'Successfully created new directory at path: {_info.path}')
+            Path(info.path).mkdir()
+            logger.info(f'Successfully created new directory at path: {info.path}')
 
-        if not Path(_info.path).is_dir():
-            message = f"The specified path is not a directory current path is: {_info.path}"
+        if not Path(info.path).is_dir():
+            message = f"The specified path is not a directory current path is: {info.path}"
             raise NotADirectoryError(message)
 
-        if isinstance(_info.driver_name,(list, str)):
+        if isinstance(info.driver_name,(list, str)):
 
-            if _info.filename:
+            if info.filename:
 
-                if isinstance(_info.driver_name,list) and isinstance(_info.filename, str):
-                    _info.filename = [_info.filename]
+                if isinstance(info.driver_name,list) and isinstance(info.filename, str):
+                    info = replace(info, filename=[info.filename])
 
-                DriverUpdater.__check_parameter_type_is_valid(_info.filename, type(_info.driver_name), 'filename')
+                DriverUpdater.__check_parameter_type_is_valid(info.filename, type(info.driver_name), 'filename')
 
-            if _info.system_name:
+            if info.system_name:
 
-                DriverUpdater.__check_parameter_type_is_valid(_info.system_name, type(_info.driver_name), 'system_name')
+                DriverUpdater.__check_parameter_type_is_valid(info.system_name, type(info.driver_name), 'system_name')
 
-            if _info.version:
-                DriverUpdater.__check_parameter_type_is_valid(_info.version, type(_info.driver_name), 'version')
+            if info.version:
+                DriverUpdater.__check_parameter_type_is_valid(info.version, type(info.driver_name), 'version')
 
-            if isinstance(_info.driver_name, str):
+            if isinstance(info.driver_name, str):
 
-                if _info.system_name:
+                if info.system_name:
 
-                    DriverUpdater.__check_system_name_is_valid(system_name=_info.system_name)
+                    DriverUpdater.__check_system_name_is_valid(system_name=info.system_name)
 
-            elif isinstance(_info.driver_name, list):
+            elif isinstance(info.driver_name, list):
 
-                if _info.system_name:
+                if info.system_name:
 
-                    for os_system in _info.system_name:
+                    for os_system in info.system_name:
 
                         DriverUpdater.__check_system_name_is_valid(system_name=os_system)
 
         else:
 
-            message = f'The type of "driver_name" must be a list or str current type is: {type(_info.driver_name)}'
+            message = f'The type of "driver_name" must be a list or str current type is: {type(info.driver_name)}'
             raise ValueError(message)
 
+        return info
 
     @staticmethod
     def __check_library_is_up_to_date() -> None:
         """Private function for comparing latest version and current version of program"""
 
+        from packaging import version
+
+        from selenium_driver_updater.util.requests_getter import RequestsGetter
+
         url : str = str(setting["PyPi"]["urlProjectJson"])
 
         if 'b' not in str(setting["Program"]["version"]).lower():
@@ -254,6 +512,43 @@ class DriverUpdater():
             message = 'Github repository link: https://github.com/Svinokur/selenium_driver_updater'
             logger.info(message)
 
+    @staticmethod
+    def __start_library_update_check() -> None:
+        """Private function for checking library update in background thread, so install does not wait for PyPI
+
+        Check is started only once per process and its result is reported to the log when PyPI answers.
+        Answer of PyPI is kept in metadata cache (see setting["MetadataCache"]["TTL"]), so repeated runs during ttl do not use network at all.
+        """
+
+        with DriverUpdater._library_check_lock:
+
+            if DriverUpdater._library_check_thread is not None:
+                return
+
+            thread = threading.Thread(target=contextvars.copy_context().run, args=(DriverUpdater.__run_library_update_check,),
+                                        name='selenium-driver-updater-library-check', daemon=True)
+            DriverUpdater._library_check_thread = thread
+
+        thread.start()
+
+    @staticmethod
+    def __wait_library_update_check() -> None:
+        """Private function for waiting the library update check at most setting["PyPi"]["WaitAfterInstall"] seconds"""
+
+        thread = DriverUpdater._library_check_thread
+
+        if thread is not None and thread.is_alive():
+            thread.join(float(setting["PyPi"]["WaitAfterInstall"]))
+
+    @staticmethod
+    def __run_library_update_check() -> None:
+        """Private function for running library update check in background thread without breaking the install"""
+
+        try:
+            DriverUpdater.__check_library_is_up_to_date()
+        except Exception as error:
+            logger.debug(f'Could not check for the library update: {error}')
+
     @staticmethod
     def __check_is_python_version_compatible_for_library() -> None:
         """Private function for checking if python version if compatible with python version 3+"""
@@ -270,22 +565,24 @@ class DriverUpdater():
             logger.warning(message)
 
     @staticmethod
-    def __check_enviroment_and_variables() -> None:
+    def __check_enviroment_and_variables(info : _info) -> _info:
         """Private function for checking all input parameters and enviroment"""
 
         DriverUpdater.__check_is_python_version_compatible_for_library()
 
-        if _info.enable_library_update_check:
+        #with freshness policy library check is started only if some driver really has to be checked
+        if info.enable_library_update_check and info.trust_manifest_for <= 0:
 
-            DriverUpdater.__check_library_is_up_to_date()
+            DriverUpdater.__start_library_update_check()
 
-        DriverUpdater.__check_all_input_parameteres()
+        return DriverUpdater.__check_all_input_parameteres(info)
 
     @staticmethod
-    def __run_specific_driver(**kwargs) -> str:
+    def __run_specific_driver(info : _info, **kwargs) -> str:
         """Private function for run download or update for specific driver
 
         Args:
+            info (_info)                        : Parameters of current install.
             driver_name (Union[str, list[str]]) : Specified driver name/names which will be downloaded or updated. Like "DriverUpdater.chromedriver" or etc.
             filename (str)                      : Specific name for chromedriver. If given, it will replace name for chromedriver. Defaults to empty string.
             version (str)                       : Specific version for chromedriver. If given, it will downloads given version. Defaults to empty string.
@@ -299,40 +596,170 @@ class DriverUpdater():
         """
 
         driver_path: str = ''
-        index:str = ''
 
-        driver_name = kwargs.get('driver_name', _info.driver_name)
-        filename = kwargs.get('filename', _info.filename)
-        version = kwargs.get('version', _info.version)
-        system_name = kwargs.get('system_name', _info.system_name)
+        driver_name = kwargs.get('driver_name', info.driver_name)
+        filename = kwargs.get('filename', info.filename)
+        version = kwargs.get('version', info.version)
+        system_name = kwargs.get('system_name', info.system_name)
+
+        #every driver gets its own copy of setting, so file format is passed to it instead of changing shared setting
+        drivers_file_format = None
+        if system_name:
+            drivers_file_format = '.exe' if 'win' in system_name or 'arm' in system_name else ''
 
-        parametres = dict(  driver_name=driver_name, path=_info.path, upgrade=_info.upgrade, chmod=_info.chmod,
-                            check_driver_is_up_to_date=_info.check_driver_is_up_to_date,
+        parametres = dict(  driver_name=driver_name, path=info.path, upgrade=info.upgrade, chmod=info.chmod,
+                            check_driver_is_up_to_date=info.check_driver_is_up_to_date,
                             filename=filename, version=version,
-                            check_browser_is_up_to_date=_info.check_browser_is_up_to_date,
-                            info_messages=_info.info_messages,
-                            system_name=system_name )
-
-        if _info.system_name:
-            index = kwargs.get('index', None)
-            if index is not None:
-                setting['Program']['DriversFileFormat'] = '.exe' if 'win' in _info.system_name[index] or 'arm' in _info.system_name[index] else ''
-            else:
-                setting['Program']['DriversFileFormat'] = '.exe' if 'win' in _info.system_name or 'arm' in _info.system_name else ''
-        try:
-            driver = ALL_DRIVERS[driver_name](**parametres)
-        except KeyError:
-            index = kwargs.get('index', None)
-            if index:
-                message = f'Unknown driver name at index: {index} was specified current driver_name is: {driver_name}'
-            else:
-                message = f'Unknown driver name was specified current driver_name is: {driver_name}'
-            raise NameError(message)
+                            check_browser_is_up_to_date=info.check_browser_is_up_to_date,
+                            info_messages=info.info_messages,
+                            system_name=system_name,
+                            drivers_file_format=drivers_file_format )
+
+        #every upstream answer is fetched only once during the install of the driver
+        with ResolutionContext() as context:
+
+            try:
+                driver = ALL_DRIVERS[driver_name](**parametres)
+            except KeyError:
+                index = kwargs.get('index', None)
+                if index:
+                    message = f'Unknown driver name at index: {index} was specified current driver_name is: {driver_name}'
+                else:
+                    message = f'Unknown driver name was specified current driver_name is: {driver_name}'
+                raise NameError(message)
+
+            fresh_version = DriverUpdater.__get_fresh_version(info, driver)
+
+            if fresh_version:
+
+                logger.info(f'{driver_name} version: {fresh_version} was checked less than {info.trust_manifest_for:.0f} seconds ago, trusting it at path: {driver.driver_path}')
+                return driver.driver_path
 
-        driver_path = driver.main()
+            if info.enable_library_update_check:
+                DriverUpdater.__start_library_update_check()
+
+            driver_path = DriverUpdater.__run_driver_with_lock(driver)
+
+            if driver_path and isinstance(driver_path, str):
+                InstallManifest.mark_checked(driver_path)
+
+        logger.info(f'Install of {driver_name} made {context.network_calls} network calls')
 
         return driver_path
 
+    @staticmethod
+    def __get_fresh_version(info : _info, driver : Any) -> str:
+        """Private function for getting version of driver which can be trusted without checking it, empty string if it must be checked
+
+        Driver is trusted if it was checked to be up to date not earlier than trust_manifest_for seconds ago,
+        binary was not changed since then and it has needed version. Only manifest is read, so no network calls and processes are made.
+        Installs which always download the driver (upgrade, disabled up to date check or specific system_name) are never trusted.
+
+        Args:
+            info (_info)    : Parameters of current install.
+            driver (Any)    : Initialized class of specific driver.
+
+        Returns:
+            str
+
+            driver_version (str)    : Trusted version of the driver or empty string.
+
+        """
+
+        if info.trust_manifest_for <= 0 or info.check_browser_is_up_to_date or Mirror.is_recording():
+            return ''
+
+        if info.upgrade or not info.check_driver_is_up_to_date or getattr(driver, 'system_name', ''):
+            return ''
+
+        driver_version = InstallManifest.get_fresh_version(driver.driver_path, info.trust_manifest_for)
+
+        if driver.version and driver.version != driver_version:
+            return ''
+
+        return driver_version
+
+    @staticmethod
+    def __run_driver_with_lock(driver : Any) -> str:
+        """Private function for running driver while holding lock of its path, so only one process or thread installs it at once
+
+        If the driver was installed by someone else while we were waiting for the lock, that result is reused instead of downloading it again.
+
+        Args:
+            driver (Any)    : Initialized class of specific driver.
+
+        Returns:
+            str
+
+            driver_path (str) : Path where specific driver located
+
+        """
+
+        if not driver.lock_path:
+            return driver.main()
+
+        signature = DriverUpdater.__get_file_signature(driver.driver_path)
+
+        with FileLock(driver.lock_path) as lock:
+
+            if lock.waited and signature != DriverUpdater.__get_file_signature(driver.driver_path) and Path(driver.driver_path).exists():
+
+                if not driver.version or driver._get_current_version_driver() == driver.version:
+
+                    logger.info(f'{driver.driver_name} was installed by another install while waiting for lock, reusing it at path: {driver.driver_path}')
+                    return driver.driver_path
+
+            return driver.main()
+
+    @staticmethod
+    def __get_file_signature(file_path : str) -> tuple:
+        """Private function for getting signature of file which changes whenever file is replaced or modified"""
+
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            return ()
+
+        return (file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns)
+
+    @staticmethod
+    def __run_drivers_in_parallel(info : _info, list_of_parameters : list) -> list:
+        """Private function for run download or update for several drivers at the same time
+
+        Args:
+            info (_info)                    : Parameters of current install.
+            list_of_parameters (list[dict]) : Parameters of every driver which will be passed to __run_specific_driver.
+
+        Returns:
+            list[str]
+
+            list_of_paths (list[str]) : Paths where drivers located in the same order as they were specified.
+                                        If some driver was failed, its path will be empty string.
+
+        """
+
+        list_of_paths : list[str] = []
+
+        max_workers = max(1, min(info.max_workers, len(list_of_parameters)))
+
+        logger.info(f'Started parallel install of {len(list_of_parameters)} drivers with max_workers: {max_workers}')
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+            futures = [executor.submit(contextvars.copy_context().run, DriverUpdater.__run_specific_driver, info, **parameters) for parameters in list_of_parameters]
+
+            for parameters, future in zip(list_of_parameters, futures):
+
+                try:
+                    list_of_paths.append(future.result())
+                except Exception:
+                    message = (f'error while installing {parameters["driver_name"]} at index: {parameters["index"]} '
+                                f'{str(traceback.format_exc())}')
+                    logger.error(message)
+                    list_of_paths.append('')
+
+        return list_of_paths
+
     @staticmethod
     def __check_system_name_is_valid(system_name) -> None:
         """Private function for checking if specified system_name is exists and valid"""
@@ -5,14 +5,20 @@ import os
 import stat
 import subprocess
 import re
-import wget
+import copy
 
 #Local imports
 from selenium_driver_updater._setting import setting
 
 from selenium_driver_updater.util.extractor import Extractor
 from selenium_driver_updater.util.requests_getter import RequestsGetter
+from selenium_driver_updater.util.downloader import Downloader
+from selenium_driver_updater.util.artifact_store import ArtifactStore
+from selenium_driver_updater.util.mirror import Mirror
+from selenium_driver_updater.util.install_manifest import InstallManifest
+from selenium_driver_updater.util.version_catalog import VersionCatalog
 from selenium_driver_updater.util.github_viewer import GithubViewer
+from selenium_driver_updater.util.bitbucket_catalog import BitbucketCatalog
 from selenium_driver_updater.util.logger import logger
 from selenium_driver_updater.util.exceptions import DriverVersionInvalidException
 
@@ -30,7 +36,12 @@ class DriverBase():
         #Default variables
         self.filename = ''
 
-        self.setting : Any = setting
+        #every driver works with its own copy of setting, so drivers of different installs never change each other
+        self.setting : Any = copy.deepcopy(setting)
+
+        drivers_file_format = kwargs.get('drivers_file_format')
+        if drivers_file_format is not None:
+            self.setting['Program']['DriversFileFormat'] = str(drivers_file_format)
 
         self.path : str = str(kwargs.get('path'))
 
@@ -47,6 +58,13 @@ class DriverBase():
         self.extractor = Extractor
         self.requests_getter = RequestsGetter
         self.github_viewer = GithubViewer
+        self.downloader = Downloader
+        self.artifact_store = ArtifactStore
+        self.version_catalog = VersionCatalog
+        self.bitbucket_catalog = BitbucketCatalog
+        self.install_manifest = InstallManifest
+
+        self.installed_url = ''
 
         specific_filename = str(kwargs.get('filename'))
         if specific_filename:
@@ -59,6 +77,8 @@ class DriverBase():
 
         self.driver_path = self.path + self.setting[self.driver_name_setting]['LastReleasePlatform'] if not self.filename else self.path + self.filename
 
+        self.lock_path = os.path.join(os.path.dirname(self.driver_path), '.' + os.path.basename(self.driver_path) + '.lock')
+
         self.repo_name = str(kwargs.get('repo_name'))
 
     def _get_latest_version_driver(self, no_messages : bool = False) -> str:
@@ -123,8 +143,19 @@ class DriverBase():
             logger.info(f'Deleted existing {self.driver_name} {self.driver_name}_path: {self.driver_path}')
             Path(self.driver_path).unlink()
 
+        self.install_manifest.delete(self.driver_path)
+
+    def _save_install_manifest(self) -> None:
+        """Writes manifest of just installed driver, so its version can be checked without running it"""
+
+        find_string = re.findall(self.setting["Program"]["wedriverVersionPattern"], self.installed_url)
+        driver_version = find_string[0].strip('.') if len(find_string) > 0 else ''
+
+        if driver_version and Path(self.driver_path).exists():
+            self.install_manifest.save(self.driver_path, driver_version, self.installed_url)
+
     def _get_current_version_driver(self) -> str:
-        """Gets current driver version via command in terminal
+        """Gets current driver version from its install manifest or via command in terminal if binary was changed since install
 
         Returns:
             str
@@ -140,6 +171,15 @@ class DriverBase():
         driver_version : str = ''
         driver_version_terminal : str = ''
 
+        manifest = self.install_manifest.load(self.driver_path)
+
+        if manifest.get('version'):
+
+            driver_version = str(manifest['version'])
+            logger.info(f'Current version of {self.driver_name}: {driver_version}')
+
+            return driver_version
+
         try:
 
             if Path(self.driver_path).exists():
@@ -152,6 +192,9 @@ class DriverBase():
 
                 logger.info(f'Current version of {self.driver_name}: {driver_version}')
 
+                if driver_version:
+                    self.install_manifest.save(self.driver_path, driver_version)
+
         except OSError:
             pass #[Errno 86] Bad CPU type in executable:
 
@@ -228,26 +271,119 @@ class DriverBase():
         driver_version = find_string[0] if len(find_string) > 0 else ''
 
         if 'chromedriver' in archive_name:
-            url_test_valid = self.setting[self.driver_name_setting]["LinkCheckVersionIsValid"]
             archive_platform = archive_name.split('-', maxsplit=1)[1].split('.')[0]
 
-            version_valid : str = f"{driver_version}/{archive_platform}/{archive_name}"
-        else:
-            url_test_valid = self.setting[self.driver_name_setting]["LinkCheckVersionIsValid"].format(driver_version)
-            version_valid : str = f"{driver_version}/{archive_name}"
+            if not driver_version or not self.version_catalog.is_available(driver_version, archive_platform):
+                message = ('Wrong version or system_name was specified. '
+                            f'archive_platform: {archive_platform} driver_version: {driver_version} url: {url}')
+                raise DriverVersionInvalidException(message)
+
+            return
+
+        url_test_valid = self.setting[self.driver_name_setting]["LinkCheckVersionIsValid"].format(driver_version)
+        version_valid : str = f"{driver_version}/{archive_name}"
 
         json_data = self.requests_getter.get_result_by_request(url=url_test_valid)
 
         if not version_valid in json_data or not driver_version:
-            message = ('Wrong version or system_name was specified.'
+            message = ('Wrong version or system_name was specified. '
                         f'version_valid: {version_valid} driver_version: {driver_version} url: {url}')
             raise DriverVersionInvalidException(message)
         
-    def _custom_bar(self, current, total, width=80):
-        return wget.bar_adaptive(round(current/1024/1024, 2), round(total/1024/1024, 2), width) + ' MB' + " "
-    
-    def _wget_download_driver(self, url, path):
-        bar = self._custom_bar if self.info_messages else None
+    def _download_archive(self, url : str, path : str) -> str:
+        """Downloads archive of specific driver or takes it from artifact store if it was downloaded before
+
+        Args:
+            url (str)   : Url of the archive.
+            path (str)  : Path where archive will be located.
+
+        Returns:
+            str
+
+            archive_path (str) : Path to downloaded archive.
+
+        """
+
+        self.installed_url = url
+
+        key = self._get_artifact_key(url) if self.artifact_store.is_enabled() else ''
+
+        if key and self.artifact_store.get(key, path):
+
+            if Mirror.is_recording():
+                Mirror.record_file(url, path)
+
+            return path
+
+        progress = self.downloader.console_progress if self.info_messages else None
+
+        archive_path = self.downloader.download(url=url, out_path=path, progress=progress)
+
+        if key:
+            self.artifact_store.put(key, archive_path)
 
-        archive_path = wget.download(url=url, out=path, bar=bar)
         return archive_path
+
+    def _stream_extract_archive(self, url : str) -> bool:
+        """Extracts driver from archive while it is being downloaded, archive itself is never saved to disk
+
+        Used only if setting["Downloader"]["StreamExtract"] is enabled, mirror is not being synced
+        and archive is not in artifact store yet, otherwise archive must be downloaded as usual.
+
+        Args:
+            url (str)   : Url of the archive.
+
+        Returns:
+            bool
+
+            is_extracted (bool) : True if driver was extracted to driver_path.
+
+        """
+
+        archive_name = url.split("/")[-1]
+
+        if not self.setting["Downloader"]["StreamExtract"] or Mirror.is_recording() or not self.extractor.can_extract_from_stream(archive_name):
+            return False
+
+        key = self._get_artifact_key(url) if self.artifact_store.is_enabled() else ''
+
+        if key and self.artifact_store.has(key):
+            return False
+
+        self.installed_url = url
+
+        filename = str(self.setting[self.driver_name_setting]['LastReleasePlatform'])
+        progress = self.downloader.console_progress if self.info_messages else None
+
+        logger.info(f'Extracting {self.driver_name} from archive: {archive_name} while it is being downloaded')
+
+        with self.downloader.open_stream(url=url, progress=progress) as stream:
+
+            self.extractor.extract_driver_from_stream(stream=stream, archive_name=archive_name, out_path=self.path,
+                                                    filename=filename, filename_replace=self.filename,
+                                                    spool_max_size=int(self.setting["Downloader"]["SpoolMaxSize"]))
+
+        return True
+
+    def _get_artifact_key(self, url : str) -> str:
+        """Gets key of the archive in artifact store
+
+        Args:
+            url (str)   : Url of the archive.
+
+        Returns:
+            str
+
+            key (str) : Key like "driver_name/version/archive_name" or empty string if version is not in url.
+
+        """
+
+        archive_name = url.split("/")[-1]
+
+        find_string = re.findall(self.setting["Program"]["wedriverVersionPattern"], url)
+        driver_version = find_string[0] if len(find_string) > 0 else ''
+
+        if not driver_version or not archive_name:
+            return ''
+
+        return f'{self.driver_name}/{driver_version}/{archive_name}'
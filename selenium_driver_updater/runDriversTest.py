@@ -26,6 +26,20 @@ from selenium_driver_updater.test import edgeBrowserTest
 from selenium_driver_updater.test import githubViewerTest
 from selenium_driver_updater.test import extractorTest
 from selenium_driver_updater.test import requestsGetterTest
+from selenium_driver_updater.test import metadataCacheTest
+from selenium_driver_updater.test import downloaderTest
+from selenium_driver_updater.test import artifactStoreTest
+from selenium_driver_updater.test import versionCatalogTest
+from selenium_driver_updater.test import mirrorTest
+from selenium_driver_updater.test import fileLockTest
+from selenium_driver_updater.test import installManifestTest
+from selenium_driver_updater.test import resolutionContextTest
+from selenium_driver_updater.test import installAsyncTest
+from selenium_driver_updater.test import importTimeTest
+from selenium_driver_updater.test import browserMetadataTest
+from selenium_driver_updater.test import releaseProberTest
+from selenium_driver_updater.test import bitbucketCatalogTest
+from selenium_driver_updater.test import githubRateLimiterTest
 
 from selenium_driver_updater.test import phantomJSTest
 
@@ -81,6 +95,20 @@ try:
     testSuite.addTest(unittest.makeSuite(githubViewerTest.testGithubViewer))
     testSuite.addTest(unittest.makeSuite(extractorTest.testExtractor))
     testSuite.addTest(unittest.makeSuite(requestsGetterTest.testRequestsGetter))
+    testSuite.addTest(unittest.makeSuite(metadataCacheTest.testMetadataCache))
+    testSuite.addTest(unittest.makeSuite(downloaderTest.testDownloader))
+    testSuite.addTest(unittest.makeSuite(artifactStoreTest.testArtifactStore))
+    testSuite.addTest(unittest.makeSuite(versionCatalogTest.testVersionCatalog))
+    testSuite.addTest(unittest.makeSuite(mirrorTest.testMirror))
+    testSuite.addTest(unittest.makeSuite(fileLockTest.testFileLock))
+    testSuite.addTest(unittest.makeSuite(installManifestTest.testInstallManifest))
+    testSuite.addTest(unittest.makeSuite(resolutionContextTest.testResolutionContext))
+    testSuite.addTest(unittest.makeSuite(installAsyncTest.testInstallAsync))
+    testSuite.addTest(unittest.makeSuite(importTimeTest.testImportTime))
+    testSuite.addTest(unittest.makeSuite(browserMetadataTest.testBrowserMetadata))
+    testSuite.addTest(unittest.makeSuite(releaseProberTest.testReleaseProber))
+    testSuite.addTest(unittest.makeSuite(bitbucketCatalogTest.testBitbucketCatalog))
+    testSuite.addTest(unittest.makeSuite(githubRateLimiterTest.testGithubRateLimiter))
 
     testSuite.addTest(unittest.makeSuite(exceptionsTest.testExceptions))
 
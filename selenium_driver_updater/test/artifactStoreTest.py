@@ -0,0 +1,104 @@
+#Standart library imports
+import unittest
+import time
+import logging
+import tempfile
+import shutil
+import copy
+from pathlib import Path
+
+import sys
+import os.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir)))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir, os.path.pardir)))
+
+# Local imports
+from selenium_driver_updater.util.artifact_store import ArtifactStore
+from selenium_driver_updater._setting import setting
+
+logging.basicConfig(level=logging.INFO)
+
+# pylint: disable=missing-function-docstring
+class testArtifactStore(unittest.TestCase):
+    """Class for unit-testing ArtifactStore class
+
+    Attributes:
+        artifact_store              : Initialize class ArtifactStore
+        store_path (str)            : Temporary folder of the store
+        out_path (str)              : Temporary folder for archives
+        startTime (float)           : Time of starting unit-tests
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.artifact_store = ArtifactStore
+        cls.old_store_setting = copy.deepcopy(setting["ArtifactStore"])
+
+    @classmethod
+    def tearDownClass(cls):
+        setting["ArtifactStore"].update(cls.old_store_setting)
+
+    def setUp(self):
+        self.store_path = tempfile.mkdtemp() + os.path.sep
+        self.out_path = tempfile.mkdtemp() + os.path.sep
+        setting["ArtifactStore"]["Path"] = self.store_path
+        setting["ArtifactStore"]["MaxSize"] = 1024 * 1024
+
+        self.start_time : float = time.time()
+
+    def tearDown(self):
+        shutil.rmtree(self.store_path, ignore_errors=True)
+        shutil.rmtree(self.out_path, ignore_errors=True)
+        end_time = time.time() - self.start_time
+        print("%.3f" % end_time)
+
+    #@unittest.skip('Temporary not needed')
+    def test01_check_get_missing_archive(self):
+        self.assertFalse(self.artifact_store.get('chromedriver/1.0/chromedriver-linux64.zip', self.out_path + 'chromedriver-linux64.zip'))
+        self.assertFalse(Path(self.out_path + 'chromedriver-linux64.zip').exists())
+
+    #@unittest.skip('Temporary not needed')
+    def test02_check_put_and_get_archive(self):
+        key = 'chromedriver/1.0/chromedriver-linux64.zip'
+        archive_path = self.out_path + 'chromedriver-linux64.zip'
+        Path(archive_path).write_bytes(b'archive')
+
+        sha256 = self.artifact_store.put(key, archive_path)
+        self.assertEqual(sha256, self.artifact_store.get_sha256(archive_path))
+        Path(archive_path).unlink()
+
+        self.assertTrue(self.artifact_store.get(key, archive_path))
+        self.assertEqual(Path(archive_path).read_bytes(), b'archive')
+
+    #@unittest.skip('Temporary not needed')
+    def test03_check_evict_least_recently_used(self):
+        for i in range(3):
+            archive_path = self.out_path + f'archive{i}.zip'
+            Path(archive_path).write_bytes(os.urandom(1024 * 400))
+            self.artifact_store.put(f'geckodriver/0.{i}/archive{i}.zip', archive_path)
+            time.sleep(0.01)
+
+        self.assertFalse(self.artifact_store.has('geckodriver/0.0/archive0.zip'))
+        self.assertFalse(self.artifact_store.get('geckodriver/0.0/archive0.zip', self.out_path + 'out0.zip'))
+        self.assertTrue(self.artifact_store.get('geckodriver/0.1/archive1.zip', self.out_path + 'out1.zip'))
+        self.assertTrue(self.artifact_store.get('geckodriver/0.2/archive2.zip', self.out_path + 'out2.zip'))
+
+    #@unittest.skip('Temporary not needed')
+    def test04_check_corrupted_archive_is_not_used(self):
+        key = 'chromedriver/1.0/chromedriver-linux64.zip'
+        archive_path = self.out_path + 'chromedriver-linux64.zip'
+        Path(archive_path).write_bytes(b'archive')
+
+        sha256 = self.artifact_store.put(key, archive_path)
+        Path(archive_path).unlink()
+
+        object_path = self.artifact_store._get_object_path(sha256)
+        Path(object_path).write_bytes(b'ARCHIVE')
+
+        self.assertFalse(self.artifact_store.get(key, archive_path))
+        self.assertFalse(Path(archive_path).exists())
+        self.assertFalse(Path(object_path).exists())
+        self.assertFalse(self.artifact_store.has(key))
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2, failfast=True, exit=False)
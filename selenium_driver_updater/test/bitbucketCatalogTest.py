@@ -0,0 +1,136 @@
+#pylint: disable=protected-access
+#Standart library imports
+import unittest
+import time
+import logging
+import tempfile
+import shutil
+import copy
+import json
+from urllib.parse import urlparse, parse_qs
+
+import sys
+import os.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir)))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir, os.path.pardir)))
+
+# Local imports
+from selenium_driver_updater.test.localServer import LocalServer, QuietBaseHandler
+from selenium_driver_updater.util.bitbucket_catalog import BitbucketCatalog
+from selenium_driver_updater.util.resolution_context import ResolutionContext
+from selenium_driver_updater.util.exceptions import DriverVersionInvalidException
+from selenium_driver_updater._phantomJS import PhantomJS
+from selenium_driver_updater._setting import setting
+
+logging.basicConfig(level=logging.INFO)
+
+VERSIONS = ['1.9.7', '1.9.8', '2.1.1', '1.9.2', '1.9.0', '1.8.2', '1.8.1']
+SYSTEMS = ['linux-x86_64.tar.bz2', 'linux-i686.tar.bz2', 'macosx.zip', 'windows.zip']
+
+NAMES = [f'phantomjs-{version}-{system}' for version in VERSIONS for system in SYSTEMS] + ['phantomjs-2.5.0-beta-mac.zip']
+
+class _DownloadsHandler(QuietBaseHandler):
+    """Handler that serves paginated downloads like bitbucket api"""
+
+    def do_GET(self): # pylint: disable=invalid-name
+        time.sleep(0.05)
+
+        query = parse_qs(urlparse(self.path).query)
+        page = int(query.get('page', ['1'])[0])
+        page_length = min(int(query.get('pagelen', ['10'])[0]), 10)
+
+        names = NAMES[(page - 1) * page_length:page * page_length]
+        json_data = dict(pagelen=page_length, size=len(NAMES), page=page,
+                        values=[dict(name=name, size=1, links=dict(self=dict(href=f'http://downloads/{name}'))) for name in names])
+
+        body = json.dumps(json_data).encode('utf-8')
+
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+# pylint: disable=missing-function-docstring
+class testBitbucketCatalog(unittest.TestCase):
+    """Class for unit-testing BitbucketCatalog class
+
+    Attributes:
+        bitbucket_catalog           : Initialize class BitbucketCatalog
+        url (str)                   : Url of fake bitbucket downloads api served by local http server
+        startTime (float)           : Time of starting unit-tests
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.bitbucket_catalog = BitbucketCatalog
+
+        cls.server = LocalServer.start(_DownloadsHandler)
+        cls.url = LocalServer.get_url(cls.server) + '2.0/repositories/ariya/phantomjs/downloads/'
+
+        cls.cache_path = tempfile.mkdtemp() + os.path.sep
+        cls.old_cache_setting = copy.deepcopy(setting["MetadataCache"])
+        setting["MetadataCache"]["Path"] = cls.cache_path
+        setting["MetadataCache"]["Enabled"] = True
+        setting["MetadataCache"]["TTL"]['127.0.0.1'] = 3600
+
+    @classmethod
+    def tearDownClass(cls):
+        LocalServer.stop(cls.server)
+        setting["MetadataCache"].clear()
+        setting["MetadataCache"].update(cls.old_cache_setting)
+        shutil.rmtree(cls.cache_path, ignore_errors=True)
+
+    def setUp(self):
+        BitbucketCatalog._catalogs.clear()
+        shutil.rmtree(self.cache_path, ignore_errors=True)
+        self.start_time : float = time.time()
+
+    def tearDown(self):
+        end_time = time.time() - self.start_time
+        print("%.3f" % end_time)
+
+    #@unittest.skip('Temporary not needed')
+    def test01_check_get_catalog_fetches_all_pages(self):
+        with ResolutionContext() as context:
+            catalog = self.bitbucket_catalog.get_catalog(self.url)
+
+        self.assertEqual(context.network_calls, 3)
+        self.assertEqual(sorted(catalog['assets']), sorted(NAMES))
+        self.assertEqual(catalog['assets']['phantomjs-2.1.1-macosx.zip']['href'], 'http://downloads/phantomjs-2.1.1-macosx.zip')
+        self.assertEqual(catalog['versions'], ['1.8.1', '1.8.2', '1.9.0', '1.9.2', '1.9.7', '1.9.8', '2.1.1'])
+
+    #@unittest.skip('Temporary not needed')
+    def test02_check_catalog_is_taken_from_metadata_cache(self):
+        self.bitbucket_catalog.get_catalog(self.url)
+
+        BitbucketCatalog._catalogs.clear()
+
+        with ResolutionContext() as context:
+            self.assertTrue(self.bitbucket_catalog.is_available(self.url, 'phantomjs-1.9.8-windows.zip'))
+            self.assertEqual(self.bitbucket_catalog.get_versions(self.url)[-2], '1.9.8')
+
+        self.assertEqual(context.network_calls, 0)
+
+    #@unittest.skip('Temporary not needed')
+    def test03_check_is_available_failure_fetches_catalog_again(self):
+        self.bitbucket_catalog.get_catalog(self.url)
+
+        with ResolutionContext() as context:
+            self.assertFalse(self.bitbucket_catalog.is_available(self.url, 'phantomjs-9.9.9-windows.zip'))
+
+        self.assertEqual(context.network_calls, 3)
+
+    #@unittest.skip('Temporary not needed')
+    def test04_check_phantomjs_uses_catalog(self):
+        phantomjs = PhantomJS(driver_name='phantomjs', path=self.cache_path, filename='', version='', system_name='')
+        phantomjs.setting["PhantomJS"]["LinkAllReleases"] = self.url
+
+        self.assertEqual(phantomjs._get_latest_previous_version_phantomjs_via_requests(), '1.9.8')
+
+        phantomjs._check_if_version_is_valid(url=self.url + 'phantomjs-2.1.1-linux-x86_64.tar.bz2')
+
+        with self.assertRaises(DriverVersionInvalidException):
+            phantomjs._check_if_version_is_valid(url=self.url + 'phantomjs-2.1.1-linux-aarch64.tar.bz2')
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2, failfast=True, exit=False)
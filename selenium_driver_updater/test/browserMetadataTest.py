@@ -0,0 +1,121 @@
+#Standart library imports
+import unittest
+import time
+import logging
+import tempfile
+import shutil
+import plistlib
+from pathlib import Path
+
+import sys
+import os.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir)))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir, os.path.pardir)))
+
+# Local imports
+from selenium_driver_updater.util.browser_metadata import BrowserMetadata
+from selenium_driver_updater._setting import setting
+from selenium_driver_updater.browsers._chromeBrowser import ChromeBrowser
+
+logging.basicConfig(level=logging.INFO)
+
+# pylint: disable=missing-function-docstring
+class testBrowserMetadata(unittest.TestCase):
+    """Class for unit-testing BrowserMetadata class
+
+    Attributes:
+        browser_metadata            : Initialize class BrowserMetadata
+        out_path (str)              : Temporary folder with metadata files
+        startTime (float)           : Time of starting unit-tests
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.browser_metadata = BrowserMetadata
+
+    def setUp(self):
+        self.out_path = tempfile.mkdtemp() + os.path.sep
+        self.start_time : float = time.time()
+
+    def tearDown(self):
+        shutil.rmtree(self.out_path, ignore_errors=True)
+        end_time = time.time() - self.start_time
+        print("%.3f" % end_time)
+
+    #@unittest.skip('Temporary not needed')
+    def test01_check_get_version_from_all_file_types(self):
+        plist_path = self.out_path + 'Info.plist'
+        with open(plist_path, 'wb') as file:
+            plistlib.dump({'CFBundleShortVersionString': '120.0.6099.109'}, file)
+
+        ini_path = self.out_path + 'application.ini'
+        Path(ini_path).write_text('[App]\nVendor=Mozilla\nName=Firefox\nVersion=121.0.1\nBuildID=20231231\n', encoding='utf-8')
+
+        last_version_path = self.out_path + 'Last Version'
+        Path(last_version_path).write_text('119.0.2151.97', encoding='utf-8')
+
+        self.assertEqual(self.browser_metadata.get_version([plist_path]), '120.0.6099.109')
+        self.assertEqual(self.browser_metadata.get_version([ini_path]), '121.0.1')
+        self.assertEqual(self.browser_metadata.get_version([last_version_path]), '119.0.2151.97')
+
+    #@unittest.skip('Temporary not needed')
+    def test02_check_get_version_skips_missing_and_broken_files(self):
+        broken_plist_path = self.out_path + 'Info.plist'
+        Path(broken_plist_path).write_bytes(b'not a plist')
+
+        last_version_path = self.out_path + 'Last Version'
+        Path(last_version_path).write_text('120.0.6099.109\n', encoding='utf-8')
+
+        self.assertEqual(self.browser_metadata.get_version([self.out_path + 'missing.ini', broken_plist_path, last_version_path]), '120.0.6099.109')
+        self.assertEqual(self.browser_metadata.get_version([self.out_path + 'missing.ini']), '')
+
+    #@unittest.skip('Temporary not needed')
+    def test03_check_version_is_read_again_after_file_was_changed(self):
+        last_version_path = self.out_path + 'Last Version'
+        Path(last_version_path).write_text('120.0.6099.109', encoding='utf-8')
+
+        self.assertEqual(self.browser_metadata.get_version([last_version_path]), '120.0.6099.109')
+
+        Path(last_version_path).write_text('121.0.6167.85', encoding='utf-8')
+        os.utime(last_version_path, ns=(time.time_ns(), time.time_ns() + 10**9))
+
+        self.assertEqual(self.browser_metadata.get_version([last_version_path]), '121.0.6167.85')
+
+    #@unittest.skip('Temporary not needed')
+    def test04_check_browser_uses_metadata_before_terminal(self):
+        plist_path = self.out_path + 'Info.plist'
+        with open(plist_path, 'wb') as file:
+            plistlib.dump({'CFBundleShortVersionString': '120.0.6099.109'}, file)
+
+        chrome_setting = dict(setting, ChromeBrowser=dict(setting["ChromeBrowser"], MetadataPaths=[plist_path], Path='/not/existing/chrome'))
+
+        chrome_browser = ChromeBrowser(path=self.out_path + 'chromedriver', setting=chrome_setting)
+
+        self.assertEqual(chrome_browser._get_current_version_chrome_browser_selenium(), '120.0.6099.109')
+
+    #@unittest.skip('Temporary not needed')
+    def test05_check_profile_files_are_not_used_as_metadata(self):
+        for browser in ['ChromeBrowser', 'FirefoxBrowser', 'EdgeBrowser', 'OperaBrowser']:
+            for path in setting[browser]["MetadataPaths"]:
+                self.assertNotIn('Last Version', path)
+                self.assertNotIn('Chromium', path)
+
+    #@unittest.skip('Temporary not needed')
+    def test06_check_version_is_read_from_version_folder(self):
+        application_path = self.out_path + 'Application'
+
+        for name in ['119.0.6045.200', '120.0.6099.109', 'SetupMetrics']:
+            os.makedirs(os.path.join(application_path, name))
+
+        Path(application_path, '121.0.6167.85.txt').write_text('not a folder', encoding='utf-8')
+
+        self.assertEqual(self.browser_metadata.get_version([application_path]), '120.0.6099.109')
+
+        #new version is installed near the old one, so folder is read again after it was changed
+        os.makedirs(os.path.join(application_path, '120.0.6099.130'))
+        os.utime(application_path, ns=(time.time_ns(), time.time_ns() + 10**9))
+
+        self.assertEqual(self.browser_metadata.get_version([application_path]), '120.0.6099.130')
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2, failfast=True, exit=False)
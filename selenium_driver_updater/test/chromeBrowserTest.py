@@ -5,6 +5,7 @@ import os.path
 import time
 import logging
 import platform
+from unittest import mock
 
 import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir)))
@@ -92,5 +93,37 @@ class testChromeBrowser(unittest.TestCase):
         self.chromebrowser.main()
 
 
+    #@unittest.skip('Temporary not needed')
+    def test07_check_get_latest_version_chrome_browser_via_site(self):
+        latest_version = self.chromebrowser._get_latest_version_chrome_browser_via_site()
+        self.assertIsNotNone(latest_version, latest_version)
+        self.assertGreater(len(latest_version), 0, len(latest_version))
+
+    #@unittest.skip('Temporary not needed')
+    def test08_check_get_latest_version_chrome_browser_from_feed(self):
+        json_data = {'versions': [{'name': 'chrome/platforms/linux/channels/stable/versions/120.0.6099.109', 'version': '120.0.6099.109'},
+                                {'name': 'chrome/platforms/linux/channels/stable/versions/120.0.6099.71', 'version': '120.0.6099.71'}]}
+
+        with mock.patch.object(self.chromebrowser, 'requests_getter') as requests_getter:
+            requests_getter.get_result_by_request.return_value = json_data
+            latest_version = self.chromebrowser._get_latest_version_chrome_browser()
+
+        self.assertEqual(latest_version, '120.0.6099.109')
+        url = self.setting["ChromeBrowser"]["LinkLatestReleaseFeed"].format(self.chromebrowser._get_version_history_platform())
+        requests_getter.get_result_by_request.assert_called_once_with(url=url, is_json=True)
+        self.assertNotEqual(url, self.setting["ChromeDriver"]["LinkLastRelease"])
+
+    #@unittest.skip('Temporary not needed')
+    def test09_check_version_history_platform(self):
+        platforms = [('Windows', 'AMD64', 'win64'), ('Windows', 'ARM64', 'win_arm64'), ('Windows', 'x86', 'win'),
+                    ('Darwin', 'arm64', 'mac_arm64'), ('Darwin', 'x86_64', 'mac'), ('Linux', 'x86_64', 'linux')]
+
+        for system, machine, version_history_platform in platforms:
+
+            with mock.patch.object(platform, 'system', return_value=system), \
+                mock.patch.object(platform, 'machine', return_value=machine):
+
+                self.assertEqual(self.chromebrowser._get_version_history_platform(), version_history_platform)
+
 if __name__ == '__main__':
     unittest.main(verbosity=2, failfast=True, exit=False)
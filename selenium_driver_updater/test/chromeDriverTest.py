@@ -5,6 +5,7 @@ import platform
 import unittest
 import os.path
 import logging
+from unittest import mock
 from pathlib import Path
 
 import sys
@@ -217,6 +218,23 @@ class testChromeDriver(unittest.TestCase):
 
         self.chrome_driver._check_if_version_is_valid(url=url)
 
+    #@unittest.skip('Temporary not needed')
+    def test18_check_chromedriver_newer_than_released_browser(self):
+        driver_feed = {'channels': {'Stable': {'channel': 'Stable', 'version': '121.0.6167.85'}}}
+        browser_feed = {'versions': [{'version': '120.0.6099.224'}]}
+
+        with mock.patch.object(self.chrome_driver, 'requests_getter') as driver_requests_getter, \
+            mock.patch.object(self.chrome_driver.chromebrowser, 'requests_getter') as browser_requests_getter:
+
+            driver_requests_getter.get_result_by_request.return_value = driver_feed
+            browser_requests_getter.get_result_by_request.return_value = browser_feed
+
+            is_equal, latest_version_driver, latest_version_browser = self.chrome_driver._compare_latest_version_main_chromedriver_and_latest_version_main_chrome_browser()
+
+        self.assertFalse(is_equal)
+        self.assertEqual(latest_version_driver, '121.0.6167.85')
+        self.assertEqual(latest_version_browser, '120.0.6099.224')
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2, failfast=True, exit=False)
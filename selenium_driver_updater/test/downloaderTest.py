@@ -0,0 +1,220 @@
+#Standart library imports
+import unittest
+import time
+import logging
+import tempfile
+import shutil
+import json
+import io
+import tarfile
+from pathlib import Path
+
+import sys
+import os.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir)))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir, os.path.pardir)))
+
+# Local imports
+from selenium_driver_updater.test.localServer import LocalServer, QuietHandler
+from selenium_driver_updater.util.downloader import Downloader
+from selenium_driver_updater.driver_base import DriverBase
+from selenium_driver_updater.util.exceptions import StatusCodeNotEqualException
+from selenium_driver_updater._setting import setting
+
+logging.basicConfig(level=logging.INFO)
+
+class _RangeHandler(QuietHandler):
+    """Handler that supports Range and If-Range headers like CDNs do"""
+
+    etag = '"test-etag"'
+    range_shift = 0 #sent range starts this number of bytes after asked one
+    total_shift = 0 #sent total size is bigger than real one by this number of bytes
+
+    def do_GET(self): # pylint: disable=invalid-name
+        file_path = Path(self.directory, self.path.lstrip('/'))
+        if not file_path.is_file():
+            self.send_error(404)
+            return
+
+        content = file_path.read_bytes()
+        range_header = self.headers.get('Range')
+        if_range = self.headers.get('If-Range')
+
+        if range_header and if_range in (None, self.etag):
+            start, end = range_header.split('=')[1].split('-')
+            start, end = int(start) + self.range_shift, int(end) if end else len(content) - 1
+            self.send_response(206)
+            self.send_header('Content-Range', f'bytes {start}-{end}/{len(content) + self.total_shift}')
+            content = content[start:end + 1]
+        else:
+            self.send_response(200)
+
+        self.send_header('ETag', self.etag)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+# pylint: disable=missing-function-docstring
+class testDownloader(unittest.TestCase):
+    """Class for unit-testing Downloader class
+
+    Attributes:
+        downloader                  : Initialize class Downloader
+        server_path (str)           : Temporary folder served by local http server
+        out_path (str)              : Temporary folder for downloaded files
+        content (bytes)             : Content of the test file
+        startTime (float)           : Time of starting unit-tests
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.downloader = Downloader
+
+        cls.content = os.urandom(1024 * 300)
+        cls.server_path = tempfile.mkdtemp()
+        Path(cls.server_path, 'archive.zip').write_bytes(cls.content)
+
+        with tarfile.open(Path(cls.server_path, 'phantomjs-2.1.1-linux-x86_64.tar.bz2'), 'w:bz2') as tar_ref:
+            for name, content in [('phantomjs-2.1.1-linux-x86_64/README.md', b'readme'), ('phantomjs-2.1.1-linux-x86_64/bin/phantomjs', cls.content)]:
+                member = tarfile.TarInfo(name)
+                member.size = len(content)
+                member.mode = 0o755
+                tar_ref.addfile(member, io.BytesIO(content))
+
+        cls.server = LocalServer.start(_RangeHandler, directory=cls.server_path)
+        cls.server_url = LocalServer.get_url(cls.server)
+
+    @classmethod
+    def tearDownClass(cls):
+        LocalServer.stop(cls.server)
+        shutil.rmtree(cls.server_path, ignore_errors=True)
+
+    def setUp(self):
+        _RangeHandler.range_shift = 0
+        _RangeHandler.total_shift = 0
+        self.out_path = tempfile.mkdtemp() + os.path.sep
+        self.start_time : float = time.time()
+
+    def tearDown(self):
+        shutil.rmtree(self.out_path, ignore_errors=True)
+        end_time = time.time() - self.start_time
+        print("%.3f" % end_time)
+
+    #@unittest.skip('Temporary not needed')
+    def test01_check_download_failure(self):
+        try:
+            self.downloader.download(url=self.server_url + 'missing.zip', out_path=self.out_path + 'missing.zip')
+        except Exception as error:
+            self.assertTrue(error.__class__ == StatusCodeNotEqualException, error.__class__)
+
+        self.assertEqual(os.listdir(self.out_path), [])
+
+    #@unittest.skip('Temporary not needed')
+    def test02_check_download(self):
+        progress = []
+
+        archive_path = self.downloader.download(url=self.server_url + 'archive.zip', out_path=self.out_path + 'archive.zip',
+                                                progress=lambda current, total: progress.append((current, total)), chunk_size=1024 * 64)
+
+        self.assertEqual(Path(archive_path).read_bytes(), self.content)
+        self.assertEqual(os.listdir(self.out_path), ['archive.zip'])
+        self.assertEqual(progress[-1], (len(self.content), len(self.content)))
+        self.assertEqual(len(progress), 5)
+
+    #@unittest.skip('Temporary not needed')
+    def test03_check_download_with_resume(self):
+        out_path = self.out_path + 'archive.zip'
+        Path(out_path + '.part').write_bytes(self.content[:1000])
+        Path(out_path + '.part.json').write_text(json.dumps(dict(url=self.server_url + 'archive.zip', etag=_RangeHandler.etag)), encoding='utf-8')
+
+        progress = []
+        archive_path = self.downloader.download(url=self.server_url + 'archive.zip', out_path=out_path,
+                                                progress=lambda current, total: progress.append((current, total)), resume=True)
+
+        self.assertEqual(Path(archive_path).read_bytes(), self.content)
+        self.assertEqual(os.listdir(self.out_path), ['archive.zip'])
+        self.assertEqual(progress[0][0], 1000 + 1024 * 64)
+
+    #@unittest.skip('Temporary not needed')
+    def test04_check_download_with_resume_changed_file(self):
+        out_path = self.out_path + 'archive.zip'
+        Path(out_path + '.part').write_bytes(b'x' * 1000)
+        Path(out_path + '.part.json').write_text(json.dumps(dict(url=self.server_url + 'archive.zip', etag='"old-etag"')), encoding='utf-8')
+
+        archive_path = self.downloader.download(url=self.server_url + 'archive.zip', out_path=out_path, resume=True)
+
+        self.assertEqual(Path(archive_path).read_bytes(), self.content)
+        self.assertEqual(os.listdir(self.out_path), ['archive.zip'])
+
+    #@unittest.skip('Temporary not needed')
+    def test05_check_download_segmented(self):
+        segment_min_size = setting["Downloader"]["SegmentMinSize"]
+        setting["Downloader"]["SegmentMinSize"] = 1024
+        progress = []
+
+        try:
+            archive_path = self.downloader.download(url=self.server_url + 'archive.zip', out_path=self.out_path + 'archive.zip',
+                                                    progress=lambda current, total: progress.append((current, total)), segments=4)
+        finally:
+            setting["Downloader"]["SegmentMinSize"] = segment_min_size
+
+        self.assertEqual(Path(archive_path).read_bytes(), self.content)
+        self.assertEqual(os.listdir(self.out_path), ['archive.zip'])
+        self.assertEqual(progress[-1], (len(self.content), len(self.content)))
+
+    #@unittest.skip('Temporary not needed')
+    def test06_check_stream_extract_archive(self):
+        artifact_store_enabled = setting["ArtifactStore"]["Enabled"]
+        setting["ArtifactStore"]["Enabled"] = False
+
+        try:
+            driver = DriverBase(driver_name='phantomjs', path=self.out_path, filename='', version='', drivers_file_format='')
+            url = self.server_url + 'phantomjs-2.1.1-linux-x86_64.tar.bz2'
+
+            self.assertFalse(driver._stream_extract_archive(url)) #disabled by default
+
+            driver.setting["Downloader"]["StreamExtract"] = True
+            self.assertTrue(driver._stream_extract_archive(url))
+
+        finally:
+            setting["ArtifactStore"]["Enabled"] = artifact_store_enabled
+
+        self.assertEqual(os.listdir(self.out_path), ['phantomjs'])
+        self.assertEqual(Path(driver.driver_path).read_bytes(), self.content)
+        self.assertEqual(driver.installed_url, url)
+
+    #@unittest.skip('Temporary not needed')
+    def test07_check_open_stream_failure(self):
+        with self.assertRaises(StatusCodeNotEqualException):
+            with self.downloader.open_stream(url=self.server_url + 'missing.zip') as stream:
+                stream.read()
+
+    #@unittest.skip('Temporary not needed')
+    def test08_check_download_with_resume_misaligned_range(self):
+        out_path = self.out_path + 'archive.zip'
+        Path(out_path + '.part').write_bytes(self.content[:1000])
+        Path(out_path + '.part.json').write_text(json.dumps(dict(url=self.server_url + 'archive.zip', etag=_RangeHandler.etag)), encoding='utf-8')
+
+        _RangeHandler.range_shift = 10
+
+        archive_path = self.downloader.download(url=self.server_url + 'archive.zip', out_path=out_path, resume=True)
+
+        self.assertEqual(Path(archive_path).read_bytes(), self.content)
+        self.assertEqual(os.listdir(self.out_path), ['archive.zip'])
+
+    #@unittest.skip('Temporary not needed')
+    def test09_check_download_with_resume_incomplete_file(self):
+        out_path = self.out_path + 'archive.zip'
+        Path(out_path + '.part').write_bytes(self.content[:1000])
+        Path(out_path + '.part.json').write_text(json.dumps(dict(url=self.server_url + 'archive.zip', etag=_RangeHandler.etag)), encoding='utf-8')
+
+        _RangeHandler.total_shift = 10
+
+        with self.assertRaises(OSError):
+            self.downloader.download(url=self.server_url + 'archive.zip', out_path=out_path, resume=True)
+
+        self.assertFalse(Path(out_path).exists())
+        self.assertEqual(Path(out_path + '.part').read_bytes(), self.content)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2, failfast=True, exit=False)
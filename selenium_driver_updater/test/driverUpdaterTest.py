@@ -4,22 +4,48 @@ import unittest
 import os.path
 import time
 import logging
+import threading
+import json
+import socket
+import subprocess
+import tempfile
+import shutil
+from unittest import mock
+from concurrent.futures import ThreadPoolExecutor
 
 import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir)))
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir, os.path.pardir)))
 
 # Local imports
+from selenium_driver_updater.test.localServer import LocalServer, QuietBaseHandler
 from selenium_driver_updater.driverUpdater import DriverUpdater
 from selenium_driver_updater.driverUpdater import _info
 
 from selenium_driver_updater._setting import setting
+from selenium_driver_updater.util import ALL_DRIVERS
 from selenium_driver_updater.util.requests_getter import RequestsGetter
+from selenium_driver_updater.util.install_manifest import InstallManifest
+from selenium_driver_updater.util.resolution_context import ResolutionContext
+from selenium_driver_updater.util.logger import logger
 
 base_dir = os.path.dirname(os.path.abspath(__file__))
 
 logging.basicConfig(level=logging.INFO)
 
+class _SlowPyPiHandler(QuietBaseHandler):
+    """Handler that answers like PyPI json api after a delay"""
+
+    def do_GET(self): # pylint: disable=invalid-name
+        time.sleep(1)
+
+        body = json.dumps({'info': {'version': '999.0.0'}}).encode('utf-8')
+
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
 # pylint: disable=missing-function-docstring
 class testDriverUpdater(unittest.TestCase):
     """Class for unit-testing DriverUpdater class
@@ -52,14 +78,14 @@ class testDriverUpdater(unittest.TestCase):
     #@unittest.skip('Temporary not needed')
     def test01_check_all_input_parameteres_failure(self):
         try:
-            self.driver_updater._DriverUpdater__check_all_input_parameteres()
+            self.driver_updater._DriverUpdater__check_all_input_parameteres(self.info(path=self.path, driver_name=1))
         except Exception as error:
             self.assertTrue(error.__class__ == ValueError, error.__class__)
 
     #@unittest.skip('Temporary not needed')
     def test02_check_enviroment_and_variables_failure(self):
         try:
-            self.driver_updater._DriverUpdater__check_enviroment_and_variables()
+            self.driver_updater._DriverUpdater__check_enviroment_and_variables(self.info(path=self.path, driver_name=1, enable_library_update_check=False))
         except Exception as error:
             self.assertTrue(error.__class__ == ValueError, error.__class__)
 
@@ -85,10 +111,6 @@ class testDriverUpdater(unittest.TestCase):
 
     #@unittest.skip('Temporary not needed')
     def test06_check_library_is_up_to_date(self):
-        self.info.path = base_dir
-        self.info.driver_name = 'chromedriver'
-        self.info.system_name = 'mac64'
-
         self.driver_updater._DriverUpdater__check_library_is_up_to_date()
 
     #@unittest.skip('Temporary not needed')
@@ -97,11 +119,15 @@ class testDriverUpdater(unittest.TestCase):
 
     #@unittest.skip('Temporary not needed')
     def test08_check_all_input_parameteres(self):
-        self.driver_updater._DriverUpdater__check_all_input_parameteres()
+        info = self.info(path=self.path, driver_name=[self.driver_name], filename='chromedriver_test', system_name=[self.system_name])
+        checked_info = self.driver_updater._DriverUpdater__check_all_input_parameteres(info)
+        self.assertEqual(checked_info.filename, ['chromedriver_test'])
+        self.assertEqual(info.filename, 'chromedriver_test')
 
     #@unittest.skip('Temporary not needed')
     def test09_check_enviroment_and_variables(self):
-        self.driver_updater._DriverUpdater__check_enviroment_and_variables()
+        info = self.info(path=self.path, driver_name=self.driver_name, system_name=self.system_name)
+        self.driver_updater._DriverUpdater__check_enviroment_and_variables(info)
 
     #@unittest.skip('Temporary not needed')
     def test10_check_system_name_is_valid(self):
@@ -111,6 +137,193 @@ class testDriverUpdater(unittest.TestCase):
     def test11_check_parameter_type_is_valid(self):
         self.driver_updater._DriverUpdater__check_parameter_type_is_valid(parameter=self.driver_name, needed_type=str, parameter_name='driver_name')
 
+    #@unittest.skip('Temporary not needed')
+    def test12_check_run_drivers_in_parallel_keeps_order_and_errors(self):
+        list_of_parameters = [dict(driver_name=f'unknowndriver{i}', filename='', system_name='', version='', index=i) for i in range(3)]
+
+        list_of_paths = self.driver_updater._DriverUpdater__run_drivers_in_parallel(self.info(path=self.path), list_of_parameters)
+        self.assertEqual(list_of_paths, ['', '', ''])
+
+    #@unittest.skip('Temporary not needed')
+    def test13_check_concurrent_drivers_do_not_share_setting(self):
+        drivers_file_format = setting['Program']['DriversFileFormat']
+        last_release_platform = setting['ChromeDriver']['LastReleasePlatform']
+
+        def create_driver(index):
+            file_format = '.exe' if index % 2 else ''
+            driver = ALL_DRIVERS['chromedriver'](driver_name='chromedriver', path=self.path + os.path.sep, filename='',
+                                                    version='', system_name='', drivers_file_format=file_format)
+            return file_format, driver.driver_path
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(create_driver, range(32)))
+
+        for file_format, driver_path in results:
+            self.assertEqual(driver_path, self.path + os.path.sep + 'chromedriver' + file_format)
+
+        self.assertEqual(setting['Program']['DriversFileFormat'], drivers_file_format)
+        self.assertEqual(setting['ChromeDriver']['LastReleasePlatform'], last_release_platform)
+
+    #@unittest.skip('Temporary not needed')
+    def test14_check_library_update_check_does_not_block(self):
+        server = LocalServer.start(_SlowPyPiHandler)
+
+        old_url = setting["PyPi"]["urlProjectJson"]
+        old_cache_enabled = setting["MetadataCache"]["Enabled"]
+        old_version = setting["Program"]["version"]
+
+        setting["PyPi"]["urlProjectJson"] = LocalServer.get_url(server) + 'pypi/selenium-driver-updater/json'
+        setting["MetadataCache"]["Enabled"] = False
+        setting["Program"]["version"] = '1.0.0'
+        self.driver_updater._library_check_thread = None
+
+        try:
+            with self.assertLogs('selenium_driver_updater', level='WARNING') as logs:
+
+                start_time = time.time()
+                self.driver_updater._DriverUpdater__check_enviroment_and_variables(self.info(path=self.path, driver_name=self.driver_name))
+                self.assertLess(time.time() - start_time, 0.5)
+
+                self.driver_updater._library_check_thread.join(10)
+
+            self.assertIn('999.0.0', ''.join(logs.output))
+
+        finally:
+            setting["PyPi"]["urlProjectJson"] = old_url
+            setting["MetadataCache"]["Enabled"] = old_cache_enabled
+            setting["Program"]["version"] = old_version
+            LocalServer.stop(server)
+
+    #@unittest.skip('Temporary not needed')
+    def test15_check_fresh_driver_is_trusted_without_network_and_processes(self):
+        out_path = tempfile.mkdtemp() + os.path.sep
+        driver_path = out_path + 'chromedriver' + setting["Program"]["DriversFileFormat"]
+
+        with open(driver_path, 'wb') as file:
+            file.write(b'driver')
+
+        InstallManifest.save(driver_path, '120.0.6099.109')
+        InstallManifest.mark_checked(driver_path)
+
+        self.driver_updater._library_check_thread = None
+
+        try:
+            with mock.patch.object(socket.socket, 'connect', side_effect=AssertionError('socket was opened')), \
+                mock.patch.object(subprocess, 'Popen', side_effect=AssertionError('process was spawned')), \
+                mock.patch.object(ResolutionContext, 'count_network_call') as count_network_call, \
+                mock.patch.object(DriverUpdater, '_DriverUpdater__run_driver_with_lock') as run_driver:
+
+                result = self.driver_updater.install(driver_name=self.driver_name, path=out_path, trust_manifest_for=60)
+
+                self.assertEqual(result, driver_path)
+                self.assertEqual(count_network_call.call_count, 0)
+                self.assertEqual(run_driver.call_count, 0)
+                self.assertIsNone(self.driver_updater._library_check_thread)
+
+            #upgrade was asked, so driver has to be checked even if it is fresh
+            with mock.patch.object(DriverUpdater, '_DriverUpdater__run_driver_with_lock', return_value='') as run_driver:
+
+                self.driver_updater.install(driver_name=self.driver_name, path=out_path, trust_manifest_for=60,
+                                            upgrade=True, enable_library_update_check=False)
+                self.assertEqual(run_driver.call_count, 1)
+
+            #driver is always downloaded without up to date check, so it has to be run
+            with mock.patch.object(DriverUpdater, '_DriverUpdater__run_driver_with_lock', return_value='') as run_driver:
+
+                self.driver_updater.install(driver_name=self.driver_name, path=out_path, trust_manifest_for=60,
+                                            check_driver_is_up_to_date=False, enable_library_update_check=False)
+                self.assertEqual(run_driver.call_count, 1)
+
+            #other version was asked, so driver has to be checked
+            with mock.patch.object(DriverUpdater, '_DriverUpdater__run_driver_with_lock', return_value='') as run_driver:
+
+                self.driver_updater.install(driver_name=self.driver_name, path=out_path, trust_manifest_for=60,
+                                            version='121.0.6167.85', enable_library_update_check=False)
+                self.assertEqual(run_driver.call_count, 1)
+
+        finally:
+            self.driver_updater._library_check_thread = None
+            shutil.rmtree(out_path, ignore_errors=True)
+
+    #@unittest.skip('Temporary not needed')
+    def test16_check_info_messages_are_disabled_only_for_current_install(self):
+        level = logger.level
+        out_path = tempfile.mkdtemp() + os.path.sep
+
+        def run_specific_driver(info, **kwargs): # pylint: disable=unused-argument
+            with self.assertNoLogs(logger, level='INFO'):
+                logger.info('message of install without info messages')
+
+            thread = threading.Thread(target=logger.info, args=('message of another install',))
+
+            with self.assertLogs(logger, level='INFO') as logs:
+                thread.start()
+                thread.join()
+
+            self.assertEqual(len(logs.records), 1)
+            return info.path
+
+        try:
+            with mock.patch.object(DriverUpdater, '_DriverUpdater__run_specific_driver', side_effect=run_specific_driver):
+                result = self.driver_updater.install(driver_name=self.driver_name, path=out_path, info_messages=False, enable_library_update_check=False)
+
+            self.assertEqual(result, out_path)
+            self.assertEqual(logger.level, level)
+
+        finally:
+            shutil.rmtree(out_path, ignore_errors=True)
+
+    #@unittest.skip('Temporary not needed')
+    def test17_check_install_waits_for_library_update_check(self):
+        server = LocalServer.start(_SlowPyPiHandler)
+        out_path = tempfile.mkdtemp() + os.path.sep
+
+        old_url = setting["PyPi"]["urlProjectJson"]
+        old_cache_enabled = setting["MetadataCache"]["Enabled"]
+        old_version = setting["Program"]["version"]
+
+        setting["PyPi"]["urlProjectJson"] = LocalServer.get_url(server) + 'pypi/selenium-driver-updater/json'
+        setting["MetadataCache"]["Enabled"] = False
+        setting["Program"]["version"] = '1.0.0'
+        self.driver_updater._library_check_thread = None
+
+        try:
+            with mock.patch.object(DriverUpdater, '_DriverUpdater__run_specific_driver', side_effect=lambda info, **kwargs: info.path), \
+                self.assertLogs('selenium_driver_updater', level='WARNING') as logs:
+
+                self.driver_updater.install(driver_name=self.driver_name, path=out_path)
+
+                #result of the check is reported before install returns, so it is not lost when script exits
+                self.assertFalse(self.driver_updater._library_check_thread.is_alive())
+
+            self.assertIn('999.0.0', ''.join(logs.output))
+
+        finally:
+            setting["PyPi"]["urlProjectJson"] = old_url
+            setting["MetadataCache"]["Enabled"] = old_cache_enabled
+            setting["Program"]["version"] = old_version
+            LocalServer.stop(server)
+            shutil.rmtree(out_path, ignore_errors=True)
+
+    #@unittest.skip('Temporary not needed')
+    def test18_check_invalid_trust_manifest_for_is_reported(self):
+        out_path = tempfile.mkdtemp() + os.path.sep
+
+        try:
+            for trust_manifest_for in [None, 'abc']:
+
+                with mock.patch.object(DriverUpdater, '_DriverUpdater__run_specific_driver') as run_specific_driver, \
+                    self.assertLogs('selenium_driver_updater', level='ERROR') as logs:
+
+                    result = self.driver_updater.install(driver_name=self.driver_name, path=out_path,
+                                                        trust_manifest_for=trust_manifest_for, enable_library_update_check=False)
+
+                self.assertEqual(result, '')
+                self.assertEqual(run_specific_driver.call_count, 0)
+                self.assertIn('trust_manifest_for', ''.join(logs.output))
+
+        finally:
+            shutil.rmtree(out_path, ignore_errors=True)
 
 if __name__ == '__main__':
     unittest.main(verbosity=2, failfast=True, exit=False)
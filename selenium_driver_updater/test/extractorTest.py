@@ -4,6 +4,9 @@ import unittest
 import time
 import os.path
 import shutil
+import tempfile
+import tarfile
+import io
 import logging
 from pathlib import Path
 
@@ -126,9 +129,10 @@ class testExtractor(unittest.TestCase):
     def test10_check_extract_all_tar_bz2_archive(self):
         Extractor.extract_all_tar_bz2_archive(archive_path=self.tar_bz2_archive_path,out_path=self.out_path, delete_archive = False)
 
-        phantom_path = self.out_path + 'phantomjs-2.1.1-linux-x86_64'
-        self.assertTrue(Path(phantom_path).exists())
-        shutil.rmtree(phantom_path)
+        phantom_path = self.out_path + 'phantomjs'
+        self.assertTrue(Path(phantom_path).is_file())
+        self.assertFalse(Path(self.out_path + 'phantomjs-2.1.1-linux-x86_64').exists()) #examples and docs are not extracted
+        Path(phantom_path).unlink()
         self.assertFalse(Path(phantom_path).exists())
 
     #@unittest.skip('Temporary not needed')
@@ -140,6 +144,62 @@ class testExtractor(unittest.TestCase):
         shutil.rmtree(opera_path)
         self.assertFalse(Path(opera_path).exists())
 
+    #@unittest.skip('Temporary not needed')
+    def test12_check_extract_driver_from_zip_stream(self):
+        out_path = tempfile.mkdtemp() + os.path.sep
+
+        try:
+            with open(self.zip_archive_path, 'rb') as stream:
+                driver_path = self.extractor.extract_driver_from_stream(stream=stream, archive_name=os.path.basename(self.zip_archive_path),
+                                                                        out_path=out_path, filename='geckodriver.exe', filename_replace='geckodriverzip')
+
+            self.assertEqual(driver_path, out_path + 'geckodriverzip')
+            self.assertEqual(os.listdir(out_path), ['geckodriverzip'])
+
+        finally:
+            shutil.rmtree(out_path, ignore_errors=True)
+
+    #@unittest.skip('Temporary not needed')
+    def test13_check_extract_driver_from_tar_gz_stream(self):
+        out_path = tempfile.mkdtemp() + os.path.sep
+
+        try:
+            with open(self.tar_archive_path, 'rb') as stream:
+                driver_path = self.extractor.extract_driver_from_stream(stream=stream, archive_name=os.path.basename(self.tar_archive_path),
+                                                                        out_path=out_path, filename='geckodriver')
+
+            self.assertEqual(driver_path, out_path + 'geckodriver')
+            self.assertEqual(os.listdir(out_path), ['geckodriver'])
+            self.assertTrue(os.access(driver_path, os.X_OK))
+
+            with open(self.tar_archive_path, 'rb') as stream:
+                with self.assertRaises(FileNotFoundError):
+                    self.extractor.extract_driver_from_stream(stream=stream, archive_name=os.path.basename(self.tar_archive_path),
+                                                            out_path=out_path, filename='chromedriver')
+
+        finally:
+            shutil.rmtree(out_path, ignore_errors=True)
+
+    #@unittest.skip('Temporary not needed')
+    def test14_check_extract_all_tar_archive_extracts_only_driver(self):
+        out_path = tempfile.mkdtemp() + os.path.sep
+        archive_path = out_path + 'phantomjs-2.1.1-linux-x86_64.tar.bz2'
+
+        with tarfile.open(archive_path, 'w:bz2') as tar_ref:
+            for name in ['README.md', 'LICENSE.BSD', 'examples/arguments.js', 'bin/phantomjs']:
+                member = tarfile.TarInfo('phantomjs-2.1.1-linux-x86_64/' + name)
+                member.size = len(name)
+                member.mode = 0o755
+                tar_ref.addfile(member, io.BytesIO(name.encode('utf-8')))
+
+        try:
+            self.extractor.extract_all_tar_bz2_archive(archive_path=archive_path, out_path=out_path)
+
+            self.assertEqual(os.listdir(out_path), ['phantomjs'])
+            self.assertEqual(Path(out_path + 'phantomjs').read_text(encoding='utf-8'), 'bin/phantomjs')
+
+        finally:
+            shutil.rmtree(out_path, ignore_errors=True)
 
 if __name__ == '__main__':
     unittest.main(verbosity=2, failfast=True, exit=False)
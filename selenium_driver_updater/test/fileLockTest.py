@@ -0,0 +1,120 @@
+#Standart library imports
+import unittest
+import time
+import logging
+import tempfile
+import shutil
+import subprocess
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+import sys
+import os.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir)))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir, os.path.pardir)))
+
+# Local imports
+from selenium_driver_updater.util.file_lock import FileLock
+from selenium_driver_updater.driverUpdater import DriverUpdater
+
+logging.basicConfig(level=logging.INFO)
+
+package_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir, os.path.pardir))
+
+class _SlowDriver():
+    """Driver which takes some time to install and counts its installs"""
+
+    installs = 0
+    installs_lock = threading.Lock()
+
+    def __init__(self, path : str):
+        self.driver_name = 'slowdriver'
+        self.version = ''
+        self.driver_path = path + 'slowdriver'
+        self.lock_path = path + '.slowdriver.lock'
+
+    def main(self) -> str:
+        time.sleep(0.5)
+        Path(self.driver_path + '.tmp').write_bytes(b'driver')
+        os.replace(self.driver_path + '.tmp', self.driver_path)
+
+        with _SlowDriver.installs_lock:
+            _SlowDriver.installs += 1
+
+        return self.driver_path
+
+# pylint: disable=missing-function-docstring
+class testFileLock(unittest.TestCase):
+    """Class for unit-testing FileLock class
+
+    Attributes:
+        lock_path (str)             : Path to the lock file
+        out_path (str)              : Temporary folder
+        startTime (float)           : Time of starting unit-tests
+    """
+
+    def setUp(self):
+        self.out_path = tempfile.mkdtemp() + os.path.sep
+        self.lock_path = self.out_path + '.chromedriver.lock'
+        self.start_time : float = time.time()
+
+    def tearDown(self):
+        shutil.rmtree(self.out_path, ignore_errors=True)
+        end_time = time.time() - self.start_time
+        print("%.3f" % end_time)
+
+    def hold_lock_in_other_process(self, seconds : float) -> subprocess.Popen:
+        code = ('import sys, time\n'
+                'from selenium_driver_updater.util.file_lock import FileLock\n'
+                f'with FileLock({self.lock_path!r}):\n'
+                '    print("locked", flush=True)\n'
+                f'    time.sleep({seconds})\n')
+        process = subprocess.Popen([sys.executable, '-c', code], cwd=package_dir, stdout=subprocess.PIPE, text=True)
+        self.assertEqual(process.stdout.readline().strip(), 'locked')
+        return process
+
+    #@unittest.skip('Temporary not needed')
+    def test01_check_acquire_and_release(self):
+        with FileLock(self.lock_path) as lock:
+            self.assertFalse(lock.waited)
+
+        with FileLock(self.lock_path) as lock:
+            self.assertFalse(lock.waited)
+
+    #@unittest.skip('Temporary not needed')
+    def test02_check_wait_for_other_process(self):
+        process = self.hold_lock_in_other_process(0.5)
+
+        try:
+            with FileLock(self.lock_path) as lock:
+                self.assertTrue(lock.waited)
+                self.assertGreaterEqual(time.time() - self.start_time, 0.3)
+        finally:
+            process.wait(timeout=5)
+            process.stdout.close()
+
+    #@unittest.skip('Temporary not needed')
+    def test03_check_timeout(self):
+        process = self.hold_lock_in_other_process(2)
+
+        try:
+            with self.assertRaises(TimeoutError):
+                FileLock(self.lock_path, timeout=0.3).acquire()
+        finally:
+            process.wait(timeout=5)
+            process.stdout.close()
+
+    #@unittest.skip('Temporary not needed')
+    def test04_check_install_is_shared_between_waiters(self):
+        _SlowDriver.installs = 0
+        drivers = [_SlowDriver(self.out_path) for _ in range(4)]
+
+        with ThreadPoolExecutor(max_workers=len(drivers)) as executor:
+            paths = list(executor.map(DriverUpdater._DriverUpdater__run_driver_with_lock, drivers))
+
+        self.assertEqual(paths, [self.out_path + 'slowdriver'] * len(drivers))
+        self.assertEqual(_SlowDriver.installs, 1)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2, failfast=True, exit=False)
@@ -5,6 +5,7 @@ import os.path
 import time
 import logging
 import platform
+from unittest import mock
 
 import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir)))
@@ -78,6 +79,23 @@ class testFirefoxBrowser(unittest.TestCase):
         self.firefoxbrowser.main()
 
 
+    #@unittest.skip('Temporary not needed')
+    def test05_check_get_latest_version_firefox_browser_via_site(self):
+        latest_version = self.firefoxbrowser._get_latest_version_firefox_browser_via_site()
+        self.assertIsNotNone(latest_version, latest_version)
+        self.assertGreater(len(latest_version), 0, len(latest_version))
+
+    #@unittest.skip('Temporary not needed')
+    def test06_check_get_latest_version_firefox_browser_from_feed(self):
+        json_data = {'LATEST_FIREFOX_VERSION': '121.0.1', 'FIREFOX_ESR': '115.6.0esr'}
+
+        with mock.patch.object(self.firefoxbrowser, 'requests_getter') as requests_getter:
+            requests_getter.get_result_by_request.return_value = json_data
+            latest_version = self.firefoxbrowser._get_latest_version_firefox_browser()
+
+        self.assertEqual(latest_version, '121.0.1')
+        requests_getter.get_result_by_request.assert_called_once_with(url=self.setting["FirefoxBrowser"]["LinkLatestReleaseFeed"], is_json=True)
+
 if __name__ == '__main__':
     unittest.main(verbosity=2, failfast=True, exit=False)
     
\ No newline at end of file
@@ -0,0 +1,199 @@
+#pylint: disable=protected-access
+#Standart library imports
+import unittest
+import time
+import logging
+import tempfile
+import shutil
+import copy
+import threading
+
+import sys
+import os.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir)))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir, os.path.pardir)))
+
+# Local imports
+from selenium_driver_updater.test.localServer import LocalServer, QuietBaseHandler
+from selenium_driver_updater.util.github_rate_limiter import GithubRateLimiter
+from selenium_driver_updater.util.resolution_context import ResolutionContext
+from selenium_driver_updater.util.requests_getter import RequestsGetter
+from selenium_driver_updater._setting import setting
+
+logging.basicConfig(level=logging.INFO)
+
+class _RateLimitHandler(QuietBaseHandler):
+    """Handler that answers with rate limit headers and remembers authorization header"""
+
+    authorization = []
+
+    def do_GET(self): # pylint: disable=invalid-name
+        _RateLimitHandler.authorization.append(self.headers.get('Authorization'))
+
+        body = b'{}'
+
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('X-RateLimit-Limit', '5000')
+        self.send_header('X-RateLimit-Remaining', '4999')
+        self.send_header('X-RateLimit-Reset', str(int(time.time()) + 3600))
+        self.end_headers()
+        self.wfile.write(body)
+
+# pylint: disable=missing-function-docstring
+class testGithubRateLimiter(unittest.TestCase):
+    """Class for unit-testing GithubRateLimiter class
+
+    Attributes:
+        github_rate_limiter         : Initialize class GithubRateLimiter
+        startTime (float)           : Time of starting unit-tests
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.github_rate_limiter = GithubRateLimiter
+
+        cls.server = LocalServer.start(_RateLimitHandler)
+        cls.url = LocalServer.get_url(cls.server) + 'repos/mozilla/geckodriver/releases'
+
+        cls.cache_path = tempfile.mkdtemp() + os.path.sep
+        cls.old_cache_setting = copy.deepcopy(setting["MetadataCache"])
+        cls.old_github_setting = copy.deepcopy(setting["Github"])
+        setting["MetadataCache"]["Path"] = cls.cache_path
+        setting["MetadataCache"]["Enabled"] = True
+
+    @classmethod
+    def tearDownClass(cls):
+        LocalServer.stop(cls.server)
+        setting["MetadataCache"].update(cls.old_cache_setting)
+        setting["Github"].update(cls.old_github_setting)
+        GithubRateLimiter._state = None
+        shutil.rmtree(cls.cache_path, ignore_errors=True)
+
+    def setUp(self):
+        setting["Github"]["Token"] = 'secret'
+        setting["Github"]["MaxWait"] = 60
+        setting["Github"]["SpreadBelow"] = 10
+        GithubRateLimiter._state = None
+        GithubRateLimiter._last_call = 0.0
+        _RateLimitHandler.authorization.clear()
+        shutil.rmtree(self.cache_path, ignore_errors=True)
+        self.start_time : float = time.time()
+
+    def tearDown(self):
+        end_time = time.time() - self.start_time
+        print("%.3f" % end_time)
+
+    #@unittest.skip('Temporary not needed')
+    def test01_check_token_is_sent_only_to_github_api(self):
+        self.assertTrue(self.github_rate_limiter.is_github_api('https://api.github.com/repos/mozilla/geckodriver/releases'))
+        self.assertFalse(self.github_rate_limiter.is_github_api('https://github.com/mozilla/geckodriver/releases'))
+        self.assertFalse(self.github_rate_limiter.is_github_api('https://api.github.com.mirror.example/repos/'))
+        self.assertEqual(self.github_rate_limiter.get_headers(), {'Authorization': 'Bearer secret'})
+
+        RequestsGetter.get_result_by_request(url=self.url, use_cache=False)
+        self.assertEqual(_RateLimitHandler.authorization, [None])
+
+        setting["Github"]["Token"] = ''
+        self.assertEqual(self.github_rate_limiter.get_headers(), {})
+
+    #@unittest.skip('Temporary not needed')
+    def test02_check_rate_limit_is_kept_in_metadata_cache(self):
+        self.assertEqual(self.github_rate_limiter.get_remaining(), -1)
+
+        self.github_rate_limiter.update({'X-RateLimit-Remaining': '42', 'X-RateLimit-Reset': str(time.time() + 3600), 'X-RateLimit-Limit': '5000'})
+
+        GithubRateLimiter._state = None
+        self.assertEqual(self.github_rate_limiter.get_remaining(), 42)
+
+        setting["Github"]["Token"] = ''
+        GithubRateLimiter._state = None
+        self.assertEqual(self.github_rate_limiter.get_remaining(), -1) #anonymous limit is stored separately
+
+    #@unittest.skip('Temporary not needed')
+    def test03_check_acquire_waits_for_reset_when_limit_is_exhausted(self):
+        self.github_rate_limiter.update({'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': str(time.time() + 0.5)})
+
+        start_time = time.time()
+        self.github_rate_limiter.acquire()
+        self.assertGreaterEqual(time.time() - start_time, 0.4)
+
+        self.github_rate_limiter.update({'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': str(time.time() + 3600)})
+
+        start_time = time.time()
+        self.github_rate_limiter.acquire()
+        self.assertLess(time.time() - start_time, 0.1) #reset is too far away, request fails fast and falls back to site
+
+    #@unittest.skip('Temporary not needed')
+    def test04_check_acquire_spreads_calls_when_few_requests_are_left(self):
+        self.github_rate_limiter.update({'X-RateLimit-Remaining': '4', 'X-RateLimit-Reset': str(time.time() + 1.2)})
+
+        start_time = time.time()
+        for _ in range(3):
+            self.github_rate_limiter.acquire()
+        self.assertGreaterEqual(time.time() - start_time, 0.4)
+
+        self.github_rate_limiter.update({'X-RateLimit-Remaining': '4000', 'X-RateLimit-Reset': str(time.time() + 3600)})
+
+        start_time = time.time()
+        for _ in range(3):
+            self.github_rate_limiter.acquire()
+        self.assertLess(time.time() - start_time, 0.1)
+
+    #@unittest.skip('Temporary not needed')
+    def test05_check_concurrent_callers_get_separate_slots_without_blocking(self):
+        self.github_rate_limiter.update({'X-RateLimit-Remaining': '4', 'X-RateLimit-Reset': str(time.time() + 1.2)})
+
+        start_time = time.time()
+        finish_times = []
+
+        def call():
+            self.github_rate_limiter.acquire()
+            finish_times.append(time.time() - start_time)
+
+        threads = [threading.Thread(target=call) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+
+        time.sleep(0.1)
+
+        check_time = time.time()
+        self.assertEqual(self.github_rate_limiter.get_remaining(), 1) #every caller took one request from the budget
+        self.assertLess(time.time() - check_time, 0.05) #waiting callers do not hold the lock
+
+        for thread in threads:
+            thread.join()
+
+        finish_times.sort()
+        self.assertLess(finish_times[0], 0.1)
+        self.assertGreaterEqual(finish_times[1], 0.3)
+        self.assertGreaterEqual(finish_times[2] - finish_times[1], 0.3)
+
+    #@unittest.skip('Temporary not needed')
+    def test06_check_waits_of_one_install_share_max_wait(self):
+        setting["Github"]["MaxWait"] = 0.5
+        self.github_rate_limiter.update({'X-RateLimit-Remaining': '2', 'X-RateLimit-Reset': str(time.time() + 10)})
+
+        start_time = time.time()
+
+        with ResolutionContext() as context:
+            for _ in range(3):
+                self.github_rate_limiter.acquire()
+
+        self.assertLess(time.time() - start_time, 1)
+        self.assertLessEqual(context.waited, 0.5)
+        self.assertGreater(context.waited, 0.4)
+
+    #@unittest.skip('Temporary not needed')
+    def test07_check_conditional_requests_are_not_taken_from_budget(self):
+        self.github_rate_limiter.update({'X-RateLimit-Remaining': '4', 'X-RateLimit-Reset': str(time.time() + 10)})
+
+        start_time = time.time()
+        for _ in range(3):
+            self.github_rate_limiter.acquire(conditional=True)
+
+        self.assertLess(time.time() - start_time, 0.1)
+        self.assertEqual(self.github_rate_limiter.get_remaining(), 4)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2, failfast=True, exit=False)
@@ -6,6 +6,10 @@ import json
 from pathlib import Path
 from typing import Any
 import logging
+import tempfile
+import shutil
+import copy
+from urllib.parse import urlparse, parse_qs
 
 import sys
 import os.path
@@ -13,7 +17,9 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir, os.path.pardir)))
 
 # Local imports
+from selenium_driver_updater.test.localServer import LocalServer, QuietBaseHandler
 from selenium_driver_updater.util.github_viewer import GithubViewer
+from selenium_driver_updater.util.resolution_context import ResolutionContext
 
 from selenium_driver_updater._setting import setting
 
@@ -21,6 +27,34 @@ logging.basicConfig(level=logging.INFO)
 
 from selenium_driver_updater.util.exceptions import StatusCodeNotEqualException
 
+RELEASES = [dict(name=f'0.{i}.0', tag_name=f'v0.{i}.0', assets=[dict(name=f'geckodriver-v0.{i}.0-linux64.tar.gz')]) for i in range(250, 0, -1)]
+
+class _ReleasesHandler(QuietBaseHandler):
+    """Handler that serves paginated releases like github api and answers 304 to matching ETag"""
+
+    not_modified = 0
+
+    def do_GET(self): # pylint: disable=invalid-name
+        query = parse_qs(urlparse(self.path).query)
+        page = int(query.get('page', ['1'])[0])
+        per_page = min(int(query.get('per_page', ['30'])[0]), 100)
+
+        etag = f'"page-{page}-{len(RELEASES)}"'
+
+        if self.headers.get('If-None-Match') == etag:
+            _ReleasesHandler.not_modified += 1
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        body = json.dumps(RELEASES[(page - 1) * per_page:page * per_page]).encode('utf-8')
+
+        self.send_response(200)
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
 # pylint: disable=missing-function-docstring
 class testGithubViewer(unittest.TestCase): 
     """Class for unit-testing GithubViewer class
@@ -106,6 +140,96 @@ class testGithubViewer(unittest.TestCase):
 
         self.assertEqual(version_api, version_site, f'version_api: {version_api} is not equal to version_site: {version_site}')
 
+    #@unittest.skip('Temporary not needed')
+    def test07_check_paginated_releases_index_and_etag_revalidation(self):
+        server = LocalServer.start(_ReleasesHandler)
+
+        cache_path = tempfile.mkdtemp() + os.path.sep
+        old_cache_setting = copy.deepcopy(setting["MetadataCache"])
+        old_link = setting["Github"]["linkAllReleases"]
+
+        setting["MetadataCache"]["Path"] = cache_path
+        setting["MetadataCache"]["Enabled"] = True
+        setting["MetadataCache"]["TTL"] = {}
+        setting["Github"]["linkAllReleases"] = LocalServer.get_url(server) + 'repos/{}/releases?per_page=100'
+        GithubViewer._indexes.clear()
+
+        try:
+
+            with ResolutionContext() as context:
+                releases = self.github_viewer.get_all_releases_data_by_repo_name(repo_name=self.repo_name)
+
+            self.assertEqual(len(releases), 250)
+            self.assertEqual(releases[-1].get('name'), '0.1.0')
+            self.assertEqual(context.network_calls, 5)
+
+            self.assertTrue(self.github_viewer.is_release_asset_available(self.repo_name, '0.1.0', 'geckodriver-v0.1.0-linux64.tar.gz'))
+            self.assertEqual(_ReleasesHandler.not_modified, 5) #index is built from pages revalidated by ETag
+
+            self.assertTrue(self.github_viewer.is_release_asset_available(self.repo_name, 'v0.1.0', 'geckodriver-v0.1.0-linux64.tar.gz'))
+            self.assertFalse(self.github_viewer.is_release_asset_available(self.repo_name, '0.1.0', 'geckodriver-v0.1.0-win64.zip'))
+
+            GithubViewer._indexes.clear()
+            not_modified = _ReleasesHandler.not_modified
+
+            releases = self.github_viewer.get_all_releases_data_by_repo_name(repo_name=self.repo_name)
+
+            self.assertEqual(len(releases), 250)
+            self.assertEqual(_ReleasesHandler.not_modified, not_modified + 5)
+
+        finally:
+            setting["MetadataCache"].clear()
+            setting["MetadataCache"].update(old_cache_setting)
+            setting["Github"]["linkAllReleases"] = old_link
+            GithubViewer._indexes.clear()
+            LocalServer.stop(server)
+            shutil.rmtree(cache_path, ignore_errors=True)
+
+    #@unittest.skip('Temporary not needed')
+    def test08_check_index_is_rebuilt_for_new_release(self):
+        server = LocalServer.start(_ReleasesHandler)
+
+        cache_path = tempfile.mkdtemp() + os.path.sep
+        old_cache_setting = copy.deepcopy(setting["MetadataCache"])
+        old_link = setting["Github"]["linkAllReleases"]
+
+        setting["MetadataCache"]["Path"] = cache_path
+        setting["MetadataCache"]["Enabled"] = True
+        setting["MetadataCache"]["TTL"] = {'127.0.0.1': 3600}
+        setting["Github"]["linkAllReleases"] = LocalServer.get_url(server) + 'repos/{}/releases?per_page=100'
+        GithubViewer._indexes.clear()
+
+        new_release = dict(name='0.251.0', tag_name='v0.251.0', assets=[dict(name='geckodriver-v0.251.0-linux64.tar.gz')])
+
+        try:
+
+            self.assertTrue(self.github_viewer.is_release_asset_available(self.repo_name, '0.250.0', 'geckodriver-v0.250.0-linux64.tar.gz'))
+
+            RELEASES.insert(0, new_release)
+
+            with ResolutionContext() as context:
+                self.assertTrue(self.github_viewer.is_release_asset_available(self.repo_name, '0.251.0', 'geckodriver-v0.251.0-linux64.tar.gz'))
+                self.assertTrue(self.github_viewer.is_release_asset_available(self.repo_name, 'v0.251.0', 'geckodriver-v0.251.0-linux64.tar.gz'))
+
+            self.assertEqual(context.network_calls, 5) #fresh index was rebuilt once from revalidated pages of the first window
+
+            GithubViewer._indexes.clear()
+
+            with ResolutionContext() as context:
+                self.assertTrue(self.github_viewer.is_release_asset_available(self.repo_name, '0.251.0', 'geckodriver-v0.251.0-linux64.tar.gz'))
+
+            self.assertEqual(context.network_calls, 0) #rebuilt index was saved to metadata cache
+
+        finally:
+            if new_release in RELEASES:
+                RELEASES.remove(new_release)
+            setting["MetadataCache"].clear()
+            setting["MetadataCache"].update(old_cache_setting)
+            setting["Github"]["linkAllReleases"] = old_link
+            GithubViewer._indexes.clear()
+            LocalServer.stop(server)
+            shutil.rmtree(cache_path, ignore_errors=True)
+
 if __name__ == '__main__':
     unittest.main(verbosity=2, failfast=True, exit=False)
     
\ No newline at end of file
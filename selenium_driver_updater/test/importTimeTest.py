@@ -0,0 +1,81 @@
+#Standart library imports
+import unittest
+import time
+import logging
+import subprocess
+import json
+
+import sys
+import os.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir)))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir, os.path.pardir)))
+
+logging.basicConfig(level=logging.INFO)
+
+package_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir, os.path.pardir))
+
+# pylint: disable=missing-function-docstring
+class testImportTime(unittest.TestCase):
+    """Class for unit-testing import cost of selenium_driver_updater package
+
+    Attributes:
+        startTime (float)           : Time of starting unit-tests
+    """
+
+    def setUp(self):
+        self.start_time : float = time.time()
+
+    def tearDown(self):
+        end_time = time.time() - self.start_time
+        print("%.3f" % end_time)
+
+    @staticmethod
+    def run_in_fresh_interpreter(code : str, *args) -> subprocess.CompletedProcess:
+        return subprocess.run([sys.executable, *args, '-c', code], cwd=package_dir,
+                                capture_output=True, text=True, check=True)
+
+    #@unittest.skip('Temporary not needed')
+    def test01_check_heavy_modules_are_not_imported(self):
+        code = ('import sys, json\n'
+                'import selenium_driver_updater\n'
+                'print(json.dumps([name for name in ("selenium", "bs4", "requests", "packaging", "asyncio") if name in sys.modules]))')
+        result = self.run_in_fresh_interpreter(code)
+        self.assertEqual(json.loads(result.stdout), [])
+
+    def get_import_time(self, module_name : str) -> int:
+        """Gets the smallest cumulative import time of the module in microseconds from 3 fresh interpreters"""
+
+        import_times = []
+
+        for _ in range(3):
+
+            result = self.run_in_fresh_interpreter(f'import {module_name}', '-X', 'importtime')
+
+            module_line = [line for line in result.stderr.splitlines() if line.endswith(f'| {module_name}')]
+            self.assertEqual(len(module_line), 1)
+
+            import_times.append(int(module_line[0].split('|')[1]))
+
+        return min(import_times)
+
+    #@unittest.skip('Temporary not needed')
+    def test02_check_import_time(self):
+        package_us = self.get_import_time('selenium_driver_updater')
+        requests_us = self.get_import_time('requests')
+
+        print(f'import selenium_driver_updater: {package_us / 1000:.1f} ms import requests: {requests_us / 1000:.1f} ms')
+
+        #package must be cheaper to import than requests alone, which was imported by it before
+        self.assertLess(package_us, requests_us)
+
+    #@unittest.skip('Temporary not needed')
+    def test03_check_drivers_are_loaded_on_demand(self):
+        code = ('import sys\n'
+                'from selenium_driver_updater.util import ALL_DRIVERS\n'
+                'assert "selenium_driver_updater._chromeDriver" not in sys.modules\n'
+                'print(ALL_DRIVERS["chromedriver"].__name__)')
+        result = self.run_in_fresh_interpreter(code)
+        self.assertEqual(result.stdout.strip(), 'ChromeDriver')
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2, failfast=True, exit=False)
@@ -0,0 +1,146 @@
+#Standart library imports
+import unittest
+import time
+import logging
+import tempfile
+import shutil
+import threading
+import asyncio
+from pathlib import Path
+from unittest import mock
+
+import sys
+import os.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir)))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir, os.path.pardir)))
+
+# Local imports
+from selenium_driver_updater.test.localServer import LocalServer, QuietBaseHandler
+from selenium_driver_updater.driverUpdater import DriverUpdater
+from selenium_driver_updater.util.downloader import Downloader
+from selenium_driver_updater.util.install_manifest import InstallManifest
+from selenium_driver_updater.util.exceptions import InstallCancelledException
+
+logging.basicConfig(level=logging.INFO)
+
+class _SlowHandler(QuietBaseHandler):
+    """Handler that sends big file very slowly"""
+
+    def do_GET(self): # pylint: disable=invalid-name
+        self.send_response(200)
+        self.send_header('Content-Length', str(1024 * 1000))
+        self.end_headers()
+
+        try:
+            for _ in range(1000):
+                self.wfile.write(b'0' * 1024)
+                self.wfile.flush()
+                time.sleep(0.01)
+        except OSError:
+            pass
+
+# pylint: disable=missing-function-docstring
+class testInstallAsync(unittest.TestCase):
+    """Class for unit-testing DriverUpdater.install_async and DriverUpdater.get_driver_version_async
+
+    Attributes:
+        driver_updater              : Initialize class DriverUpdater
+        out_path (str)              : Temporary folder
+        server_url (str)            : Url of local http server which sends files slowly
+        startTime (float)           : Time of starting unit-tests
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.driver_updater = DriverUpdater
+
+        cls.server = LocalServer.start(_SlowHandler)
+        cls.server_url = LocalServer.get_url(cls.server)
+
+    @classmethod
+    def tearDownClass(cls):
+        LocalServer.stop(cls.server)
+
+    def setUp(self):
+        self.out_path = tempfile.mkdtemp() + os.path.sep
+        self.start_time : float = time.time()
+
+    def tearDown(self):
+        shutil.rmtree(self.out_path, ignore_errors=True)
+        end_time = time.time() - self.start_time
+        print("%.3f" % end_time)
+
+    #@unittest.skip('Temporary not needed')
+    def test01_check_install_async_returns_result_of_install(self):
+        with mock.patch.object(DriverUpdater, 'install', return_value=self.out_path + 'chromedriver') as install:
+            driver_path = asyncio.run(self.driver_updater.install_async(DriverUpdater.chromedriver, path=self.out_path))
+
+        self.assertEqual(driver_path, self.out_path + 'chromedriver')
+        install.assert_called_once_with(DriverUpdater.chromedriver, path=self.out_path)
+
+    #@unittest.skip('Temporary not needed')
+    def test02_check_install_async_timeout_stops_install(self):
+        errors = []
+        stopped = threading.Event()
+
+        def slow_install(driver_name, **kwargs): # pylint: disable=unused-argument
+            try:
+                Downloader.download(url=self.server_url + 'archive.zip', out_path=self.out_path + 'archive.zip', chunk_size=1024)
+            except InstallCancelledException as error:
+                errors.append(error)
+            finally:
+                stopped.set()
+
+        with mock.patch.object(DriverUpdater, 'install', side_effect=slow_install):
+            with self.assertRaises(asyncio.TimeoutError):
+                asyncio.run(self.driver_updater.install_async(DriverUpdater.chromedriver, timeout=0.3))
+
+            self.assertTrue(stopped.wait(timeout=5))
+
+        self.assertEqual(len(errors), 1)
+        self.assertLess(time.time() - self.start_time, 5)
+        self.assertEqual(os.listdir(self.out_path), [])
+
+    #@unittest.skip('Temporary not needed')
+    def test03_check_get_driver_version_async(self):
+        driver_path = self.out_path + 'chromedriver'
+
+        self.assertEqual(asyncio.run(self.driver_updater.get_driver_version_async(driver_path)), '')
+
+        Path(driver_path).write_bytes(b'driver')
+        InstallManifest.save(driver_path, '120.0.6099.109')
+        self.assertEqual(asyncio.run(self.driver_updater.get_driver_version_async(driver_path)), '120.0.6099.109')
+
+    @unittest.skipIf(os.name == 'nt', 'Shell script can not be used as driver on Windows')
+    def test04_check_get_driver_version_async_runs_binary(self):
+        driver_path = self.out_path + 'geckodriver'
+
+        Path(driver_path).write_text('#!/bin/sh\necho "geckodriver 0.34.0 (c44f0d09630a 2024-01-02 15:36 +0000)"\n', encoding='utf-8')
+        os.chmod(driver_path, 0o755)
+
+        self.assertEqual(asyncio.run(self.driver_updater.get_driver_version_async(driver_path)), '0.34.0')
+        self.assertEqual(InstallManifest.load(driver_path).get('version'), '0.34.0')
+
+    @unittest.skipIf(os.name == 'nt', 'Shell script can not be used as driver on Windows')
+    def test05_check_install_async_probes_driver_version_before_install(self):
+        driver_path = self.out_path + 'geckodriver'
+
+        Path(driver_path).write_text('#!/bin/sh\necho "geckodriver 0.34.0 (c44f0d09630a 2024-01-02 15:36 +0000)"\n', encoding='utf-8')
+        os.chmod(driver_path, 0o755)
+
+        versions = []
+
+        def install(driver_name, **kwargs): # pylint: disable=unused-argument
+            versions.append(InstallManifest.load(driver_path).get('version'))
+            return driver_path
+
+        with mock.patch.object(DriverUpdater, 'install', side_effect=install):
+            result = asyncio.run(self.driver_updater.install_async([DriverUpdater.geckodriver, DriverUpdater.chromedriver],
+                                                                    path=self.out_path, system_name=['', 'linux64']))
+
+        self.assertEqual(result, driver_path)
+        self.assertEqual(versions, ['0.34.0'])
+        self.assertFalse(Path(self.out_path + '.chromedriver.manifest.json').exists())
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2, failfast=True, exit=False)
@@ -0,0 +1,107 @@
+#Standart library imports
+import unittest
+import time
+import logging
+import tempfile
+import shutil
+import json
+from pathlib import Path
+
+import sys
+import os.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir)))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir, os.path.pardir)))
+
+# Local imports
+from selenium_driver_updater.util.install_manifest import InstallManifest
+from selenium_driver_updater.driver_base import DriverBase
+
+logging.basicConfig(level=logging.INFO)
+
+# pylint: disable=missing-function-docstring
+class testInstallManifest(unittest.TestCase):
+    """Class for unit-testing InstallManifest class
+
+    Attributes:
+        install_manifest            : Initialize class InstallManifest
+        out_path (str)              : Temporary folder with driver binary
+        driver (DriverBase)         : Driver which is located at out_path
+        startTime (float)           : Time of starting unit-tests
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.install_manifest = InstallManifest
+
+    def setUp(self):
+        self.out_path = tempfile.mkdtemp() + os.path.sep
+        self.driver = DriverBase(driver_name='chromedriver', path=self.out_path, filename='', version='')
+        Path(self.driver.driver_path).write_bytes(b'driver')
+
+        self.start_time : float = time.time()
+
+    def tearDown(self):
+        shutil.rmtree(self.out_path, ignore_errors=True)
+        end_time = time.time() - self.start_time
+        print("%.3f" % end_time)
+
+    #@unittest.skip('Temporary not needed')
+    def test01_check_save_and_load_manifest(self):
+        url = 'https://storage.googleapis.com/chrome-for-testing-public/120.0.6099.109/linux64/chromedriver-linux64.zip'
+
+        self.assertTrue(self.install_manifest.save(self.driver.driver_path, '120.0.6099.109', url))
+
+        manifest_path = self.install_manifest.get_path(self.driver.driver_path)
+        self.assertEqual(manifest_path, self.out_path + '.' + os.path.basename(self.driver.driver_path) + '.manifest.json')
+
+        manifest = self.install_manifest.load(self.driver.driver_path)
+        self.assertEqual(manifest['version'], '120.0.6099.109')
+        self.assertEqual(manifest['url'], url)
+        self.assertEqual(manifest['size'], len(b'driver'))
+        self.assertEqual(manifest, json.loads(Path(manifest_path).read_text(encoding='utf-8')))
+
+    #@unittest.skip('Temporary not needed')
+    def test02_check_manifest_is_ignored_after_binary_change(self):
+        self.install_manifest.save(self.driver.driver_path, '120.0.6099.109')
+
+        Path(self.driver.driver_path).write_bytes(b'other driver')
+
+        self.assertEqual(self.install_manifest.load(self.driver.driver_path), {})
+
+    #@unittest.skip('Temporary not needed')
+    def test03_check_current_version_is_read_from_manifest(self):
+        self.driver.installed_url = 'https://github.com/operasoftware/operachromiumdriver/releases/download/v.120.0.6099.200/operadriver_linux64.zip'
+        self.driver._save_install_manifest()
+
+        #binary is not executable, so version could be got only from the manifest
+        self.assertEqual(self.driver._get_current_version_driver(), '120.0.6099.200')
+
+        self.driver._delete_current_driver_for_current_os()
+        self.assertFalse(Path(self.install_manifest.get_path(self.driver.driver_path)).exists())
+
+    @unittest.skipIf(os.name == 'nt', 'Shell script can not be used as driver on Windows')
+    def test04_check_manifest_is_written_after_running_binary(self):
+        Path(self.driver.driver_path).write_text('#!/bin/sh\necho "ChromeDriver 120.0.6099.109 (abc)"\n', encoding='utf-8')
+        os.chmod(self.driver.driver_path, 0o755)
+
+        self.assertEqual(self.driver._get_current_version_driver(), '120.0.6099.109')
+        self.assertEqual(self.install_manifest.load(self.driver.driver_path)['version'], '120.0.6099.109')
+
+    #@unittest.skip('Temporary not needed')
+    def test05_check_fresh_version_only_after_check(self):
+        self.install_manifest.save(self.driver.driver_path, '120.0.6099.109')
+        self.assertEqual(self.install_manifest.get_fresh_version(self.driver.driver_path, 60), '') #version was read, but not checked
+
+        self.assertTrue(self.install_manifest.mark_checked(self.driver.driver_path))
+        self.assertEqual(self.install_manifest.get_fresh_version(self.driver.driver_path, 60), '120.0.6099.109')
+        self.assertEqual(self.install_manifest.get_fresh_version(self.driver.driver_path, 0), '')
+
+        time.sleep(0.2)
+        self.assertEqual(self.install_manifest.get_fresh_version(self.driver.driver_path, 0.1), '')
+
+        Path(self.driver.driver_path).write_bytes(b'other driver')
+        self.assertEqual(self.install_manifest.get_fresh_version(self.driver.driver_path, 60), '')
+        self.assertFalse(self.install_manifest.mark_checked(self.driver.driver_path))
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2, failfast=True, exit=False)
@@ -0,0 +1,58 @@
+#Standart library imports
+import functools
+import threading
+from typing import Optional
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler, SimpleHTTPRequestHandler
+
+class QuietBaseHandler(BaseHTTPRequestHandler):
+    """Base handler of local http servers of unit-tests which does not print every request"""
+
+    def log_message(self, format, *args): # pylint: disable=redefined-builtin
+        pass
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    """Handler which serves files of the folder and does not print every request"""
+
+    def log_message(self, format, *args): # pylint: disable=redefined-builtin
+        pass
+
+class LocalServer():
+    """Class for starting local http servers in unit-tests, so tests do not depend on network"""
+
+    @staticmethod
+    def start(handler, directory : Optional[str] = None) -> ThreadingHTTPServer:
+        """Starts local http server in background thread
+
+        Args:
+            handler         : Class of request handler.
+            directory (str) : Folder served by handler based on SimpleHTTPRequestHandler. Defaults to None.
+
+        Returns:
+            ThreadingHTTPServer
+
+            server (ThreadingHTTPServer) : Started server, must be stopped via LocalServer.stop.
+
+        """
+
+        if directory is not None:
+            handler = functools.partial(handler, directory=directory)
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        server.daemon_threads = True
+
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        return server
+
+    @staticmethod
+    def get_url(server : ThreadingHTTPServer) -> str:
+        """Gets url of local http server like "http://127.0.0.1:8000/" """
+
+        return f'http://127.0.0.1:{server.server_address[1]}/'
+
+    @staticmethod
+    def stop(server : ThreadingHTTPServer) -> None:
+        """Stops local http server and closes its socket"""
+
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,112 @@
+#Standart library imports
+import unittest
+import time
+import logging
+import tempfile
+import shutil
+import copy
+from pathlib import Path
+
+import sys
+import os.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir)))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir, os.path.pardir)))
+
+# Local imports
+from selenium_driver_updater.test.localServer import LocalServer, QuietHandler
+from selenium_driver_updater.util.metadata_cache import MetadataCache
+from selenium_driver_updater.util.requests_getter import RequestsGetter
+from selenium_driver_updater._setting import setting
+
+logging.basicConfig(level=logging.INFO)
+
+# pylint: disable=missing-function-docstring
+class testMetadataCache(unittest.TestCase):
+    """Class for unit-testing MetadataCache class
+
+    Attributes:
+        metadata_cache              : Initialize class MetadataCache
+        requests_getter             : Initialize class RequestsGetter
+        cache_path (str)            : Temporary folder for cache entries
+        server_path (str)           : Temporary folder served by local http server
+        startTime (float)           : Time of starting unit-tests
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.metadata_cache = MetadataCache
+        cls.requests_getter = RequestsGetter
+
+        cls.old_cache_setting = copy.deepcopy(setting["MetadataCache"])
+        cls.cache_path = tempfile.mkdtemp() + os.path.sep
+        setting["MetadataCache"]["Path"] = cls.cache_path
+        setting["MetadataCache"]["Enabled"] = True
+
+        cls.server_path = tempfile.mkdtemp()
+        Path(cls.server_path, 'LATEST_STABLE').write_text('1.2.3', encoding='utf-8')
+
+        cls.server = LocalServer.start(QuietHandler, directory=cls.server_path)
+        cls.server_url = LocalServer.get_url(cls.server)
+
+    @classmethod
+    def tearDownClass(cls):
+        LocalServer.stop(cls.server)
+        setting["MetadataCache"].update(cls.old_cache_setting)
+        shutil.rmtree(cls.cache_path, ignore_errors=True)
+        shutil.rmtree(cls.server_path, ignore_errors=True)
+
+    def setUp(self):
+        self.start_time : float = time.time()
+
+    def tearDown(self):
+        end_time = time.time() - self.start_time
+        print("%.3f" % end_time)
+
+    #@unittest.skip('Temporary not needed')
+    def test01_check_load_missing_entry(self):
+        self.assertIsNone(self.metadata_cache.load('https://example.com/missing'))
+
+    #@unittest.skip('Temporary not needed')
+    def test02_check_save_and_load_entry(self):
+        key = 'https://example.com/LATEST_STABLE'
+        self.metadata_cache.save(key, dict(text='1.0'))
+
+        entry = self.metadata_cache.load(key)
+        self.assertIsNotNone(entry)
+        self.assertEqual(entry['text'], '1.0')
+        self.assertEqual(os.listdir(self.cache_path), [Path(self.metadata_cache._get_entry_path(key)).name]) # pylint: disable=protected-access
+
+    #@unittest.skip('Temporary not needed')
+    def test03_check_get_ttl(self):
+        self.assertEqual(self.metadata_cache.get_ttl('https://example.com/LATEST_STABLE'), setting["MetadataCache"]["TTL"]['LATEST_STABLE'])
+        self.assertEqual(self.metadata_cache.get_ttl('https://example.com/unknown'), setting["MetadataCache"]["DefaultTTL"])
+
+    #@unittest.skip('Temporary not needed')
+    def test04_check_is_fresh(self):
+        self.assertTrue(self.metadata_cache.is_fresh(dict(stored_at=time.time()), 60))
+        self.assertFalse(self.metadata_cache.is_fresh(dict(stored_at=time.time() - 120), 60))
+        self.assertFalse(self.metadata_cache.is_fresh(dict(stored_at=time.time()), 0))
+
+    #@unittest.skip('Temporary not needed')
+    def test05_check_fresh_entry_is_used_without_request(self):
+        url = self.server_url + 'not_existing/LATEST_STABLE'
+        self.metadata_cache.save(url, dict(text='9.9.9'))
+
+        self.assertEqual(self.requests_getter.get_result_by_request(url=url), '9.9.9')
+
+    #@unittest.skip('Temporary not needed')
+    def test06_check_stale_entry_is_revalidated(self):
+        url = self.server_url + 'LATEST_STABLE'
+        setting["MetadataCache"]["TTL"]['LATEST_STABLE'] = 0
+
+        self.assertEqual(self.requests_getter.get_result_by_request(url=url), '1.2.3')
+
+        entry = self.metadata_cache.load(url)
+        self.assertTrue(entry['last_modified'])
+        entry['text'] = 'from cache'
+        self.metadata_cache.save(url, entry)
+
+        self.assertEqual(self.requests_getter.get_result_by_request(url=url), 'from cache')
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2, failfast=True, exit=False)
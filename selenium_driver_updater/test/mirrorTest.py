@@ -0,0 +1,172 @@
+#Standart library imports
+import unittest
+import time
+import logging
+import tempfile
+import shutil
+import threading
+import copy
+from pathlib import Path
+
+import sys
+import os.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir)))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir, os.path.pardir)))
+
+# Local imports
+from selenium_driver_updater.test.localServer import LocalServer, QuietHandler
+from selenium_driver_updater.util.mirror import Mirror
+from selenium_driver_updater.util.requests_getter import RequestsGetter
+from selenium_driver_updater.util.downloader import Downloader
+from selenium_driver_updater.util.exceptions import StatusCodeNotEqualException
+from selenium_driver_updater._setting import setting
+
+logging.basicConfig(level=logging.INFO)
+
+# pylint: disable=missing-function-docstring
+class testMirror(unittest.TestCase):
+    """Class for unit-testing Mirror class
+
+    Attributes:
+        mirror                      : Initialize class Mirror
+        upstream_path (str)         : Temporary folder served by local http server as upstream
+        mirror_path (str)           : Temporary folder of the mirror
+        content (bytes)             : Content of the test archive
+        startTime (float)           : Time of starting unit-tests
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.mirror = Mirror
+        cls.old_setting = copy.deepcopy({key: setting[key] for key in ('Mirror', 'MetadataCache')})
+        setting["MetadataCache"]["Enabled"] = False
+
+        cls.content = os.urandom(1024 * 100)
+        cls.upstream_path = tempfile.mkdtemp()
+        Path(cls.upstream_path, 'archive.zip').write_bytes(cls.content)
+        Path(cls.upstream_path, 'LATEST_RELEASE').write_text('120.0.6099.109', encoding='utf-8')
+
+        cls.upstream_server = LocalServer.start(QuietHandler, directory=cls.upstream_path)
+        cls.upstream_url = LocalServer.get_url(cls.upstream_server)
+
+    @classmethod
+    def tearDownClass(cls):
+        LocalServer.stop(cls.upstream_server)
+        shutil.rmtree(cls.upstream_path, ignore_errors=True)
+        for key, value in cls.old_setting.items():
+            setting[key].update(value)
+
+    def setUp(self):
+        self.mirror_path = tempfile.mkdtemp() + os.path.sep
+        self.out_path = tempfile.mkdtemp() + os.path.sep
+        self.start_time : float = time.time()
+
+    def tearDown(self):
+        setting["Mirror"].update(BaseUrl='', SyncPath='')
+        shutil.rmtree(self.mirror_path, ignore_errors=True)
+        shutil.rmtree(self.out_path, ignore_errors=True)
+        end_time = time.time() - self.start_time
+        print("%.3f" % end_time)
+
+    def sync(self):
+        setting["Mirror"]["SyncPath"] = self.mirror_path
+
+        latest_version = RequestsGetter.get_result_by_request(url=self.upstream_url + 'LATEST_RELEASE')
+        Downloader.download(url=self.upstream_url + 'archive.zip', out_path=self.out_path + 'archive.zip')
+
+        setting["Mirror"]["SyncPath"] = ''
+        shutil.rmtree(self.out_path, ignore_errors=True)
+
+        return latest_version
+
+    #@unittest.skip('Temporary not needed')
+    def test01_check_get_relative_path(self):
+        self.assertEqual(self.mirror.get_relative_path('https://storage.googleapis.com/chrome-for-testing-public/120.0.6099.109/linux64/chromedriver-linux64.zip'),
+                        'storage.googleapis.com/chrome-for-testing-public/120.0.6099.109/linux64/chromedriver-linux64.zip')
+        self.assertEqual(self.mirror.get_relative_path('https://github.com/mozilla/geckodriver/releases'), 'github.com/mozilla/geckodriver/releases/index.html')
+        self.assertEqual(self.mirror.get_relative_path('https://get.geo.opera.com/pub/opera/desktop/'), 'get.geo.opera.com/pub/opera/desktop/index.html')
+        self.assertEqual(self.mirror.get_relative_path('https://go.microsoft.com/fwlink/?linkid=2069148&platform=Mac'),
+                        'go.microsoft.com/fwlink/index.html_linkid_2069148_platform_Mac')
+
+    #@unittest.skip('Temporary not needed')
+    def test02_check_sync_and_install_from_folder(self):
+        latest_version = self.sync()
+
+        self.assertIn(self.upstream_url + 'LATEST_RELEASE', self.mirror.get_recorded())
+        self.assertIn(self.upstream_url + 'archive.zip', self.mirror.get_recorded())
+
+        setting["Mirror"]["BaseUrl"] = self.mirror_path
+
+        self.assertTrue(self.mirror.rewrite_url(self.upstream_url + 'archive.zip').startswith('file://'))
+        self.assertEqual(RequestsGetter.get_result_by_request(url=self.upstream_url + 'LATEST_RELEASE'), latest_version)
+
+        archive_path = Downloader.download(url=self.upstream_url + 'archive.zip', out_path=self.out_path + 'archive.zip')
+        self.assertEqual(Path(archive_path).read_bytes(), self.content)
+
+        with self.assertRaises(StatusCodeNotEqualException):
+            RequestsGetter.get_result_by_request(url=self.upstream_url + 'missing.json')
+
+    #@unittest.skip('Temporary not needed')
+    def test03_check_install_from_http_mirror(self):
+        latest_version = self.sync()
+
+        mirror_server = LocalServer.start(QuietHandler, directory=self.mirror_path)
+
+        try:
+
+            setting["Mirror"]["BaseUrl"] = LocalServer.get_url(mirror_server)
+
+            self.assertEqual(RequestsGetter.get_result_by_request(url=self.upstream_url + 'LATEST_RELEASE'), latest_version)
+
+            archive_path = Downloader.download(url=self.upstream_url + 'archive.zip', out_path=self.out_path + 'archive.zip')
+            self.assertEqual(Path(archive_path).read_bytes(), self.content)
+
+        finally:
+
+            LocalServer.stop(mirror_server)
+
+    #@unittest.skip('Temporary not needed')
+    def test04_check_sync_to_does_not_change_global_setting(self):
+        recording = []
+
+        with self.mirror.sync_to(self.mirror_path):
+
+            thread = threading.Thread(target=lambda: recording.append(self.mirror.is_recording()))
+            thread.start()
+            thread.join()
+
+            self.assertTrue(self.mirror.is_recording())
+            self.assertEqual(setting["Mirror"]["SyncPath"], '')
+
+            RequestsGetter.get_result_by_request(url=self.upstream_url + 'LATEST_RELEASE')
+
+        self.assertEqual(recording, [False])
+        self.assertFalse(self.mirror.is_recording())
+        self.assertTrue(Path(self.mirror_path, self.mirror.get_relative_path(self.upstream_url + 'LATEST_RELEASE')).exists())
+
+    #@unittest.skip('Temporary not needed')
+    def test05_check_sync_to_returns_only_its_own_urls(self):
+        results = {}
+
+        def sync(name):
+            with self.mirror.sync_to(self.mirror_path + name) as recorded:
+                RequestsGetter.get_result_by_request(url=self.upstream_url + name)
+                results[name] = (recorded, self.mirror.get_recorded())
+
+        threads = [threading.Thread(target=sync, args=(name,)) for name in ['LATEST_RELEASE', 'archive.zip']]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for name, (recorded, recorded_in_block) in results.items():
+            self.assertEqual(recorded, [self.upstream_url + name])
+            self.assertEqual(recorded_in_block, [self.upstream_url + name])
+
+        with self.mirror.sync_to(self.mirror_path) as recorded:
+            self.assertEqual(self.mirror.get_recorded(), [])
+
+        self.assertEqual(recorded, [])
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2, failfast=True, exit=False)
@@ -0,0 +1,187 @@
+#pylint: disable=protected-access
+#Standart library imports
+import unittest
+import time
+import logging
+import tempfile
+import shutil
+import copy
+import platform
+
+import sys
+import os.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir)))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir, os.path.pardir)))
+
+# Local imports
+from selenium_driver_updater.test.localServer import LocalServer, QuietBaseHandler
+from selenium_driver_updater.util.release_prober import ReleaseProber
+from selenium_driver_updater.util.requests_getter import RequestsGetter
+from selenium_driver_updater.util.resolution_context import ResolutionContext
+from selenium_driver_updater.browsers._operaBrowser import OperaBrowser
+from selenium_driver_updater._setting import setting
+
+logging.basicConfig(level=logging.INFO)
+
+RELEASES = [f'100.0.{i}.0' for i in range(40)]
+
+class _ListingHandler(QuietBaseHandler):
+    """Handler that serves fake opera listing, only 10 oldest releases and releases from linux_releases have linux folder"""
+
+    failing_releases : set = set()
+    linux_releases : set = set()
+
+    def do_GET(self): # pylint: disable=invalid-name
+        time.sleep(0.05)
+
+        release = self.path.strip('/').split('/')[-1]
+
+        if release in self.failing_releases:
+            self.send_response(503)
+            self.end_headers()
+            return
+
+        if release in self.linux_releases:
+            folders = ['linux', 'mac', 'win']
+        elif self.path.rstrip('/').endswith('desktop'):
+            folders = RELEASES
+        elif release in RELEASES:
+            folders = ['mac', 'win'] + (['linux'] if RELEASES.index(release) < 10 else [])
+        else:
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        body = ''.join(f'<a href="{folder}/">{folder}/</a>\n' for folder in folders).encode('utf-8')
+
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+# pylint: disable=missing-function-docstring
+class testReleaseProber(unittest.TestCase):
+    """Class for unit-testing ReleaseProber class
+
+    Attributes:
+        release_prober              : Initialize class ReleaseProber
+        url (str)                   : Url of fake opera listing served by local http server
+        startTime (float)           : Time of starting unit-tests
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.release_prober = ReleaseProber
+
+        cls.server = LocalServer.start(_ListingHandler)
+        cls.url = LocalServer.get_url(cls.server) + 'pub/opera/desktop/'
+
+        cls.cache_path = tempfile.mkdtemp() + os.path.sep
+        cls.old_cache_setting = copy.deepcopy(setting["MetadataCache"])
+        setting["MetadataCache"]["Path"] = cls.cache_path
+        setting["MetadataCache"]["Enabled"] = True
+        setting["MetadataCache"]["TTL"] = dict(setting["MetadataCache"]["TTL"], **{'127.0.0.1': 3600})
+
+    @classmethod
+    def tearDownClass(cls):
+        LocalServer.stop(cls.server)
+        setting["MetadataCache"].update(cls.old_cache_setting)
+        shutil.rmtree(cls.cache_path, ignore_errors=True)
+
+    def setUp(self):
+        ReleaseProber._indexes.clear()
+        _ListingHandler.failing_releases.clear()
+        _ListingHandler.linux_releases.clear()
+        shutil.rmtree(self.cache_path, ignore_errors=True)
+        self.start_time : float = time.time()
+
+    def tearDown(self):
+        end_time = time.time() - self.start_time
+        print("%.3f" % end_time)
+
+    #@unittest.skip('Temporary not needed')
+    def test01_check_get_latest_release_is_faster_than_sequential_probe(self):
+        releases = list(reversed(RELEASES))
+
+        start_time = time.time()
+        sequential_release = ''
+        for release in releases:
+            if 'linux/' in RequestsGetter.get_result_by_request(url=self.url + release + '/', use_cache=False):
+                sequential_release = release
+                break
+        sequential_time = time.time() - start_time
+
+        start_time = time.time()
+        release = self.release_prober.get_latest_release(url=self.url, releases=releases, platform='linux', window_size=8)
+        parallel_time = time.time() - start_time
+
+        print(f'sequential probe: {sequential_time:.3f}s parallel probe: {parallel_time:.3f}s')
+
+        self.assertEqual(release, '100.0.9.0')
+        self.assertEqual(release, sequential_release)
+        self.assertLess(parallel_time, sequential_time / 2)
+
+    #@unittest.skip('Temporary not needed')
+    def test02_check_probed_releases_are_taken_from_index(self):
+        releases = list(reversed(RELEASES))
+
+        self.release_prober.get_latest_release(url=self.url, releases=releases, platform='linux')
+
+        ReleaseProber._indexes.clear()
+
+        with ResolutionContext() as context:
+            release = self.release_prober.get_latest_release(url=self.url, releases=releases, platform='linux')
+
+        self.assertEqual(release, '100.0.9.0')
+        self.assertEqual(context.network_calls, 1) #only the newest release is probed again
+
+    #@unittest.skip('Temporary not needed')
+    def test03_check_get_latest_release_without_platform(self):
+        release = self.release_prober.get_latest_release(url=self.url, releases=list(reversed(RELEASES)), platform='freebsd')
+        self.assertEqual(release, '')
+
+    #@unittest.skip('Temporary not needed')
+    def test04_check_opera_browser_uses_release_prober(self):
+        opera_setting = dict(setting, OperaBrowser=dict(setting["OperaBrowser"], LinkAllLatestRelease=self.url))
+        opera_browser = OperaBrowser(path=self.cache_path + 'operadriver', setting=opera_setting)
+
+        system_name = platform.system().replace('Darwin', 'mac').replace('Windows', 'win').lower()
+
+        latest_version = opera_browser._get_latest_version_opera_browser()
+
+        self.assertEqual(latest_version, '100.0.9.0' if system_name == 'linux' else '100.0.39.0')
+        self.assertEqual(opera_browser.url_release, self.url + latest_version + '/')
+
+    #@unittest.skip('Temporary not needed')
+    def test05_check_releases_without_platform_are_probed_again_after_ttl(self):
+        releases = list(reversed(RELEASES))
+
+        self.release_prober.get_latest_release(url=self.url, releases=releases, platform='linux')
+
+        #linux folder was uploaded to the release after it was probed
+        _ListingHandler.linux_releases.add('100.0.20.0')
+
+        self.assertEqual(self.release_prober.get_latest_release(url=self.url, releases=releases, platform='linux'), '100.0.9.0')
+
+        for entry in ReleaseProber._indexes[self.url].values():
+            entry['probed_at'] -= 7200
+
+        with ResolutionContext() as context:
+            release = self.release_prober.get_latest_release(url=self.url, releases=releases, platform='linux')
+
+        self.assertEqual(release, '100.0.20.0')
+        self.assertEqual(context.network_calls, 24) #3 windows of 8 releases without linux folder
+
+    #@unittest.skip('Temporary not needed')
+    def test06_check_probe_error_is_raised(self):
+        releases = list(reversed(RELEASES))
+
+        _ListingHandler.failing_releases.add(releases[0])
+
+        with self.assertRaises(Exception):
+            self.release_prober.get_latest_release(url=self.url, releases=releases, platform='linux')
+
+        self.assertNotIn(releases[1], ReleaseProber._indexes[self.url])
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2, failfast=True, exit=False)
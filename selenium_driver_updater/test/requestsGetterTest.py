@@ -52,6 +52,12 @@ class testRequestsGetter(unittest.TestCase):
         json_data = self.requests_getter.get_result_by_request(url=url)
         self.assertGreaterEqual(len(json_data), 0, len(json_data))
 
+    #@unittest.skip('Temporary not needed')
+    def test03_check_get_session_is_shared(self):
+        session = self.requests_getter.get_session()
+        self.assertIs(session, self.requests_getter.get_session())
+        self.assertEqual(session.get_adapter('https://example.com').max_retries.total, self.setting["Requests"]["Retries"])
+
 if __name__ == '__main__':
     unittest.main(verbosity=2, failfast=True, exit=False)
     
\ No newline at end of file
@@ -0,0 +1,128 @@
+#Standart library imports
+import unittest
+import time
+import logging
+import tempfile
+import shutil
+import threading
+import copy
+from pathlib import Path
+
+import sys
+import os.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir)))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir, os.path.pardir)))
+
+# Local imports
+from selenium_driver_updater.test.localServer import LocalServer, QuietHandler
+from selenium_driver_updater.util.resolution_context import ResolutionContext
+from selenium_driver_updater.util.requests_getter import RequestsGetter
+from selenium_driver_updater.util.downloader import Downloader
+from selenium_driver_updater._setting import setting
+
+logging.basicConfig(level=logging.INFO)
+
+class _CountingHandler(QuietHandler):
+    """Handler that counts all requests it served"""
+
+    hits = 0
+
+    def do_GET(self): # pylint: disable=invalid-name
+        _CountingHandler.hits += 1
+        super().do_GET()
+
+# pylint: disable=missing-function-docstring
+class testResolutionContext(unittest.TestCase):
+    """Class for unit-testing ResolutionContext class
+
+    Attributes:
+        server_path (str)           : Temporary folder served by local http server
+        server_url (str)            : Url of local http server
+        startTime (float)           : Time of starting unit-tests
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.old_cache_setting = copy.deepcopy(setting["MetadataCache"])
+        setting["MetadataCache"]["Enabled"] = False
+
+        cls.server_path = tempfile.mkdtemp()
+        Path(cls.server_path, 'LATEST_RELEASE').write_text('120.0.6099.109', encoding='utf-8')
+        Path(cls.server_path, 'archive.zip').write_bytes(os.urandom(1024))
+
+        cls.server = LocalServer.start(_CountingHandler, directory=cls.server_path)
+        cls.server_url = LocalServer.get_url(cls.server)
+
+    @classmethod
+    def tearDownClass(cls):
+        LocalServer.stop(cls.server)
+        shutil.rmtree(cls.server_path, ignore_errors=True)
+        setting["MetadataCache"].update(cls.old_cache_setting)
+
+    def setUp(self):
+        _CountingHandler.hits = 0
+        self.start_time : float = time.time()
+
+    def tearDown(self):
+        end_time = time.time() - self.start_time
+        print("%.3f" % end_time)
+
+    #@unittest.skip('Temporary not needed')
+    def test01_check_answers_are_remembered_inside_context(self):
+        url = self.server_url + 'LATEST_RELEASE'
+
+        with ResolutionContext() as context:
+            self.assertIs(ResolutionContext.get_current(), context)
+
+            for _ in range(4):
+                self.assertEqual(RequestsGetter.get_result_by_request(url=url), '120.0.6099.109')
+
+        self.assertIsNone(ResolutionContext.get_current())
+        self.assertEqual(context.network_calls, 1)
+        self.assertEqual(_CountingHandler.hits, 1)
+
+    #@unittest.skip('Temporary not needed')
+    def test02_check_answers_are_not_remembered_outside_context(self):
+        url = self.server_url + 'LATEST_RELEASE'
+
+        RequestsGetter.get_result_by_request(url=url)
+        RequestsGetter.get_result_by_request(url=url)
+
+        with ResolutionContext() as context:
+            RequestsGetter.get_result_by_request(url=url)
+
+        self.assertEqual(context.network_calls, 1)
+        self.assertEqual(_CountingHandler.hits, 3)
+
+    #@unittest.skip('Temporary not needed')
+    def test03_check_downloads_are_counted(self):
+        out_path = tempfile.mkdtemp() + os.path.sep
+
+        try:
+            with ResolutionContext() as context:
+                RequestsGetter.get_result_by_request(url=self.server_url + 'LATEST_RELEASE')
+                Downloader.download(url=self.server_url + 'archive.zip', out_path=out_path + 'archive.zip')
+        finally:
+            shutil.rmtree(out_path, ignore_errors=True)
+
+        self.assertEqual(context.network_calls, 2)
+
+    #@unittest.skip('Temporary not needed')
+    def test04_check_contexts_of_threads_are_separate(self):
+        network_calls = []
+
+        def install():
+            with ResolutionContext() as context:
+                RequestsGetter.get_result_by_request(url=self.server_url + 'LATEST_RELEASE')
+            network_calls.append(context.network_calls)
+
+        threads = [threading.Thread(target=install) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(network_calls, [1, 1, 1])
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2, failfast=True, exit=False)
@@ -13,6 +13,8 @@ from selenium_driver_updater._setting import info
 #pylint: disable=invalid-name
 base_dir = os.path.dirname(os.path.abspath(__file__))[:-5] + os.path.sep
 
+cache_dir = os.environ.get('SELENIUM_DRIVER_UPDATER_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'selenium-driver-updater')) + os.path.sep
+
 os_bit = platform.architecture()[0][:-3]
 os_bit_phantom_js = 'x86_64' if os_bit == '64' else "i686"
 
@@ -127,26 +129,33 @@ class testSetting(unittest.TestCase):
 
     #@unittest.skip('Temporary not needed')
     def test01_check_count_main_param(self):
-        self.assertEqual(len(self.setting), 14)
+        self.assertEqual(len(self.setting), 21)
 
     #@unittest.skip('Temporary not needed')
     def test02_check_count_params(self):
         self.assertEqual(len(self.setting["Program"]), 5)
-        self.assertEqual(len(self.setting["ChromeDriver"]), 5)
+        self.assertEqual(len(self.setting["ChromeDriver"]), 6)
         self.assertEqual(len(self.setting["GeckoDriver"]), 2)
         self.assertEqual(len(self.setting["OperaDriver"]), 2)
         self.assertEqual(len(self.setting["EdgeDriver"]), 5)
         self.assertEqual(len(self.setting["PhantomJS"]), 3)
         self.assertEqual(len(self.setting["SafariDriver"]), 2)
 
-        self.assertEqual(len(self.setting["ChromeBrowser"]), 3)
-        self.assertEqual(len(self.setting["FirefoxBrowser"]), 3)
-        self.assertEqual(len(self.setting["EdgeBrowser"]), 3)
-        self.assertEqual(len(self.setting["OperaBrowser"]), 2)
+        self.assertEqual(len(self.setting["ChromeBrowser"]), 5)
+        self.assertEqual(len(self.setting["FirefoxBrowser"]), 5)
+        self.assertEqual(len(self.setting["EdgeBrowser"]), 4)
+        self.assertEqual(len(self.setting["OperaBrowser"]), 4)
 
         self.assertEqual(len(self.setting["JsonSchema"]), 3)
-        self.assertEqual(len(self.setting["Github"]), 3)
-        self.assertEqual(len(self.setting["PyPi"]), 1)
+        self.assertEqual(len(self.setting["Github"]), 6)
+        self.assertEqual(len(self.setting["PyPi"]), 2)
+        self.assertEqual(len(self.setting["Requests"]), 6)
+        self.assertEqual(len(self.setting["Downloader"]), 5)
+        self.assertEqual(len(self.setting["ArtifactStore"]), 3)
+        self.assertEqual(len(self.setting["MetadataCache"]), 4)
+        self.assertEqual(len(self.setting["Mirror"]), 2)
+        self.assertEqual(len(self.setting["FileLock"]), 2)
+        self.assertEqual(len(self.setting["Freshness"]), 1)
 
     #@unittest.skip('Temporary not needed')
     def test03_check_values_params(self):
@@ -162,6 +171,7 @@ class testSetting(unittest.TestCase):
         self.assertEqual(self.setting["ChromeDriver"]["LastReleasePlatform"], 'chromedriver')
         self.assertEqual(self.setting["ChromeDriver"]["LinkLatestReleaseSpecificVersion"], "https://googlechromelabs.github.io/chrome-for-testing/LATEST_RELEASE_{}")
         self.assertEqual(self.setting["ChromeDriver"]["LinkCheckVersionIsValid"], "https://googlechromelabs.github.io/chrome-for-testing/known-good-versions-with-downloads.json")
+        self.assertEqual(self.setting["ChromeDriver"]["LinkVersionDownloads"], "https://googlechromelabs.github.io/chrome-for-testing/{}.json")
 
         self.assertEqual(self.setting["GeckoDriver"]["LinkLastReleasePlatform"], geckodriver_platform_release)
         self.assertEqual(self.setting["GeckoDriver"]["LastReleasePlatform"], 'geckodriver')
@@ -183,19 +193,26 @@ class testSetting(unittest.TestCase):
         self.assertEqual(self.setting["SafariDriver"]["LastReleasePlatform"], 'safaridriver')
 
         self.assertEqual(self.setting["ChromeBrowser"]["Path"], chrome_browser_path)
+        self.assertIsInstance(self.setting["ChromeBrowser"]["MetadataPaths"], list)
+        self.assertEqual(self.setting["ChromeBrowser"]["LinkLatestReleaseFeed"], "https://versionhistory.googleapis.com/v1/chrome/platforms/{}/channels/stable/versions")
         self.assertEqual(self.setting["ChromeBrowser"]["LinkAllLatestRelease"], 'https://chromereleases.googleblog.com/search/label/Stable%20updates')
         self.assertEqual(self.setting["ChromeBrowser"]["LinkAllLatestReleaseFile"], 'https://dl.google.com/chrome/mac/universal/stable/GGRO/googlechrome.dmg')
 
         self.assertEqual(self.setting["FirefoxBrowser"]["Path"], firefox_browser_path)
+        self.assertIsInstance(self.setting["FirefoxBrowser"]["MetadataPaths"], list)
+        self.assertEqual(self.setting["FirefoxBrowser"]["LinkLatestReleaseFeed"], 'https://product-details.mozilla.org/1.0/firefox_versions.json')
         self.assertEqual(self.setting["FirefoxBrowser"]["LinkAllLatestReleases"], 'https://www.mozilla.org/en-US/firefox/releases/')
         self.assertEqual(self.setting["FirefoxBrowser"]["LinkAllLatestRelease"], 'https://download-installer.cdn.mozilla.net/pub/firefox/releases/{}/{}/{}/Firefox {}.{}')
 
         self.assertEqual(self.setting["EdgeBrowser"]["Path"], edge_browser_path)
+        self.assertIsInstance(self.setting["EdgeBrowser"]["MetadataPaths"], list)
         self.assertEqual(self.setting["EdgeBrowser"]["LinkAllLatestRelease"], 'https://docs.microsoft.com/en-us/deployedge/microsoft-edge-relnote-stable-channel')
         self.assertEqual(self.setting["EdgeBrowser"]["LinkAllLatestReleaseFile"], edge_browser_release)
 
         self.assertEqual(self.setting["OperaBrowser"]["Path"], opera_browser_path)
+        self.assertIsInstance(self.setting["OperaBrowser"]["MetadataPaths"], list)
         self.assertEqual(self.setting["OperaBrowser"]["LinkAllLatestRelease"], 'https://get.geo.opera.com/pub/opera/desktop/')
+        self.assertEqual(self.setting["OperaBrowser"]["ProbeWindowSize"], 8)
 
         self.assertEqual(self.setting["JsonSchema"]["githubAssetSchema"], base_dir + 'schemas' + os.path.sep + 'github_asset_schema.json')
         self.assertEqual(self.setting["JsonSchema"]["githubReleaseSchema"], base_dir + 'schemas' + os.path.sep + 'github_release_schema.json')
@@ -203,9 +220,44 @@ class testSetting(unittest.TestCase):
 
         self.assertEqual(self.setting["Github"]["linkLatestReleaseBySpecificRepoName"], 'https://api.github.com/repos/{}/releases/latest')
         self.assertEqual(self.setting["Github"]["linkAllReleasesTags"], 'https://api.github.com/repos/{}/git/refs/tags')
-        self.assertEqual(self.setting["Github"]["linkAllReleases"], 'https://api.github.com/repos/{}/releases?per_page=100000')
+        self.assertEqual(self.setting["Github"]["linkAllReleases"], 'https://api.github.com/repos/{}/releases?per_page=100')
+        self.assertEqual(self.setting["Github"]["Token"], os.environ.get('GITHUB_TOKEN', ''))
+        self.assertEqual(self.setting["Github"]["MaxWait"], 15)
+        self.assertEqual(self.setting["Github"]["SpreadBelow"], 10)
 
         self.assertEqual(self.setting["PyPi"]["urlProjectJson"], 'https://pypi.python.org/pypi/selenium-driver-updater/json')
+        self.assertEqual(self.setting["PyPi"]["WaitAfterInstall"], 2)
+
+        self.assertEqual(self.setting["Requests"]["ConnectTimeout"], 10)
+        self.assertEqual(self.setting["Requests"]["ReadTimeout"], 60)
+        self.assertEqual(self.setting["Requests"]["Retries"], 3)
+        self.assertEqual(self.setting["Requests"]["RetryStatusCodes"], [429, 500, 502, 503, 504])
+
+        self.assertEqual(self.setting["Downloader"]["ChunkSize"], 1024 * 64)
+        self.assertEqual(self.setting["Downloader"]["Segments"], 1)
+        self.assertEqual(self.setting["Downloader"]["SegmentMinSize"], 1024 * 1024 * 8)
+
+        self.assertEqual(self.setting["ArtifactStore"]["Enabled"], os.environ.get('SELENIUM_DRIVER_UPDATER_ARTIFACT_STORE', '1') != '0')
+        self.assertEqual(self.setting["ArtifactStore"]["Path"], cache_dir + 'artifacts' + os.path.sep)
+        self.assertEqual(self.setting["Downloader"]["StreamExtract"], os.environ.get('SELENIUM_DRIVER_UPDATER_STREAM_EXTRACT', '0') == '1')
+        self.assertEqual(self.setting["Downloader"]["SpoolMaxSize"], 1024 * 1024 * 64)
+
+        self.assertEqual(self.setting["ArtifactStore"]["MaxSize"], 1024 * 1024 * 1024)
+
+        self.assertEqual(self.setting["MetadataCache"]["Enabled"], os.environ.get('SELENIUM_DRIVER_UPDATER_CACHE', '1') != '0')
+        self.assertEqual(self.setting["MetadataCache"]["Path"], cache_dir + 'metadata' + os.path.sep)
+        self.assertEqual(self.setting["MetadataCache"]["DefaultTTL"], 0)
+        self.assertEqual(self.setting["MetadataCache"]["TTL"]['last-known-good-versions.json'], 3600)
+        self.assertEqual(self.setting["MetadataCache"]["TTL"]['versionhistory.googleapis.com'], 3600)
+        self.assertEqual(self.setting["MetadataCache"]["TTL"]['get.geo.opera.com'], 3600)
+
+        self.assertEqual(self.setting["Mirror"]["BaseUrl"], os.environ.get('SELENIUM_DRIVER_UPDATER_MIRROR', ''))
+        self.assertEqual(self.setting["Mirror"]["SyncPath"], '')
+
+        self.assertEqual(self.setting["FileLock"]["Timeout"], 600)
+        self.assertEqual(self.setting["FileLock"]["PollInterval"], 0.2)
+
+        self.assertEqual(self.setting["Freshness"]["TrustManifestFor"], int(os.environ.get('SELENIUM_DRIVER_UPDATER_TRUST_MANIFEST_FOR', '0')))
 
 if __name__ == '__main__':
     unittest.main(verbosity=2, failfast=True, exit=False)
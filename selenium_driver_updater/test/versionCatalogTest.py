@@ -0,0 +1,88 @@
+#Standart library imports
+import unittest
+import time
+import logging
+import tempfile
+import shutil
+import copy
+import json
+from pathlib import Path
+
+import sys
+import os.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir)))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), os.path.pardir, os.path.pardir)))
+
+# Local imports
+from selenium_driver_updater.test.localServer import LocalServer, QuietHandler
+from selenium_driver_updater.util.version_catalog import VersionCatalog
+from selenium_driver_updater.util.metadata_cache import MetadataCache
+from selenium_driver_updater._setting import setting
+
+logging.basicConfig(level=logging.INFO)
+
+# pylint: disable=missing-function-docstring, protected-access
+class testVersionCatalog(unittest.TestCase):
+    """Class for unit-testing VersionCatalog class
+
+    Attributes:
+        version_catalog             : Initialize class VersionCatalog
+        server_path (str)           : Temporary folder served by local http server
+        startTime (float)           : Time of starting unit-tests
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.version_catalog = VersionCatalog
+
+        cls.old_setting = copy.deepcopy(setting)
+        setting["MetadataCache"]["Path"] = tempfile.mkdtemp() + os.path.sep
+        setting["MetadataCache"]["Enabled"] = True
+
+        cls.server_path = tempfile.mkdtemp()
+        downloads = dict(chromedriver=[dict(platform='linux64', url=''), dict(platform='mac-arm64', url='')])
+        Path(cls.server_path, '120.0.6099.109.json').write_text(json.dumps(dict(version='120.0.6099.109', downloads=downloads)), encoding='utf-8')
+
+        cls.server = LocalServer.start(QuietHandler, directory=cls.server_path)
+        setting["ChromeDriver"]["LinkVersionDownloads"] = LocalServer.get_url(cls.server) + '{}.json'
+
+    @classmethod
+    def tearDownClass(cls):
+        LocalServer.stop(cls.server)
+        shutil.rmtree(setting["MetadataCache"]["Path"], ignore_errors=True)
+        shutil.rmtree(cls.server_path, ignore_errors=True)
+        for key, value in cls.old_setting.items():
+            setting[key] = value
+        cls.version_catalog._index = None
+
+    def setUp(self):
+        self.version_catalog._index = None
+        self.start_time : float = time.time()
+
+    def tearDown(self):
+        end_time = time.time() - self.start_time
+        print("%.3f" % end_time)
+
+    #@unittest.skip('Temporary not needed')
+    def test01_check_is_available_failure(self):
+        self.assertFalse(self.version_catalog.is_available('1.0.0.0', 'linux64'))
+
+    #@unittest.skip('Temporary not needed')
+    def test02_check_is_available(self):
+        self.assertTrue(self.version_catalog.is_available('120.0.6099.109', 'linux64'))
+        self.assertTrue(self.version_catalog.is_available('120.0.6099.109', 'mac-arm64'))
+        self.assertFalse(self.version_catalog.is_available('120.0.6099.109', 'win32'))
+
+    #@unittest.skip('Temporary not needed')
+    def test03_check_index_is_saved_to_metadata_cache(self):
+        self.version_catalog.is_available('120.0.6099.109', 'linux64')
+
+        entry = MetadataCache.load(self.version_catalog._cache_key)
+        self.assertEqual(entry['versions'], {'120.0.6099.109': ['linux64', 'mac-arm64']})
+
+        setting["ChromeDriver"]["LinkVersionDownloads"] = 'http://127.0.0.1:1/{}.json'
+        self.version_catalog._index = None
+        self.assertTrue(self.version_catalog.is_available('120.0.6099.109', 'linux64'))
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2, failfast=True, exit=False)
@@ -1,15 +1,32 @@
-from selenium_driver_updater._chromeDriver import ChromeDriver
-from selenium_driver_updater._geckoDriver import GeckoDriver
-from selenium_driver_updater._operaDriver import OperaDriver
-from selenium_driver_updater._edgeDriver import EdgeDriver
-from selenium_driver_updater._phantomJS import PhantomJS
-from selenium_driver_updater._safari_driver import SafariDriver
-
-ALL_DRIVERS= {
-    "chromedriver" : ChromeDriver,
-    "geckodriver" : GeckoDriver,
-    "operadriver" : OperaDriver,
-    "edgedriver" : EdgeDriver,
-    "phantomjs" : PhantomJS,
-    "safaridriver" : SafariDriver,
-}
+#Standart library imports
+from collections.abc import Mapping
+from importlib import import_module
+
+class _LazyRegistry(Mapping):
+    """Mapping of names to classes which imports module of the class only when it is used for the first time"""
+
+    def __init__(self, paths : dict):
+        self._paths = paths
+        self._classes : dict = {}
+
+    def __getitem__(self, name):
+        if name not in self._classes:
+            module_name, class_name = self._paths[name]
+            self._classes[name] = getattr(import_module(module_name), class_name)
+        return self._classes[name]
+
+    def __iter__(self):
+        return iter(self._paths)
+
+    def __len__(self):
+        return len(self._paths)
+
+ALL_DRIVERS = _LazyRegistry({
+    "chromedriver" : ("selenium_driver_updater._chromeDriver", "ChromeDriver"),
+    "geckodriver" : ("selenium_driver_updater._geckoDriver", "GeckoDriver"),
+    "operadriver" : ("selenium_driver_updater._operaDriver", "OperaDriver"),
+    "edgedriver" : ("selenium_driver_updater._edgeDriver", "EdgeDriver"),
+    "phantomjs" : ("selenium_driver_updater._phantomJS", "PhantomJS"),
+    "safaridriver" : ("selenium_driver_updater._safari_driver", "SafariDriver"),
+})
+
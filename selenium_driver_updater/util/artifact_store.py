@@ -0,0 +1,252 @@
+#pylint: disable=logging-fstring-interpolation
+#Standart library imports
+from typing import Any, Optional
+from pathlib import Path
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import uuid
+
+#Local imports
+from selenium_driver_updater._setting import setting
+from selenium_driver_updater.util.logger import logger
+
+class ArtifactStore():
+    """Class for sharing downloaded archives between all install paths on the host
+
+    Archives are stored once by their sha256 in "objects" folder, while "refs" folder maps
+    key like "chromedriver/120.0.6099.109/chromedriver-linux64.zip" to the hash of its archive.
+    """
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Checks if artifact store is enabled in settings"""
+
+        return bool(setting["ArtifactStore"]["Enabled"])
+
+    @staticmethod
+    def _get_object_path(sha256 : str) -> str:
+        """Gets path of the stored archive by its hash"""
+
+        return str(setting["ArtifactStore"]["Path"]) + 'objects' + os.path.sep + sha256
+
+    @staticmethod
+    def _get_ref_path(key : str) -> str:
+        """Gets path of the reference file by its key"""
+
+        return str(setting["ArtifactStore"]["Path"]) + 'refs' + os.path.sep + hashlib.sha256(key.encode('utf-8')).hexdigest() + '.json'
+
+    @staticmethod
+    def get_sha256(file_path : str) -> str:
+        """Gets sha256 of the file by reading it by chunks
+
+        Args:
+            file_path (str) : Path to the file.
+
+        Returns:
+            str
+
+            sha256 (str) : Hex digest of the file.
+
+        """
+
+        file_hash = hashlib.sha256()
+
+        with open(file_path, 'rb') as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b''):
+                file_hash.update(chunk)
+
+        return file_hash.hexdigest()
+
+    @staticmethod
+    def has(key : str) -> bool:
+        """Checks if archive with specific key was added to the store
+
+        Args:
+            key (str)       : Key of the archive like "driver_name/version/archive_name".
+
+        Returns:
+            bool
+
+            is_found (bool) : True if reference of the archive exists.
+
+        """
+
+        return Path(ArtifactStore._get_ref_path(key)).is_file()
+
+    @staticmethod
+    def get(key : str, out_path : str) -> bool:
+        """Places stored archive to out_path via hardlink or copy
+
+        Args:
+            key (str)       : Key of the archive like "driver_name/version/archive_name".
+            out_path (str)  : Path where archive must be located.
+
+        Returns:
+            bool
+
+            is_found (bool) : True if archive was found in the store and placed to out_path.
+
+        """
+
+        ref : Any = None
+
+        try:
+            ref = json.loads(Path(ArtifactStore._get_ref_path(key)).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return False
+
+        if not isinstance(ref, dict) or ref.get('key') != key:
+            return False
+
+        object_path = ArtifactStore._get_object_path(str(ref.get('sha256')))
+
+        try:
+
+            #store is addressed by content, so object which does not match its hash is corrupted and must not be used
+            if os.path.getsize(object_path) != ref.get('size') or ArtifactStore.get_sha256(object_path) != ref.get('sha256'):
+
+                logger.warning(f'Archive {key} in artifact store is corrupted, deleting it sha256: {ref.get("sha256")}')
+
+                Path(object_path).unlink(missing_ok=True)
+                Path(ArtifactStore._get_ref_path(key)).unlink(missing_ok=True)
+
+                return False
+
+            ArtifactStore.__place_file(object_path, out_path)
+
+            #mtime of the object is used as last access time for eviction
+            os.utime(object_path)
+
+        except OSError:
+            return False
+
+        logger.info(f'Archive {key} was taken from artifact store sha256: {ref.get("sha256")}')
+
+        return True
+
+    @staticmethod
+    def put(key : str, file_path : str) -> Optional[str]:
+        """Adds archive to the store and evicts least recently used archives if store is too big
+
+        Args:
+            key (str)       : Key of the archive like "driver_name/version/archive_name".
+            file_path (str) : Path to downloaded archive.
+
+        Returns:
+            str or None
+
+            sha256 (str) : Hash of stored archive or None if it could not be stored.
+
+        """
+
+        try:
+
+            sha256 = ArtifactStore.get_sha256(file_path)
+            object_path = ArtifactStore._get_object_path(sha256)
+            ref_path = ArtifactStore._get_ref_path(key)
+
+            Path(object_path).parent.mkdir(parents=True, exist_ok=True)
+            Path(ref_path).parent.mkdir(parents=True, exist_ok=True)
+
+            if not Path(object_path).exists():
+                ArtifactStore.__place_file(file_path, object_path)
+
+            ref = dict(key=key, sha256=sha256, size=os.path.getsize(object_path))
+            ArtifactStore.__write_atomic(ref_path, json.dumps(ref))
+
+        except OSError as error:
+            logger.warning(f'Could not add archive {key} to artifact store error: {error}')
+            return None
+
+        ArtifactStore.evict()
+
+        return sha256
+
+    @staticmethod
+    def evict() -> None:
+        """Deletes least recently used archives and their references until store fits setting["ArtifactStore"]["MaxSize"]"""
+
+        objects_path = Path(str(setting["ArtifactStore"]["Path"]) + 'objects')
+        max_size = int(setting["ArtifactStore"]["MaxSize"])
+
+        try:
+            objects = [(file.stat(), file) for file in objects_path.iterdir() if file.is_file()]
+        except OSError:
+            return
+
+        total_size = sum(file_stat.st_size for file_stat, _ in objects)
+
+        evicted : set = set()
+
+        for file_stat, file in sorted(objects, key=lambda item: item[0].st_mtime):
+
+            if total_size <= max_size:
+                break
+
+            try:
+                file.unlink()
+                total_size -= file_stat.st_size
+                evicted.add(file.name)
+                logger.info(f'Evicted archive from artifact store: {file.name}')
+            except OSError:
+                pass
+
+        if evicted:
+            ArtifactStore.__delete_refs(evicted)
+
+    @staticmethod
+    def __delete_refs(evicted : set) -> None:
+        """Private function for deleting references to evicted archives"""
+
+        refs_path = Path(str(setting["ArtifactStore"]["Path"]) + 'refs')
+
+        try:
+            ref_files = [file for file in refs_path.iterdir() if file.suffix == '.json']
+        except OSError:
+            return
+
+        for ref_file in ref_files:
+
+            try:
+                ref = json.loads(ref_file.read_text(encoding='utf-8'))
+                if isinstance(ref, dict) and ref.get('sha256') in evicted:
+                    ref_file.unlink()
+            except (OSError, ValueError):
+                pass
+
+    @staticmethod
+    def __place_file(source_path : str, destination_path : str) -> None:
+        """Private function for atomic hardlinking or copying of the file"""
+
+        tmp_path = f'{destination_path}.{uuid.uuid4().hex}.tmp'
+
+        try:
+
+            try:
+                os.link(source_path, tmp_path)
+            except OSError:
+                shutil.copyfile(source_path, tmp_path)
+
+            os.replace(tmp_path, destination_path)
+
+        finally:
+
+            if Path(tmp_path).exists():
+                Path(tmp_path).unlink()
+
+    @staticmethod
+    def __write_atomic(file_path : str, text : str) -> None:
+        """Private function for atomic writing of the text file"""
+
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path), suffix='.tmp')
+
+        try:
+            with os.fdopen(file_descriptor, 'w', encoding='utf-8') as file:
+                file.write(text)
+            os.replace(tmp_path, file_path)
+        finally:
+            if Path(tmp_path).exists():
+                Path(tmp_path).unlink()
@@ -0,0 +1,169 @@
+#pylint: disable=logging-fstring-interpolation
+#Standart library imports
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+import contextvars
+import math
+import re
+import threading
+
+#Local imports
+from selenium_driver_updater._setting import setting
+from selenium_driver_updater.util.requests_getter import RequestsGetter
+from selenium_driver_updater.util.metadata_cache import MetadataCache
+from selenium_driver_updater.util.mirror import Mirror
+from selenium_driver_updater.util.logger import logger
+
+class BitbucketCatalog():
+    """Class for working with catalog of all downloads of bitbucket repository
+
+    Catalog is built once from all pages of bitbucket downloads api, all pages after the first one are fetched at the same time.
+    It contains index {name: {href, size}} of all downloads and sorted list of stable versions,
+    it is kept in memory and in metadata cache during ttl of "api.bitbucket.org" (see setting["MetadataCache"]["TTL"]).
+    """
+
+    _page_length = 100
+
+    _catalogs : dict = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_catalog(url : str, refresh : bool = False) -> dict:
+        """Gets catalog of downloads from memory, metadata cache or by fetching all pages
+
+        Args:
+            url (str)       : Url of bitbucket downloads api like "https://api.bitbucket.org/2.0/repositories/ariya/phantomjs/downloads/".
+            refresh (bool)  : If true, catalog will be fetched again even if it is fresh. Defaults to False.
+
+        Returns:
+            dict
+
+            catalog (dict)  : Catalog like {"assets": {name: {"href": str, "size": int}}, "versions": ["1.9.8", "2.1.1"]}.
+
+        """
+
+        key = 'catalog:' + url
+
+        if not refresh and not Mirror.is_recording():
+
+            with BitbucketCatalog._lock:
+                catalog = BitbucketCatalog._catalogs.get(url)
+
+            if catalog is None and MetadataCache.is_enabled():
+
+                entry = MetadataCache.load(key)
+                if entry and MetadataCache.is_fresh(entry, MetadataCache.get_ttl(url)):
+                    catalog = dict(assets=entry.get('assets', {}), versions=entry.get('versions', []))
+
+            if catalog is not None:
+
+                with BitbucketCatalog._lock:
+                    BitbucketCatalog._catalogs[url] = catalog
+
+                return catalog
+
+        catalog = BitbucketCatalog.__build_catalog(BitbucketCatalog.__get_all_values(url))
+
+        with BitbucketCatalog._lock:
+            BitbucketCatalog._catalogs[url] = catalog
+
+        if MetadataCache.is_enabled():
+            MetadataCache.save(key, catalog)
+
+        return catalog
+
+    @staticmethod
+    def is_available(url : str, name : str) -> bool:
+        """Checks if download with specific name exists, catalog is fetched again once if name was not found
+
+        Args:
+            url (str)   : Url of bitbucket downloads api.
+            name (str)  : Name of download like "phantomjs-2.1.1-macosx.zip".
+
+        Returns:
+            bool
+
+            is_available (bool) : True if download exists.
+
+        """
+
+        if name in BitbucketCatalog.get_catalog(url)['assets']:
+            return True
+
+        logger.info(f'Download: {name} was not found in catalog of {url}, fetching catalog again')
+
+        return name in BitbucketCatalog.get_catalog(url, refresh=True)['assets']
+
+    @staticmethod
+    def get_versions(url : str) -> list:
+        """Gets all stable versions of downloads sorted from oldest to newest
+
+        Args:
+            url (str)   : Url of bitbucket downloads api.
+
+        Returns:
+            list[str]
+
+            versions (list[str])    : Versions like ["1.9.7", "1.9.8", "2.1.1"].
+
+        """
+
+        return list(BitbucketCatalog.get_catalog(url)['versions'])
+
+    @staticmethod
+    def __get_all_values(url : str) -> list:
+        """Private function for getting downloads of all pages, pages after the first one are fetched at the same time"""
+
+        page_url = url + f'?pagelen={BitbucketCatalog._page_length}&page={{}}'
+
+        json_data : Any = RequestsGetter.get_result_by_request(url=page_url.format(1), is_json=True, use_cache=False)
+        values = list(json_data.get('values', []))
+
+        size : Optional[int] = json_data.get('size')
+        page_length = int(json_data.get('pagelen') or BitbucketCatalog._page_length)
+
+        if size is not None:
+
+            pages_count = math.ceil(int(size) / page_length)
+
+            if pages_count > 1:
+
+                with ThreadPoolExecutor(max_workers=min(pages_count - 1, 8)) as executor:
+                    futures = [executor.submit(contextvars.copy_context().run, RequestsGetter.get_result_by_request,
+                                            url=page_url.format(page), is_json=True, use_cache=False) for page in range(2, pages_count + 1)]
+
+                    for future in futures:
+                        values.extend(future.result().get('values', []))
+
+        else:
+
+            next_url = json_data.get('next')
+
+            while next_url:
+
+                json_data = RequestsGetter.get_result_by_request(url=next_url, is_json=True, use_cache=False)
+                values.extend(json_data.get('values', []))
+                next_url = json_data.get('next')
+
+        return values
+
+    @staticmethod
+    def __build_catalog(values : list) -> dict:
+        """Private function for building index of downloads and sorted list of stable versions"""
+
+        assets : dict = {}
+        versions : set = set()
+
+        for value in values:
+
+            name = str(value.get('name', ''))
+            assets[name] = dict(href=value.get('links', {}).get('self', {}).get('href', ''), size=value.get('size', 0))
+
+            if 'beta' in name:
+                continue
+
+            find_string = re.findall(setting["Program"]["wedriverVersionPattern"], name)
+            if find_string:
+                versions.add(find_string[0])
+
+        return dict(assets=assets, versions=sorted(versions, key=lambda s: list(map(int, s.split('.')))))
@@ -0,0 +1,113 @@
+#pylint: disable=logging-fstring-interpolation
+#Standart library imports
+from pathlib import Path
+import configparser
+import os
+import plistlib
+import re
+import threading
+
+#Local imports
+from selenium_driver_updater._setting import setting
+from selenium_driver_updater.util.logger import logger
+
+class BrowserMetadata():
+    """Class for reading installed browser version from files on disk without starting the browser
+
+    Supported files are "Info.plist" of macOS application bundles, "application.ini" of Firefox and
+    plain text files with version. Folder like "Application" of Chromium based browsers on Windows is also supported,
+    its version is the newest subfolder named by version. Only files of installed browser must be given, files in profile folder like
+    "Last Version" of Chromium based browsers describe the browser which was started last time, not the installed one.
+    Read versions are remembered by path, size and mtime of the file, so file is parsed again only after it was changed.
+    """
+
+    _versions : dict = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_version(paths : list) -> str:
+        """Gets browser version from the first metadata file which exists and contains version
+
+        Args:
+            paths (list[str])   : Paths to metadata files, may contain "~" and environment variables like "%LOCALAPPDATA%".
+
+        Returns:
+            str
+
+            browser_version (str)   : Version of the browser or empty string if it was not found in any file.
+
+        """
+
+        for path in paths:
+
+            metadata_path = os.path.expanduser(os.path.expandvars(path))
+
+            try:
+                metadata_stat = os.stat(metadata_path)
+            except OSError:
+                continue
+
+            key = (metadata_path, metadata_stat.st_size, metadata_stat.st_mtime_ns)
+
+            with BrowserMetadata._lock:
+                browser_version = BrowserMetadata._versions.get(key)
+
+            if browser_version is None:
+
+                browser_version = BrowserMetadata.__read_version(metadata_path)
+
+                with BrowserMetadata._lock:
+                    BrowserMetadata._versions[key] = browser_version
+
+            if browser_version:
+                logger.info(f'Found browser version: {browser_version} in metadata file: {metadata_path}')
+                return browser_version
+
+        return ''
+
+    @staticmethod
+    def __read_version(metadata_path : str) -> str:
+        """Private function for parsing version from specific metadata file"""
+
+        version : str = ''
+
+        try:
+
+            if os.path.isdir(metadata_path):
+
+                return BrowserMetadata.__read_version_folder(metadata_path)
+
+            if metadata_path.endswith('.plist'):
+
+                with open(metadata_path, 'rb') as file:
+                    version = str(plistlib.load(file).get('CFBundleShortVersionString', ''))
+
+            elif metadata_path.endswith('.ini'):
+
+                parser = configparser.ConfigParser(interpolation=None)
+                parser.read(metadata_path, encoding='utf-8')
+                version = parser.get('App', 'Version', fallback='')
+
+            else:
+
+                version = Path(metadata_path).read_text(encoding='utf-8', errors='ignore')
+
+        except (OSError, ValueError, plistlib.InvalidFileException, configparser.Error) as error:
+            logger.debug(f'Could not read browser metadata file: {metadata_path} error: {error}')
+            return ''
+
+        find_string = re.findall(setting["Program"]["wedriverVersionPattern"], version)
+
+        return find_string[0] if len(find_string) > 0 else ''
+
+    @staticmethod
+    def __read_version_folder(metadata_path : str) -> str:
+        """Private function for getting the newest version from names of subfolders, new version is installed near old one until browser restart"""
+
+        versions : list = [name for name in os.listdir(metadata_path)
+                            if re.fullmatch(r'[0-9]+(\.[0-9]+)+', name) and os.path.isdir(os.path.join(metadata_path, name))]
+
+        if not versions:
+            return ''
+
+        return max(versions, key=lambda version: [int(part) for part in version.split('.')])
@@ -0,0 +1,37 @@
+#Standart library imports
+from typing import Optional
+from contextvars import ContextVar
+import threading
+
+#Local imports
+from selenium_driver_updater.util.exceptions import InstallCancelledException
+
+_cancel_event : ContextVar[Optional[threading.Event]] = ContextVar('cancel_event', default=None)
+
+class Cancellation():
+    """Class for cooperative cancellation of install which runs in worker thread
+
+    Install checks the event of its context before every request and after every downloaded chunk,
+    so setting the event stops the install in a moment even though the thread itself can not be killed.
+    """
+
+    @staticmethod
+    def set_event(event : Optional[threading.Event]) -> None:
+        """Sets cancel event for current context, it is inherited by threads started via copied context
+
+        Args:
+            event (threading.Event) : Event which will be set when install must stop.
+
+        """
+
+        _cancel_event.set(event)
+
+    @staticmethod
+    def check() -> None:
+        """Raises InstallCancelledException if install of current context was cancelled"""
+
+        event = _cancel_event.get()
+
+        if event is not None and event.is_set():
+            message = 'Install was cancelled'
+            raise InstallCancelledException(message)
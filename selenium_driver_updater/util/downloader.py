@@ -0,0 +1,475 @@
+#pylint: disable=logging-fstring-interpolation
+#Standart library imports
+from typing import Any, Callable, Iterator, Optional
+from pathlib import Path
+import io
+import json
+import os
+import contextlib
+import contextvars
+import re
+import shutil
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+#Local imports
+from selenium_driver_updater._setting import setting
+from selenium_driver_updater.util.requests_getter import RequestsGetter
+from selenium_driver_updater.util.mirror import Mirror
+from selenium_driver_updater.util.resolution_context import ResolutionContext
+from selenium_driver_updater.util.cancellation import Cancellation
+from selenium_driver_updater.util.exceptions import StatusCodeNotEqualException
+from selenium_driver_updater.util.logger import logger
+
+class _ChunkStream(io.RawIOBase):
+    """Readable file object over chunks of response body, reports progress and stops on cancellation"""
+
+    def __init__(self, chunks : Iterator[bytes], total : int, progress : Optional[Callable[[int, int], None]]):
+        super().__init__()
+        self.chunks = chunks
+        self.total = total
+        self.progress = progress
+        self.current = 0
+        self.buffer = b''
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer : Any) -> int:
+
+        while not self.buffer:
+
+            Cancellation.check()
+
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                return 0
+
+            self.buffer = chunk
+            self.current += len(chunk)
+
+            if self.progress:
+                self.progress(self.current, self.total)
+
+        size = min(len(buffer), len(self.buffer))
+        buffer[:size] = self.buffer[:size]
+        self.buffer = self.buffer[size:]
+
+        return size
+
+class Downloader():
+    """Class for streaming downloads of archives and browser packages"""
+
+    @staticmethod
+    def download(
+        url : str, out_path : str,
+        progress : Optional[Callable[[int, int], None]] = None,
+        chunk_size : int = 0, resume : bool = False, segments : int = 0) -> str:
+        """Downloads file by chunks into temporary file and atomically renames it to out_path
+
+        If mirror is enabled, file is taken from the mirror. If mirror is being synced, downloaded file is recorded to it.
+
+        Args:
+            url (str)               : Url of the file which will be downloaded.
+            out_path (str)          : Path where downloaded file will be located.
+            progress (Callable)     : Function which will be called with downloaded and total bytes after every chunk. Defaults to None.
+            chunk_size (int)        : Size of chunk in bytes. Defaults to setting["Downloader"]["ChunkSize"].
+            resume (bool)           : If true, partial file is kept after failure and next download continues it via Range request. Defaults to False.
+            segments (int)          : Number of connections which download byte ranges of the file at the same time.
+                                      Used only if server supports Range requests and file is not smaller than setting["Downloader"]["SegmentMinSize"].
+                                      Defaults to setting["Downloader"]["Segments"].
+
+        Returns:
+            str
+
+            out_path (str)  : Path to downloaded file.
+
+        """
+
+        chunk_size = chunk_size or int(setting["Downloader"]["ChunkSize"])
+
+        out_folder = os.path.dirname(os.path.abspath(out_path))
+        Path(out_folder).mkdir(parents=True, exist_ok=True)
+
+        segments = segments or int(setting["Downloader"]["Segments"])
+
+        mirror_url = Mirror.rewrite_url(url)
+
+        if Mirror.is_file_url(mirror_url):
+            return Downloader.__copy_from_file(url=mirror_url, out_path=out_path, progress=progress, chunk_size=chunk_size)
+
+        Downloader.__download_from_url(url=mirror_url, out_path=out_path, progress=progress, chunk_size=chunk_size, resume=resume, segments=segments)
+
+        if Mirror.is_recording():
+            Mirror.record_file(url, out_path)
+
+        return out_path
+
+    @staticmethod
+    @contextlib.contextmanager
+    def open_stream(
+        url : str, progress : Optional[Callable[[int, int], None]] = None,
+        chunk_size : int = 0) -> Iterator[Any]:
+        """Opens file for reading while it is being downloaded, nothing is written to disk
+
+        Used for extracting archives while they are being downloaded. If mirror is enabled, file is read from the mirror.
+
+        Args:
+            url (str)               : Url of the file which will be read.
+            progress (Callable)     : Function which will be called with downloaded and total bytes after every chunk. Defaults to None.
+            chunk_size (int)        : Size of chunk in bytes. Defaults to setting["Downloader"]["ChunkSize"].
+
+        Returns:
+            Iterator[Any]
+
+            stream (Any)    : Binary file object, download is stopped when it is closed.
+
+        """
+
+        chunk_size = chunk_size or int(setting["Downloader"]["ChunkSize"])
+
+        mirror_url = Mirror.rewrite_url(url)
+
+        if Mirror.is_file_url(mirror_url):
+
+            file_path = Mirror.get_file_path(mirror_url)
+
+            if not Path(file_path).is_file():
+                message = f'url: {mirror_url} status_code: 404 not equal to 200 file does not exist'
+                raise StatusCodeNotEqualException(message)
+
+            with open(file_path, 'rb') as file:
+                yield file
+
+            return
+
+        Cancellation.check()
+        ResolutionContext.count_network_call()
+        with RequestsGetter.get_session().get(url=mirror_url, stream=True, timeout=RequestsGetter.get_timeout()) as request:
+
+            if request.status_code != 200:
+                message = f'url: {mirror_url} status_code: {request.status_code} not equal to 200'
+                raise StatusCodeNotEqualException(message)
+
+            total = int(request.headers.get('Content-Length', 0))
+
+            with io.BufferedReader(_ChunkStream(request.iter_content(chunk_size=chunk_size), total, progress), buffer_size=chunk_size) as stream:
+                yield stream
+
+    @staticmethod
+    def __download_from_url(
+        url : str, out_path : str,
+        progress : Optional[Callable[[int, int], None]],
+        chunk_size : int, resume : bool, segments : int) -> str:
+        """Private function for downloading file from http server"""
+
+        out_folder = os.path.dirname(os.path.abspath(out_path))
+
+        if segments > 1 and Downloader.__download_segmented(url=url, out_path=out_path, progress=progress, chunk_size=chunk_size, segments=segments):
+            return out_path
+
+        if resume:
+            return Downloader.__download_with_resume(url=url, out_path=out_path, progress=progress, chunk_size=chunk_size)
+
+        Cancellation.check()
+        ResolutionContext.count_network_call()
+        with RequestsGetter.get_session().get(url=url, stream=True, timeout=RequestsGetter.get_timeout()) as request:
+
+            if request.status_code != 200:
+                message = f'url: {url} status_code: {request.status_code} not equal to 200'
+                raise StatusCodeNotEqualException(message)
+
+            total = int(request.headers.get('Content-Length', 0))
+
+            file_descriptor, tmp_path = tempfile.mkstemp(dir=out_folder, prefix=os.path.basename(out_path) + '.', suffix='.part')
+
+            try:
+
+                with os.fdopen(file_descriptor, 'wb') as file:
+                    Downloader.__write_stream(request, file, 0, total, progress, chunk_size)
+
+                os.replace(tmp_path, out_path)
+
+            finally:
+
+                if Path(tmp_path).exists():
+                    Path(tmp_path).unlink()
+
+        return out_path
+
+    @staticmethod
+    def __copy_from_file(
+        url : str, out_path : str,
+        progress : Optional[Callable[[int, int], None]],
+        chunk_size : int) -> str:
+        """Private function for copying file of file:// url into temporary file and atomically renaming it to out_path"""
+
+        file_path = Mirror.get_file_path(url)
+
+        if not Path(file_path).is_file():
+            message = f'url: {url} status_code: 404 not equal to 200 file does not exist'
+            raise StatusCodeNotEqualException(message)
+
+        total = os.path.getsize(file_path)
+        out_folder = os.path.dirname(os.path.abspath(out_path))
+
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=out_folder, prefix=os.path.basename(out_path) + '.', suffix='.part')
+
+        try:
+
+            with open(file_path, 'rb') as source, os.fdopen(file_descriptor, 'wb') as file:
+
+                if progress:
+                    current = 0
+                    for chunk in iter(lambda: source.read(chunk_size), b''):
+                        file.write(chunk)
+                        current += len(chunk)
+                        progress(current, total)
+                else:
+                    shutil.copyfileobj(source, file, chunk_size)
+
+            os.replace(tmp_path, out_path)
+
+        finally:
+
+            if Path(tmp_path).exists():
+                Path(tmp_path).unlink()
+
+        return out_path
+
+    @staticmethod
+    def __download_with_resume(
+        url : str, out_path : str,
+        progress : Optional[Callable[[int, int], None]],
+        chunk_size : int) -> str:
+        """Private function for downloading file that continues previous partial download if it is still valid
+
+        Partial file is located at out_path + ".part" and its validators (url, ETag, Last-Modified)
+        at out_path + ".part.json". Partial file is continued only if server confirms via If-Range
+        that the file was not changed, otherwise download starts from zero.
+
+        """
+
+        part_path = out_path + '.part'
+        part_info_path = out_path + '.part.json'
+
+        headers : dict = {}
+        current : int = 0
+        part_info : Any = Downloader.__read_part_info(part_info_path)
+
+        if Path(part_path).exists() and part_info.get('url') == url:
+
+            validator = part_info.get('etag') or part_info.get('last_modified')
+            current = os.path.getsize(part_path)
+
+            if validator and current:
+                headers = {'Range': f'bytes={current}-', 'If-Range': validator}
+                logger.info(f'Trying to resume download of {url} from byte: {current}')
+
+        Cancellation.check()
+        ResolutionContext.count_network_call()
+        with RequestsGetter.get_session().get(url=url, headers=headers, stream=True, timeout=RequestsGetter.get_timeout()) as request:
+
+            content_range = re.findall(r'bytes ([0-9]+)-[0-9]+/([0-9]+|\*)', request.headers.get('Content-Range', ''))
+
+            if request.status_code == 206 and headers and (not content_range or int(content_range[0][0]) != current):
+
+                #server sent other part of the file than was asked, so partial file can not be continued
+                logger.warning(f'Server answered with range: "{request.headers.get("Content-Range", "")}" instead of bytes {current}-, download of {url} is started from zero')
+
+                Path(part_path).unlink(missing_ok=True)
+                Path(part_info_path).unlink(missing_ok=True)
+
+                request.close()
+
+                return Downloader.__download_with_resume(url, out_path, progress, chunk_size)
+
+            if request.status_code == 206 and headers:
+
+                mode = 'ab'
+                total = int(content_range[0][1]) if content_range[0][1] != '*' else current + int(request.headers.get('Content-Length', 0))
+
+            elif request.status_code == 200:
+
+                mode = 'wb'
+                current = 0
+                total = int(request.headers.get('Content-Length', 0))
+
+            else:
+
+                if request.status_code == 416:
+                    Path(part_path).unlink(missing_ok=True)
+                    Path(part_info_path).unlink(missing_ok=True)
+
+                message = f'url: {url} status_code: {request.status_code} not equal to 200'
+                raise StatusCodeNotEqualException(message)
+
+            part_info = dict(url=url, etag=request.headers.get('ETag', ''), last_modified=request.headers.get('Last-Modified', ''))
+            Path(part_info_path).write_text(json.dumps(part_info), encoding='utf-8')
+
+            with open(part_path, mode) as file:
+                Downloader.__write_stream(request, file, current, total, progress, chunk_size)
+
+        downloaded = os.path.getsize(part_path)
+
+        if total and downloaded != total:
+
+            #shorter partial file is kept, so next download continues it
+            if downloaded > total:
+                Path(part_path).unlink(missing_ok=True)
+                Path(part_info_path).unlink(missing_ok=True)
+
+            message = f'Download of {url} is incomplete downloaded: {downloaded} total: {total}'
+            raise OSError(message)
+
+        os.replace(part_path, out_path)
+        Path(part_info_path).unlink(missing_ok=True)
+
+        return out_path
+
+    @staticmethod
+    def __download_segmented(
+        url : str, out_path : str,
+        progress : Optional[Callable[[int, int], None]],
+        chunk_size : int, segments : int) -> bool:
+        """Private function for downloading byte ranges of the file at the same time into preallocated file
+
+        Returns:
+            bool
+
+            is_downloaded (bool) : False if server does not support Range requests or file is too small,
+                                   so it must be downloaded as a single stream.
+
+        """
+
+        Cancellation.check()
+        ResolutionContext.count_network_call()
+        with RequestsGetter.get_session().get(url=url, headers={'Range': 'bytes=0-0'}, stream=True, timeout=RequestsGetter.get_timeout()) as request:
+
+            content_range = re.findall(r'bytes 0-0/([0-9]+)', request.headers.get('Content-Range', ''))
+
+            if request.status_code != 206 or not content_range:
+                return False
+
+            #url after all redirects, so every segment does not follow them again
+            url_segment = request.url
+            validator = request.headers.get('ETag') or request.headers.get('Last-Modified', '')
+
+        total = int(content_range[0])
+
+        if total < int(setting["Downloader"]["SegmentMinSize"]):
+            return False
+
+        segment_size = -(-total // segments)
+        ranges = [(start, min(start + segment_size, total) - 1) for start in range(0, total, segment_size)]
+
+        logger.info(f'Started segmented download of {url} with {len(ranges)} segments')
+
+        out_folder = os.path.dirname(os.path.abspath(out_path))
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=out_folder, prefix=os.path.basename(out_path) + '.', suffix='.part')
+
+        downloaded = [0]
+        progress_lock = threading.Lock()
+
+        def download_range(byte_range : tuple) -> None:
+
+            start, end = byte_range
+            headers = {'Range': f'bytes={start}-{end}'}
+            if validator:
+                headers['If-Range'] = validator
+
+            with RequestsGetter.get_session().get(url=url_segment, headers=headers, stream=True, timeout=RequestsGetter.get_timeout()) as request:
+
+                if request.status_code != 206:
+                    message = f'url: {url} status_code: {request.status_code} not equal to 206 for range: {start}-{end}'
+                    raise StatusCodeNotEqualException(message)
+
+                with open(tmp_path, 'r+b') as file:
+                    file.seek(start)
+
+                    for chunk in request.iter_content(chunk_size=chunk_size):
+                        Cancellation.check()
+
+                        file.write(chunk)
+
+                        with progress_lock:
+                            downloaded[0] += len(chunk)
+                            if progress:
+                                progress(downloaded[0], total)
+
+        try:
+
+            with os.fdopen(file_descriptor, 'wb') as file:
+                file.truncate(total)
+
+            ResolutionContext.count_network_call(len(ranges))
+
+            with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                list(executor.map(lambda byte_range: contextvars.copy_context().run(download_range, byte_range), ranges))
+
+            if os.path.getsize(tmp_path) != total or downloaded[0] != total:
+                message = f'Segmented download of {url} is incomplete downloaded: {downloaded[0]} total: {total}'
+                raise OSError(message)
+
+            os.replace(tmp_path, out_path)
+
+        finally:
+
+            if Path(tmp_path).exists():
+                Path(tmp_path).unlink()
+
+        return True
+
+    @staticmethod
+    def __read_part_info(part_info_path : str) -> dict:
+        """Private function for reading validators of partial file"""
+
+        try:
+            part_info = json.loads(Path(part_info_path).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            part_info = {}
+
+        return part_info if isinstance(part_info, dict) else {}
+
+    @staticmethod
+    def __write_stream(
+        request : Any, file : Any, current : int, total : int,
+        progress : Optional[Callable[[int, int], None]], chunk_size : int) -> None:
+        """Private function for writing response body to file by chunks"""
+
+        for chunk in request.iter_content(chunk_size=chunk_size):
+            Cancellation.check()
+
+            file.write(chunk)
+            current += len(chunk)
+
+            if progress:
+                progress(current, total)
+
+    @staticmethod
+    def console_progress(current : int, total : int, width : int = 50) -> None:
+        """Prints progress bar of the download to the console
+
+        Args:
+            current (int)   : Downloaded bytes.
+            total (int)     : Total bytes, zero if it is unknown.
+            width (int)     : Width of the bar in symbols. Defaults to 50.
+
+        """
+
+        current_mb = round(current/1024/1024, 2)
+
+        if total:
+            filled = int(width * current / total)
+            line = f'[{"=" * filled}{" " * (width - filled)}] {current_mb} / {round(total/1024/1024, 2)} MB'
+        else:
+            line = f'{current_mb} MB'
+
+        sys.stdout.write('\r' + line)
+
+        if total and current >= total:
+            sys.stdout.write('\n')
+
+        sys.stdout.flush()
@@ -17,3 +17,7 @@ class GithubApiLimitException(Error):
 class UnknownArchiveFormatException(Error):
     """Raises if unknown archive format was specified/downloaded"""
     pass
+
+class InstallCancelledException(Error):
+    """Raises if install was cancelled or timed out while it was running"""
+    pass
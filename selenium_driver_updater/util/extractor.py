@@ -1,8 +1,9 @@
 #Standart library imports
+from typing import Any
 import zipfile
 import os
 import shutil
-from shutil import copyfile
+import tempfile
 from pathlib import Path
 
 # Third party imports
@@ -63,17 +64,16 @@ class Extractor():
         archive_path: str,
         out_path: str, delete_archive: bool = True
         ) -> None:
-        """Extract all members in specific tar.gz archive
+        """Extract driver binary from specific tar.gz archive, archive is read in one pass and all other members are skipped
 
         Args:
             archive_path (str)      : Path to specific archive.
-            out_path (str)          : Out path, where all members of archive will be gathered.
+            out_path (str)          : Out path, where driver binary will be located.
             delete_archive (bool)   : Delete archive after unzip or not. Defaults to True.
 
         """
 
-        with tarfile.open(archive_path, "r:gz") as tar_ref:
-            Extractor._safe_extract(tar_ref, out_path)
+        Extractor.__extract_driver_from_tar_archive(archive_path, out_path, "r|gz")
 
         if Path(archive_path).exists() and delete_archive:
             Path(archive_path).unlink()
@@ -94,58 +94,59 @@ class Extractor():
 
         """
 
-        driver_folder_path = out_path + 'tmp'
+        Path(out_path).mkdir(parents=True, exist_ok=True)
+
+        #unique directory, so several installs into the same folder do not extract over each other
+        driver_folder_path = tempfile.mkdtemp(dir=out_path, prefix='tmp')
         message = ('Created new safety directory for replacing '
                     f'filename: {filename} filename_replace: {filename_replace}')
         logger.info(message)
 
-        if os.path.exists(driver_folder_path):
-            shutil.rmtree(driver_folder_path)
-
         parameters = dict(
             archive_path=archive_path,out_path=driver_folder_path, delete_archive=delete_archive
             )
 
-        if archive_path.endswith('.tar.gz'):
+        try:
 
-            Extractor.extract_all_tar_gz_archive(**parameters)
+            if archive_path.endswith('.tar.gz'):
 
-        elif archive_path.endswith('.zip'):
+                Extractor.extract_all_tar_gz_archive(**parameters)
 
-            Extractor.extract_all_zip_archive(**parameters)
+            elif archive_path.endswith('.tar.bz2'):
 
-        else:
-            message = f'Unknown archive format was specified archive_path: {archive_path}'
-            raise UnknownArchiveFormatException(message)
+                Extractor.extract_all_tar_bz2_archive(**parameters)
+
+            elif archive_path.endswith('.zip'):
+
+                Extractor.extract_all_zip_archive(**parameters)
 
-        old_path = driver_folder_path + os.path.sep + filename
-        new_path = driver_folder_path + os.path.sep + filename_replace
+            else:
+                message = f'Unknown archive format was specified archive_path: {archive_path}'
+                raise UnknownArchiveFormatException(message)
 
-        os.rename(old_path, new_path)
+            old_path = driver_folder_path + os.path.sep + filename
+            renamed_driver_path = out_path + filename_replace
 
-        renamed_driver_path = out_path + filename_replace
-        if Path(renamed_driver_path).exists():
-            Path(renamed_driver_path).unlink()
+            #rename is atomic, so nobody can see half-copied driver binary
+            os.replace(old_path, renamed_driver_path)
 
-        copyfile(new_path, renamed_driver_path)
+        finally:
 
-        if Path(driver_folder_path).exists():
-            shutil.rmtree(driver_folder_path)
+            shutil.rmtree(driver_folder_path, ignore_errors=True)
 
     @staticmethod
     def extract_all_tar_bz2_archive(archive_path: str,
                                     out_path: str, delete_archive: bool = True) -> None:
-        """Extract all members in specific tar.bz2 archive
+        """Extract driver binary from specific tar.bz2 archive, archive is read in one pass and all other members are skipped
 
         Args:
             archive_path (str)      : Path to specific archive.
-            out_path (str)          : Out path, where all members of archive will be gathered.
+            out_path (str)          : Out path, where driver binary will be located.
             delete_archive (bool)   : Delete archive after unzip or not. Defaults to True.
 
         """
 
-        with tarfile.open(archive_path, "r:bz2") as tar_ref:
-            Extractor._safe_extract(tar_ref, out_path)
+        Extractor.__extract_driver_from_tar_archive(archive_path, out_path, "r|bz2")
 
         if Path(archive_path).exists() and delete_archive:
             Path(archive_path).unlink()
@@ -202,6 +203,150 @@ class Extractor():
             message = f'Unknown archive format was specified archive_path: {archive_path}'
             raise UnknownArchiveFormatException(message)
 
+    @staticmethod
+    def can_extract_from_stream(archive_name : str) -> bool:
+        """Checks if driver can be extracted from archive with specific name while it is being downloaded
+
+        Args:
+            archive_name (str)  : Name of archive like "geckodriver-v0.33.0-linux64.tar.gz".
+
+        Returns:
+            bool
+
+        """
+
+        return archive_name.endswith(('.zip', '.tar.gz', '.tar.bz2', '.tar.xz'))
+
+    @staticmethod
+    def extract_driver_from_stream(
+        stream : Any, archive_name : str, out_path : str, filename : str,
+        filename_replace : str = '', spool_max_size : int = 1024 * 1024 * 64
+        ) -> str:
+        """Extract driver binary from archive while archive is being read from stream, archive is never saved to disk
+
+        Tar archives are decompressed as bytes arrive and reading stops after the driver binary.
+        Zip archives keep their index at the end, so they are gathered into spooled buffer
+        which stays in memory while it is smaller than spool_max_size.
+
+        Args:
+            stream (Any)            : Binary file object with content of archive.
+            archive_name (str)      : Name of archive, its format is detected by extension.
+            out_path (str)          : Out path, where driver binary will be located.
+            filename (str)          : Name of driver binary inside archive.
+            filename_replace (str)  : Specific name for driver binary. Defaults to filename.
+            spool_max_size (int)    : Size in bytes of zip archive which is kept in memory. Defaults to 64 MB.
+
+        Returns:
+            str
+
+            driver_path (str)   : Path to extracted driver binary.
+
+        """
+
+        driver_path = os.path.join(out_path, filename_replace or filename)
+
+        if archive_name.endswith('.zip'):
+
+            with tempfile.SpooledTemporaryFile(max_size=spool_max_size) as spool:
+
+                shutil.copyfileobj(stream, spool)
+                spool.seek(0)
+
+                with zipfile.ZipFile(spool) as zip_ref:
+
+                    for member in zip_ref.infolist():
+
+                        if not member.is_dir() and member.filename.split('/')[-1] == filename:
+
+                            with zip_ref.open(member) as source:
+                                Extractor.__write_file(source, driver_path, (member.external_attr >> 16) & 0o777)
+
+                            return driver_path
+
+        elif Extractor.can_extract_from_stream(archive_name):
+
+            mode = 'r|' + archive_name.split('.')[-1]
+
+            with tarfile.open(fileobj=stream, mode=mode) as tar_ref:
+
+                if Extractor.__extract_tar_member(tar_ref, out_path, filename, filename_replace):
+                    return driver_path
+
+        else:
+            message = f'Unknown archive format was specified archive_name: {archive_name}'
+            raise UnknownArchiveFormatException(message)
+
+        message = f'Cannot find {filename} inside archive: {archive_name}, maybe the name of driver was changed'
+        raise FileNotFoundError(message)
+
+    @staticmethod
+    def __extract_driver_from_tar_archive(archive_path : str, out_path : str, mode : str) -> None:
+        """Private function for extracting only driver binary from tar archive without unpacking other members"""
+
+        Path(out_path).mkdir(parents=True, exist_ok=True)
+
+        with tarfile.open(archive_path, mode) as tar_ref:
+            driver_path = Extractor.__extract_tar_member(tar_ref, out_path)
+
+        if not driver_path:
+            message = 'Cannot find any drivers inside archive, maybe the name of driver was changed'
+            raise FileNotFoundError(message)
+
+    @staticmethod
+    def __extract_tar_member(tar_ref : Any, out_path : str, filename : str = '', filename_replace : str = '') -> str:
+        """Private function for writing the first driver member of tar archive opened in stream mode
+
+        Member with specific filename is searched if it is given, otherwise the first member which looks like driver binary.
+
+        Returns:
+            str
+
+            driver_path (str)   : Path to extracted driver binary or empty string if there is no such member.
+
+        """
+
+        for member in tar_ref:
+
+            if not member.isfile():
+                continue
+
+            member_name = member.name.split('/')[-1]
+
+            if filename:
+                is_driver = member_name == filename
+            else:
+                is_driver = ('driver' in member_name or 'phantomjs' in member_name) and not 'license' in member_name.lower()
+
+            if is_driver:
+
+                driver_path = os.path.join(out_path, filename_replace or member_name)
+                Extractor.__write_file(tar_ref.extractfile(member), driver_path, member.mode)
+
+                return driver_path
+
+        return ''
+
+    @staticmethod
+    def __write_file(source : Any, file_path : str, mode : int) -> None:
+        """Private function for writing member of archive to temporary file and atomically renaming it to file_path"""
+
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path), prefix='.' + os.path.basename(file_path) + '.', suffix='.part')
+
+        try:
+
+            with os.fdopen(file_descriptor, 'wb') as file:
+                shutil.copyfileobj(source, file)
+
+            if mode:
+                os.chmod(tmp_path, mode)
+
+            os.replace(tmp_path, file_path)
+
+        finally:
+
+            if Path(tmp_path).exists():
+                Path(tmp_path).unlink()
+
     @staticmethod
     def _is_within_directory(directory, target):
         """Function that checks that target directory is equal to prefix directory 
@@ -0,0 +1,107 @@
+#Standart library imports
+from pathlib import Path
+import os
+import time
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
+#Local imports
+from selenium_driver_updater._setting import setting
+
+class FileLock():
+    """Class for exclusive lock of specific file which works between processes and between threads
+
+    Lock is released automatically by the operating system if process which holds it dies.
+    Lock file itself is never deleted, because deleting it would allow two processes to lock different files.
+
+    Attributes:
+        lock_path (str)     : Path to the lock file.
+        timeout (float)     : Seconds to wait for the lock, raises TimeoutError after them.
+        waited (bool)       : True if lock was held by someone else when acquire was called.
+    """
+
+    def __init__(self, lock_path : str, timeout : float = -1):
+
+        self.lock_path = lock_path
+        self.timeout = float(setting["FileLock"]["Timeout"]) if timeout < 0 else timeout
+        self.waited = False
+
+        self._file_descriptor = -1
+
+    def acquire(self) -> bool:
+        """Waits until lock is free and takes it
+
+        Returns:
+            bool
+
+            waited (bool)   : True if lock was held by someone else and we had to wait for it.
+
+        """
+
+        Path(self.lock_path).parent.mkdir(parents=True, exist_ok=True)
+
+        file_descriptor = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o666)
+
+        deadline = time.monotonic() + self.timeout
+        self.waited = False
+
+        while not FileLock.__try_lock(file_descriptor):
+
+            self.waited = True
+
+            if time.monotonic() >= deadline:
+                os.close(file_descriptor)
+                message = f'Could not acquire lock: {self.lock_path} during {self.timeout} seconds'
+                raise TimeoutError(message)
+
+            time.sleep(float(setting["FileLock"]["PollInterval"]))
+
+        self._file_descriptor = file_descriptor
+
+        return self.waited
+
+    def release(self) -> None:
+        """Releases lock if it is held"""
+
+        if self._file_descriptor < 0:
+            return
+
+        try:
+
+            if os.name == 'nt':
+                os.lseek(self._file_descriptor, 0, os.SEEK_SET)
+                msvcrt.locking(self._file_descriptor, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(self._file_descriptor, fcntl.LOCK_UN)
+
+        finally:
+
+            os.close(self._file_descriptor)
+            self._file_descriptor = -1
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+        self.release()
+
+    @staticmethod
+    def __try_lock(file_descriptor : int) -> bool:
+        """Private function for trying to take the lock without waiting"""
+
+        try:
+
+            if os.name == 'nt':
+                os.lseek(file_descriptor, 0, os.SEEK_SET)
+                msvcrt.locking(file_descriptor, msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(file_descriptor, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+        except OSError:
+            return False
+
+        return True
@@ -0,0 +1,155 @@
+#pylint: disable=logging-fstring-interpolation
+#Standart library imports
+from typing import Any
+from urllib.parse import urlparse
+import threading
+import time
+
+#Local imports
+from selenium_driver_updater._setting import setting
+from selenium_driver_updater.util.metadata_cache import MetadataCache
+from selenium_driver_updater.util.resolution_context import ResolutionContext
+from selenium_driver_updater.util.logger import logger
+
+class GithubRateLimiter():
+    """Class for authenticating requests to github api and spreading them across remaining rate limit
+
+    Token is taken from setting["Github"]["Token"] (env GITHUB_TOKEN by default) and is sent only to api.github.com.
+    Remaining requests and reset time are read from X-RateLimit-* headers of every answer and kept in metadata cache,
+    so next processes know the budget before their first request. When few requests are left, calls are spread
+    evenly until the reset, when nothing is left, call waits for the reset if it is not too far away.
+    All waits of one install (see ResolutionContext) together never exceed setting["Github"]["MaxWait"].
+    Conditional requests are not taken from the budget and are not spread, because answer 304 is not counted by github.
+    """
+
+    _state : Any = None
+    _last_call : float = 0.0
+    _lock = threading.Lock()
+
+    @staticmethod
+    def is_github_api(url : str) -> bool:
+        """Checks if url belongs to github api"""
+
+        return urlparse(url).netloc.lower() == 'api.github.com'
+
+    @staticmethod
+    def get_headers() -> dict:
+        """Gets authorization headers for github api
+
+        Returns:
+            dict
+
+            headers (dict)  : Authorization header or empty dict if token is not set.
+
+        """
+
+        token = str(setting["Github"]["Token"])
+
+        return {'Authorization': f'Bearer {token}'} if token else {}
+
+    @staticmethod
+    def acquire(conditional : bool = False) -> None:
+        """Waits before the request to github api if it is needed to stay within rate limit
+
+        Under the lock only the delay is computed and one request is taken from the known budget,
+        so concurrent callers get different time slots, the wait itself does not block other callers.
+
+        Args:
+            conditional (bool)  : If true, request has If-None-Match or If-Modified-Since header. Defaults to False.
+
+        """
+
+        with GithubRateLimiter._lock:
+
+            state = GithubRateLimiter.__get_state()
+
+            now = time.time()
+            remaining = int(state.get('remaining', -1))
+            till_reset = float(state.get('reset', 0)) - now
+
+            #waits of all requests of current install share one limit
+            max_wait = max(float(setting["Github"]["MaxWait"]) - ResolutionContext.get_waited(), 0)
+
+            delay : float = 0
+
+            if remaining < 0 or till_reset <= 0:
+                delay = 0
+
+            elif remaining == 0:
+
+                if till_reset > max_wait:
+                    logger.warning(f'Github API rate limit is exhausted for {int(till_reset)} seconds')
+                    return
+
+                delay = till_reset
+
+            elif remaining <= int(setting["Github"]["SpreadBelow"]) and not conditional:
+
+                delay = GithubRateLimiter._last_call + till_reset / remaining - now
+                delay = min(delay, max_wait)
+
+            delay = max(delay, 0)
+
+            if remaining > 0 and till_reset > 0 and not conditional:
+                state['remaining'] = remaining - 1
+
+            if delay > 0 or not conditional:
+                GithubRateLimiter._last_call = now + delay
+
+            ResolutionContext.add_wait(delay)
+
+        if delay > 0:
+            logger.info(f'Waiting {delay:.1f} seconds for github api, {remaining} requests are left until reset')
+            time.sleep(delay)
+
+    @staticmethod
+    def update(headers : Any) -> None:
+        """Remembers rate limit of github api from headers of its answer
+
+        Args:
+            headers (Any)   : Headers of the answer.
+
+        """
+
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+
+        if remaining is None or reset is None:
+            return
+
+        state = dict(remaining=int(remaining), reset=float(reset), limit=int(headers.get('X-RateLimit-Limit', 0)))
+
+        with GithubRateLimiter._lock:
+            GithubRateLimiter._state = state
+
+        if MetadataCache.is_enabled():
+            MetadataCache.save(GithubRateLimiter.__get_cache_key(), state)
+
+    @staticmethod
+    def get_remaining() -> int:
+        """Gets number of requests left until reset or -1 if it is unknown"""
+
+        with GithubRateLimiter._lock:
+            state = GithubRateLimiter.__get_state()
+
+        if float(state.get('reset', 0)) <= time.time():
+            return -1
+
+        return int(state.get('remaining', -1))
+
+    @staticmethod
+    def __get_state() -> dict:
+        """Private function for getting rate limit state from memory or metadata cache, must be called under lock"""
+
+        if GithubRateLimiter._state is None:
+
+            entry = MetadataCache.load(GithubRateLimiter.__get_cache_key()) if MetadataCache.is_enabled() else None
+            GithubRateLimiter._state = dict(entry) if entry else {}
+
+        return GithubRateLimiter._state
+
+    @staticmethod
+    def __get_cache_key() -> str:
+        """Private function for getting key of rate limit state, anonymous and authenticated limits are different"""
+
+        return 'github:rate-limit:' + ('token' if setting["Github"]["Token"] else 'anonymous')
@@ -1,19 +1,35 @@
+#pylint: disable=import-outside-toplevel, logging-fstring-interpolation
 #Standart library imports
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
+import contextvars
 import re
-
-#Third party imports
-from bs4 import BeautifulSoup
+import threading
+import time
 
 # Local imports
 from selenium_driver_updater._setting import setting
 from selenium_driver_updater.util.requests_getter import RequestsGetter
+from selenium_driver_updater.util.metadata_cache import MetadataCache
+from selenium_driver_updater.util.mirror import Mirror
 from selenium_driver_updater.util.logger import logger
 
 from selenium_driver_updater.util.exceptions import StatusCodeNotEqualException, GithubApiLimitException
 
 class GithubViewer():
-    """Class for working with github repositories"""
+    """Class for working with github repositories
+
+    Releases are fetched page by page (github returns at most 100 releases per page), several pages at the same time.
+    Every page is kept in metadata cache with its ETag, so after ttl it is revalidated by conditional request,
+    answer 304 of github does not count against the rate limit. Index {tag: [asset names]} of every repository
+    is kept in memory and in metadata cache during ttl of "api.github.com", it is rebuilt once if asset was not found in it.
+    """
+
+    _per_page = 100
+    _pages_window = 4
+
+    _indexes : dict = {}
+    _lock = threading.Lock()
 
     @staticmethod
     def get_release_version_by_repo_name(repo_name: str, index:int = 0) -> str:
@@ -28,19 +44,15 @@ class GithubViewer():
             version         : All latest release data.
         """
 
-        if index:
-            url: str = str(setting["Github"]["linkAllReleases"]).format(repo_name)
-        else:
-            url: str = str(setting["Github"]["linkLatestReleaseBySpecificRepoName"]).format(repo_name)
+        url: str = str(setting["Github"]["linkLatestReleaseBySpecificRepoName"]).format(repo_name)
         version: Any = ''
 
         try:
-            version = RequestsGetter.get_result_by_request(url=url, is_json=True)
 
             if index:
-                version = version[index].get('name')
+                version = GithubViewer.__get_releases_page(repo_name, 1)[index].get('name')
             else:
-                version = version.get('name')
+                version = RequestsGetter.get_result_by_request(url=url, is_json=True).get('name')
 
         except StatusCodeNotEqualException as error:
             if 'API rate limit exceeded for' in error.args[0]:
@@ -55,11 +67,12 @@ class GithubViewer():
         return version
 
     @staticmethod
-    def get_all_releases_data_by_repo_name(repo_name: str) -> Any:
+    def get_all_releases_data_by_repo_name(repo_name: str, revalidate: bool = False) -> Any:
         """Gets all releases data by github repository name
 
         Args:
-            repo_name (str): Repository path on github.
+            repo_name (str)     : Repository path on github.
+            revalidate (bool)   : Revalidate cached pages even if they are still fresh. Defaults to False.
 
         Returns:
             Any
@@ -67,11 +80,30 @@ class GithubViewer():
             json_data         : All releases data.
         """
 
-        url: str = str(setting["Github"]["linkAllReleases"]).format(repo_name)
+        json_data : list = []
 
         try:
 
-            json_data = RequestsGetter.get_result_by_request(url=url, is_json=True)
+            page = 1
+            releases = GithubViewer.__get_releases_page(repo_name, page, revalidate)
+            json_data.extend(releases)
+
+            while len(releases) >= GithubViewer._per_page:
+
+                pages = list(range(page + 1, page + 1 + GithubViewer._pages_window))
+
+                with ThreadPoolExecutor(max_workers=len(pages)) as executor:
+                    futures = [executor.submit(contextvars.copy_context().run, GithubViewer.__get_releases_page, repo_name, page_number, revalidate) for page_number in pages]
+                    pages_releases = [future.result() for future in futures]
+
+                for releases in pages_releases:
+
+                    json_data.extend(releases)
+
+                    if len(releases) < GithubViewer._per_page:
+                        break
+
+                page = pages[-1]
 
         except StatusCodeNotEqualException as error:
             if 'API rate limit exceeded for' in error.args[0]:
@@ -83,6 +115,90 @@ class GithubViewer():
 
         return json_data
 
+    @staticmethod
+    def get_release_assets_index(repo_name: str, refresh: bool = False) -> dict:
+        """Gets index of all releases of github repository from memory, metadata cache or github api
+
+        Args:
+            repo_name (str) : Repository path on github.
+            refresh (bool)  : If true, index will be built again from revalidated pages even if it is fresh. Defaults to False.
+
+        Returns:
+            dict
+
+            index (dict)    : Names of assets by name and tag of every release like {"0.34.0": [...], "v0.34.0": [...]}.
+        """
+
+        key = 'releases:github:' + repo_name
+        url = str(setting["Github"]["linkAllReleases"]).format(repo_name)
+
+        ttl = MetadataCache.get_ttl(url)
+
+        if not refresh and not Mirror.is_recording():
+
+            with GithubViewer._lock:
+                entry = GithubViewer._indexes.get(repo_name)
+
+            if entry is None and MetadataCache.is_enabled():
+                entry = MetadataCache.load(key)
+
+            if entry and MetadataCache.is_fresh(entry, ttl):
+
+                with GithubViewer._lock:
+                    GithubViewer._indexes[repo_name] = entry
+
+                return entry.get('index', {})
+
+        index = {}
+
+        for release in GithubViewer.get_all_releases_data_by_repo_name(repo_name, revalidate=refresh):
+
+            asset_names = [asset.get('name') for asset in release.get('assets', [])]
+
+            for release_key in (release.get('tag_name'), release.get('name')):
+                if release_key:
+                    index.setdefault(release_key, asset_names)
+
+        entry = dict(index=index, stored_at=time.time())
+
+        with GithubViewer._lock:
+            GithubViewer._indexes[repo_name] = entry
+
+        if MetadataCache.is_enabled():
+            MetadataCache.save(key, entry)
+
+        return index
+
+    @staticmethod
+    def is_release_asset_available(repo_name: str, version: str, asset_name: str) -> bool:
+        """Checks if release with specific name or tag has asset with specific name
+
+        Args:
+            repo_name (str)     : Repository path on github.
+            version (str)       : Name or tag of the release like "0.34.0" or "v0.34.0".
+            asset_name (str)    : Name of the asset like "geckodriver-v0.34.0-linux64.tar.gz".
+
+        Returns:
+            bool
+
+            is_available (bool) : True if asset exists.
+        """
+
+        if asset_name in GithubViewer.get_release_assets_index(repo_name).get(version, []):
+            return True
+
+        logger.info(f'Asset: {asset_name} of release: {version} was not found in index of {repo_name}, building index again')
+
+        return asset_name in GithubViewer.get_release_assets_index(repo_name, refresh=True).get(version, [])
+
+    @staticmethod
+    def __get_releases_page(repo_name: str, page: int, revalidate: bool = False) -> list:
+        """Private function for getting one page of releases of github repository"""
+
+        url: str = str(setting["Github"]["linkAllReleases"]).format(repo_name) + f'&page={page}'
+
+        return RequestsGetter.get_result_by_request(url=url, is_json=True, revalidate=revalidate)
+
     @staticmethod
     def get_release_version_by_repo_name_via_site(repo_name: str, index:int = 0) -> Any:
         """Gets latest release asset by github repository name
@@ -96,6 +212,8 @@ class GithubViewer():
             json_data         : All latest release data.
         """
 
+        from bs4 import BeautifulSoup
+
         url: str = str(setting["Github"]["linkAllReleases"]).format(repo_name)
         version:str = ''
 
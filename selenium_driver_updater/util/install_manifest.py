@@ -0,0 +1,182 @@
+#pylint: disable=logging-fstring-interpolation
+#Standart library imports
+from pathlib import Path
+import json
+import os
+import tempfile
+import time
+
+#Local imports
+from selenium_driver_updater.util.artifact_store import ArtifactStore
+from selenium_driver_updater.util.logger import logger
+
+class InstallManifest():
+    """Class for working with manifest of installed driver binary
+
+    Manifest is a hidden json file next to the driver like ".chromedriver.manifest.json" with
+    version, url, sha256, size and mtime of the binary. Version from the manifest is trusted
+    only while size and mtime of the binary are the same as when manifest was written.
+    Time of the last check that driver is up to date is kept in "checked_at" for freshness policy.
+    """
+
+    @staticmethod
+    def get_path(driver_path : str) -> str:
+        """Gets path of the manifest of specific driver
+
+        Args:
+            driver_path (str)   : Path to driver binary.
+
+        Returns:
+            str
+
+            manifest_path (str) : Path like "/folder/.chromedriver.manifest.json".
+
+        """
+
+        return os.path.join(os.path.dirname(driver_path), '.' + os.path.basename(driver_path) + '.manifest.json')
+
+    @staticmethod
+    def load(driver_path : str) -> dict:
+        """Loads manifest of specific driver if it still describes current binary
+
+        Args:
+            driver_path (str)   : Path to driver binary.
+
+        Returns:
+            dict
+
+            manifest (dict) : Manifest or empty dict if there is no manifest or binary was changed after it was written.
+
+        """
+
+        try:
+            manifest = json.loads(Path(InstallManifest.get_path(driver_path)).read_text(encoding='utf-8'))
+            driver_stat = os.stat(driver_path)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(manifest, dict):
+            return {}
+
+        if manifest.get('size') != driver_stat.st_size or manifest.get('mtime_ns') != driver_stat.st_mtime_ns:
+            return {}
+
+        return manifest
+
+    @staticmethod
+    def save(driver_path : str, version : str, url : str = '') -> bool:
+        """Writes manifest of specific driver
+
+        Args:
+            driver_path (str)   : Path to driver binary.
+            version (str)       : Version of the driver.
+            url (str)           : Url from which driver was installed. Defaults to empty string.
+
+        Returns:
+            bool
+
+            is_saved (bool) : False if manifest could not be written, for example folder is read-only.
+
+        """
+
+        try:
+
+            driver_stat = os.stat(driver_path)
+
+            manifest = dict(version=version, url=url, sha256=ArtifactStore.get_sha256(driver_path),
+                            size=driver_stat.st_size, mtime_ns=driver_stat.st_mtime_ns)
+
+        except OSError as error:
+            logger.debug(f'Could not write manifest of: {driver_path} error: {error}')
+            return False
+
+        return InstallManifest.__write(driver_path, manifest)
+
+    @staticmethod
+    def mark_checked(driver_path : str) -> bool:
+        """Remembers that driver was just checked to be up to date, so freshness policy can trust its manifest
+
+        Args:
+            driver_path (str)   : Path to driver binary.
+
+        Returns:
+            bool
+
+            is_saved (bool) : False if there is no valid manifest or it could not be written.
+
+        """
+
+        manifest = InstallManifest.load(driver_path)
+
+        if not manifest:
+            return False
+
+        manifest['checked_at'] = time.time()
+
+        return InstallManifest.__write(driver_path, manifest)
+
+    @staticmethod
+    def get_fresh_version(driver_path : str, max_age : float) -> str:
+        """Gets version of driver from its manifest if driver was checked to be up to date not earlier than max_age seconds ago
+
+        Args:
+            driver_path (str)   : Path to driver binary.
+            max_age (float)     : Seconds during which result of the last check is trusted.
+
+        Returns:
+            str
+
+            driver_version (str)    : Version of the driver or empty string if manifest is missing, stale or binary was changed.
+
+        """
+
+        if max_age <= 0:
+            return ''
+
+        manifest = InstallManifest.load(driver_path)
+
+        if not manifest.get('version') or time.time() - float(manifest.get('checked_at', 0)) > max_age:
+            return ''
+
+        return str(manifest['version'])
+
+    @staticmethod
+    def __write(driver_path : str, manifest : dict) -> bool:
+        """Private function for writing manifest atomically, so other processes never read half written file"""
+
+        manifest_path = InstallManifest.get_path(driver_path)
+
+        try:
+
+            file_descriptor, tmp_path = tempfile.mkstemp(dir=os.path.dirname(manifest_path), suffix='.tmp')
+
+            try:
+                with os.fdopen(file_descriptor, 'w', encoding='utf-8') as file:
+                    json.dump(manifest, file)
+
+                os.replace(tmp_path, manifest_path)
+
+            finally:
+
+                if Path(tmp_path).exists():
+                    Path(tmp_path).unlink()
+
+        except OSError as error:
+            logger.debug(f'Could not write manifest: {manifest_path} error: {error}')
+            return False
+
+        return True
+
+    @staticmethod
+    def delete(driver_path : str) -> None:
+        """Deletes manifest of specific driver if it exists
+
+        Args:
+            driver_path (str)   : Path to driver binary.
+
+        """
+
+        manifest_path = Path(InstallManifest.get_path(driver_path))
+
+        if manifest_path.exists():
+            manifest_path.unlink()
@@ -1,6 +1,32 @@
 #Standart library imports
+from contextlib import contextmanager
+from contextvars import ContextVar
 import logging
 
+_info_messages : ContextVar[bool] = ContextVar('info_messages', default=True)
+
+class _InfoMessagesFilter(logging.Filter):
+    """Filter which drops info and debug messages of installs which were started with info_messages=False"""
+
+    def filter(self, record):
+        return record.levelno > logging.INFO or _info_messages.get()
+
+@contextmanager
+def info_messages(enabled : bool):
+    """Enables or disables info messages only for current context and threads started from it, level of the logger is not changed
+
+    Args:
+        enabled (bool)  : If false, only warnings and errors are logged.
+
+    """
+
+    token = _info_messages.set(bool(enabled))
+
+    try:
+        yield
+    finally:
+        _info_messages.reset(token)
+
 logger = logging.getLogger('selenium_driver_updater')
 logger.propagate = False
 levels = {
@@ -8,6 +34,9 @@ levels = {
     "error": logging.ERROR,
 }
 
+logger.setLevel(levels['info'])
+logger.addFilter(_InfoMessagesFilter())
+
 logFormatter = logging.Formatter('%(asctime)s %(levelname)s %(message)s ')
 
 consoleHandler = logging.StreamHandler()
@@ -0,0 +1,124 @@
+#pylint: disable=logging-fstring-interpolation
+#Standart library imports
+from typing import Any, Optional
+from pathlib import Path
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+#Local imports
+from selenium_driver_updater._setting import setting
+from selenium_driver_updater.util.logger import logger
+
+class MetadataCache():
+    """Class for storing metadata responses on disk between runs"""
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Checks if metadata cache is enabled in settings"""
+
+        return bool(setting["MetadataCache"]["Enabled"])
+
+    @staticmethod
+    def get_ttl(url : str) -> int:
+        """Gets time to live in seconds for the specified url
+
+        Args:
+            url (str) : Url which response will be cached.
+
+        Returns:
+            int
+
+            ttl (int) : Seconds while cached response can be used without revalidation.
+
+        """
+
+        ttl : int = int(setting["MetadataCache"]["DefaultTTL"])
+
+        for pattern, pattern_ttl in setting["MetadataCache"]["TTL"].items():
+            if pattern in url:
+                ttl = int(pattern_ttl)
+                break
+
+        return ttl
+
+    @staticmethod
+    def _get_entry_path(key : str) -> str:
+        """Gets path of the cache file for the specified key"""
+
+        return str(setting["MetadataCache"]["Path"]) + hashlib.sha256(key.encode('utf-8')).hexdigest() + '.json'
+
+    @staticmethod
+    def load(key : str) -> Optional[dict]:
+        """Loads cached entry by its key
+
+        Args:
+            key (str) : Key of the entry, usually url.
+
+        Returns:
+            dict or None
+
+            entry (dict) : Cached entry or None if entry does not exist or could not be read.
+
+        """
+
+        entry : Any = None
+
+        try:
+            entry = json.loads(Path(MetadataCache._get_entry_path(key)).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            entry = None
+
+        if not isinstance(entry, dict) or entry.get('key') != key:
+            return None
+
+        return entry
+
+    @staticmethod
+    def save(key : str, entry : dict) -> None:
+        """Atomically saves entry to the cache, so concurrent readers never see partial files
+
+        Args:
+            key (str)       : Key of the entry, usually url.
+            entry (dict)    : Json serializable data that will be stored.
+
+        """
+
+        entry = dict(entry, key=key)
+        entry.setdefault('stored_at', time.time())
+
+        cache_path = str(setting["MetadataCache"]["Path"])
+
+        try:
+            Path(cache_path).mkdir(parents=True, exist_ok=True)
+
+            file_descriptor, tmp_path = tempfile.mkstemp(dir=cache_path, suffix='.tmp')
+            try:
+                with os.fdopen(file_descriptor, 'w', encoding='utf-8') as file:
+                    json.dump(entry, file)
+                os.replace(tmp_path, MetadataCache._get_entry_path(key))
+            finally:
+                if Path(tmp_path).exists():
+                    Path(tmp_path).unlink()
+
+        except OSError as error:
+            logger.warning(f'Could not save metadata cache entry for key: {key} error: {error}')
+
+    @staticmethod
+    def is_fresh(entry : dict, ttl : int) -> bool:
+        """Checks if cached entry can be used without revalidation
+
+        Args:
+            entry (dict)    : Cached entry.
+            ttl (int)       : Time to live of entry in seconds.
+
+        Returns:
+            bool
+
+            is_fresh (bool) : True if entry is younger than its ttl.
+
+        """
+
+        return ttl > 0 and time.time() - float(entry.get('stored_at', 0)) < ttl
@@ -0,0 +1,226 @@
+#pylint: disable=logging-fstring-interpolation, import-outside-toplevel
+#Standart library imports
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from urllib.parse import urlparse, unquote, quote
+import os
+import re
+import shutil
+import tempfile
+import threading
+from typing import Optional
+
+#Local imports
+from selenium_driver_updater._setting import setting
+from selenium_driver_updater.util.logger import logger
+
+_current_setting : ContextVar[Optional[dict]] = ContextVar('mirror_setting', default=None)
+_current_recorded : ContextVar[Optional[list]] = ContextVar('mirror_recorded', default=None)
+
+class Mirror():
+    """Class for working with local mirror of all metadata and archives
+
+    Mirror is a folder tree where every upstream url is located at "<host>/<path>",
+    so it can be served by any static http server or used directly via file:// url.
+    If setting["Mirror"]["BaseUrl"] is set, every url is rewritten to the mirror.
+    If setting["Mirror"]["SyncPath"] is set, every fetched url is recorded to the mirror.
+    Inside Mirror.sync_to block these settings are replaced only for current context and threads started from it,
+    and urls recorded there are kept in the list of the block instead of the list of the process.
+    """
+
+    _recorded : list = []
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_setting() -> dict:
+        """Gets mirror setting of current context or global setting["Mirror"] if it was not replaced"""
+
+        mirror_setting = _current_setting.get()
+
+        return mirror_setting if mirror_setting is not None else setting["Mirror"]
+
+    @staticmethod
+    @contextmanager
+    def sync_to(path : str):
+        """Records every url fetched inside the block to the mirror at path, global setting["Mirror"] is not changed
+
+        Args:
+            path (str)  : Folder of the mirror.
+
+        Returns:
+            list[str]
+
+            urls (list[str])    : Urls recorded inside the block, list is filled while the block runs.
+
+        """
+
+        recorded : list = []
+
+        setting_token = _current_setting.set(dict(BaseUrl='', SyncPath=str(os.path.abspath(path) + os.path.sep)))
+        recorded_token = _current_recorded.set(recorded)
+
+        try:
+            yield recorded
+        finally:
+            _current_recorded.reset(recorded_token)
+            _current_setting.reset(setting_token)
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Checks if urls must be rewritten to the mirror"""
+
+        return bool(Mirror.get_setting()["BaseUrl"])
+
+    @staticmethod
+    def is_recording() -> bool:
+        """Checks if fetched urls must be recorded to the mirror"""
+
+        return bool(Mirror.get_setting()["SyncPath"])
+
+    @staticmethod
+    def get_relative_path(url : str) -> str:
+        """Gets path of the url inside the mirror
+
+        Urls without file extension (pages, api endpoints, folder listings) are stored as "index.html"
+        inside the folder of the same name, so they do not clash with files located under them.
+        Query of the url is appended to the file name.
+
+        Args:
+            url (str)   : Upstream url.
+
+        Returns:
+            str
+
+            relative_path (str) : Path like "storage.googleapis.com/chrome-for-testing-public/120.0/linux64/chromedriver-linux64.zip".
+
+        """
+
+        parsed_url = urlparse(url)
+
+        segments = [segment for segment in unquote(parsed_url.path).split('/') if segment not in ('', '.', '..')]
+
+        if not segments or '.' not in segments[-1] or parsed_url.path.endswith('/'):
+            segments.append('index.html')
+
+        if parsed_url.query:
+            segments[-1] += '_' + re.sub(r'[^A-Za-z0-9._-]', '_', parsed_url.query)
+
+        return '/'.join([parsed_url.netloc.replace(':', '_')] + segments)
+
+    @staticmethod
+    def rewrite_url(url : str) -> str:
+        """Rewrites upstream url to the mirror if mirror is enabled
+
+        Args:
+            url (str)   : Upstream url.
+
+        Returns:
+            str
+
+            url (str)   : Url inside the mirror or the same url if mirror is disabled.
+
+        """
+
+        if not Mirror.is_enabled():
+            return url
+
+        base_url = str(Mirror.get_setting()["BaseUrl"])
+
+        if not urlparse(base_url).scheme:
+            base_url = Path(base_url).resolve().as_uri()
+
+        base_url = base_url.rstrip('/')
+
+        if url.startswith(base_url + '/'):
+            return url
+
+        return base_url + '/' + quote(Mirror.get_relative_path(url))
+
+    @staticmethod
+    def is_file_url(url : str) -> bool:
+        """Checks if url points to local file"""
+
+        return urlparse(url).scheme == 'file'
+
+    @staticmethod
+    def get_file_path(url : str) -> str:
+        """Gets local path of file:// url"""
+
+        #urllib.request imports http.client and ssl, so it is imported only when mirror is used
+        from urllib.request import url2pathname
+
+        return url2pathname(urlparse(url).path)
+
+    @staticmethod
+    def record(url : str, data : bytes) -> None:
+        """Records response of the url to the mirror
+
+        Args:
+            url (str)       : Upstream url.
+            data (bytes)    : Body of the response.
+
+        """
+
+        file_descriptor, tmp_path = Mirror.__make_tmp_file(url)
+
+        with os.fdopen(file_descriptor, 'wb') as file:
+            file.write(data)
+
+        Mirror.__commit(url, tmp_path)
+
+    @staticmethod
+    def record_file(url : str, file_path : str) -> None:
+        """Records downloaded file of the url to the mirror
+
+        Args:
+            url (str)       : Upstream url.
+            file_path (str) : Path to downloaded file.
+
+        """
+
+        file_descriptor, tmp_path = Mirror.__make_tmp_file(url)
+        os.close(file_descriptor)
+
+        shutil.copyfile(file_path, tmp_path)
+
+        Mirror.__commit(url, tmp_path)
+
+    @staticmethod
+    def get_recorded() -> list:
+        """Gets urls recorded inside current Mirror.sync_to block or urls recorded by current process outside of such blocks"""
+
+        with Mirror._lock:
+            return list(Mirror.__get_recorded_list())
+
+    @staticmethod
+    def __get_recorded_list() -> list:
+        """Private function for getting list of recorded urls of current context"""
+
+        recorded = _current_recorded.get()
+
+        return recorded if recorded is not None else Mirror._recorded
+
+    @staticmethod
+    def __make_tmp_file(url : str) -> tuple:
+        """Private function for creating temporary file near the place of url in the mirror"""
+
+        mirror_path = Path(str(Mirror.get_setting()["SyncPath"])) / Mirror.get_relative_path(url)
+        mirror_path.parent.mkdir(parents=True, exist_ok=True)
+
+        return tempfile.mkstemp(dir=str(mirror_path.parent), prefix=mirror_path.name + '.', suffix='.tmp')
+
+    @staticmethod
+    def __commit(url : str, tmp_path : str) -> None:
+        """Private function for moving recorded temporary file to its place in the mirror"""
+
+        mirror_path = Path(str(Mirror.get_setting()["SyncPath"])) / Mirror.get_relative_path(url)
+
+        os.replace(tmp_path, str(mirror_path))
+
+        with Mirror._lock:
+            recorded = Mirror.__get_recorded_list()
+            if url not in recorded:
+                recorded.append(url)
+
+        logger.info(f'Recorded {url} to mirror at path: {mirror_path}')
@@ -0,0 +1,126 @@
+#pylint: disable=logging-fstring-interpolation
+#Standart library imports
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+import re
+import threading
+import time
+
+#Local imports
+from selenium_driver_updater.util.requests_getter import RequestsGetter
+from selenium_driver_updater.util.metadata_cache import MetadataCache
+from selenium_driver_updater.util.mirror import Mirror
+from selenium_driver_updater.util.logger import logger
+
+class ReleaseProber():
+    """Class for finding the newest release folder of directory listing which contains folder of specific platform
+
+    Release folders are probed in parallel windows from newest to oldest instead of one by one.
+    Platform folders of every probed release are kept in memory and in metadata cache as index {release: {platforms, probed_at}}.
+    Platforms of published releases are not removed, so release which has needed platform is taken from the index.
+    Release without needed platform is taken from the index only during ttl of the listing url (see setting["MetadataCache"]["TTL"]),
+    because platform folder can be uploaded later. The newest release of the listing is always probed again.
+    If some release folder could not be probed, error is raised instead of returning older release.
+    """
+
+    _indexes : dict = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_latest_release(url : str, releases : list, platform : str, window_size : int = 8) -> str:
+        """Gets the newest release which contains folder of specific platform
+
+        Args:
+            url (str)               : Url of directory listing with release folders, must end with "/".
+            releases (list[str])    : Names of release folders from newest to oldest like ["105.0.4970.21", "105.0.4970.16"].
+            platform (str)          : Name of platform folder like "mac" or "win".
+            window_size (int)       : Maximum number of release folders which are probed at the same time. Defaults to 8.
+
+        Returns:
+            str
+
+            release (str)   : Name of the newest release with the platform or empty string if there is no such release.
+
+        Raises:
+            Except: If some release folder could not be probed.
+
+        """
+
+        index = ReleaseProber.__get_index(url)
+
+        ttl = MetadataCache.get_ttl(url)
+
+        window_size = max(1, int(window_size))
+
+        for start in range(0, len(releases), window_size):
+
+            window = releases[start:start + window_size]
+
+            with ReleaseProber._lock:
+                unknown_releases = [release for release in window if release == releases[0] or Mirror.is_recording()
+                                    or not ReleaseProber.__is_known(index.get(release), platform, ttl)]
+
+            if unknown_releases:
+
+                logger.info(f'Probing {len(unknown_releases)} release folders of {url} at the same time')
+
+                with ThreadPoolExecutor(max_workers=len(unknown_releases)) as executor:
+                    futures = [executor.submit(contextvars.copy_context().run, ReleaseProber.__get_platforms, url + release + '/') for release in unknown_releases]
+                    platforms_of_releases = [future.result() for future in futures]
+
+                probed_at = time.time()
+                ReleaseProber.__update_index(url, {release: dict(platforms=platforms, probed_at=probed_at)
+                                                    for release, platforms in zip(unknown_releases, platforms_of_releases)})
+
+            with ReleaseProber._lock:
+                for release in window:
+                    if platform in index[release]['platforms']:
+                        return release
+
+        return ''
+
+    @staticmethod
+    def __is_known(entry, platform : str, ttl : int) -> bool:
+        """Private function for checking if release can be taken from the index without probing it again"""
+
+        if not isinstance(entry, dict) or not isinstance(entry.get('platforms'), list):
+            return False
+
+        if platform in entry['platforms']:
+            return True
+
+        return ttl > 0 and time.time() - float(entry.get('probed_at', 0)) < ttl
+
+    @staticmethod
+    def __get_platforms(url_release : str) -> list:
+        """Private function for getting names of all folders in release folder"""
+
+        text = RequestsGetter.get_result_by_request(url=url_release, use_cache=False)
+
+        return sorted(set(re.findall(r'href="([^"/?]+)/"', str(text))))
+
+    @staticmethod
+    def __get_index(url : str) -> dict:
+        """Private function for getting index of specific listing from memory or metadata cache"""
+
+        with ReleaseProber._lock:
+
+            if url not in ReleaseProber._indexes:
+
+                entry = MetadataCache.load('releases:' + url) if MetadataCache.is_enabled() else None
+                ReleaseProber._indexes[url] = dict(entry.get('releases', {})) if entry else {}
+
+            return ReleaseProber._indexes[url]
+
+    @staticmethod
+    def __update_index(url : str, releases : dict) -> None:
+        """Private function for adding probed releases to index and saving it to metadata cache"""
+
+        index = ReleaseProber.__get_index(url)
+
+        with ReleaseProber._lock:
+
+            index.update(releases)
+
+            if MetadataCache.is_enabled():
+                MetadataCache.save('releases:' + url, dict(releases=index))
@@ -1,12 +1,24 @@
 #Standart library imports
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
+from pathlib import Path
+import json
+import time
+import threading
 
 #Requests imports
 import requests
+from requests.adapters import HTTPAdapter
 from requests.models import Response
+from urllib3.util.retry import Retry
 
 #Local imports
+from selenium_driver_updater._setting import setting
 from selenium_driver_updater.util.exceptions import StatusCodeNotEqualException
+from selenium_driver_updater.util.metadata_cache import MetadataCache
+from selenium_driver_updater.util.github_rate_limiter import GithubRateLimiter
+from selenium_driver_updater.util.mirror import Mirror
+from selenium_driver_updater.util.resolution_context import ResolutionContext
+from selenium_driver_updater.util.cancellation import Cancellation
 
 class RequestsGetter(): # pylint: disable=too-few-public-methods
     """Class for working with requests module"""
@@ -17,17 +29,74 @@ class RequestsGetter(): # pylint: disable=too-few-public-methods
 
     _headers = {'User-Agent': user_agent}
 
+    _session : Optional[requests.Session] = None
+    _session_lock = threading.Lock()
+
+    @staticmethod
+    def get_session() -> requests.Session:
+        """Gets shared session with keep-alive connection pool and retries
+
+        Returns:
+            requests.Session
+
+            session (requests.Session)  : Session which is shared between all drivers, browsers and github viewer.
+
+        """
+
+        with RequestsGetter._session_lock:
+
+            if RequestsGetter._session is None:
+
+                retries = Retry(
+                    total=int(setting["Requests"]["Retries"]),
+                    backoff_factor=float(setting["Requests"]["BackoffFactor"]),
+                    status_forcelist=setting["Requests"]["RetryStatusCodes"],
+                    allowed_methods=['GET', 'HEAD'],
+                    raise_on_status=False,
+                )
+
+                pool_maxsize = int(setting["Requests"]["PoolMaxSize"])
+                adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize, max_retries=retries)
+
+                session = requests.Session()
+                session.headers.update(RequestsGetter._headers)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+
+                RequestsGetter._session = session
+
+        return RequestsGetter._session
+
+    @staticmethod
+    def get_timeout() -> Tuple[float, float]:
+        """Gets connect and read timeouts for requests
+
+        Returns:
+            Tuple of float and float
+
+            connect_timeout (float) : Seconds to wait for connection.
+            read_timeout (float)    : Seconds to wait between bytes of response.
+
+        """
+
+        return float(setting["Requests"]["ConnectTimeout"]), float(setting["Requests"]["ReadTimeout"])
+
     @staticmethod
     def get_result_by_request(
         url : str, is_json : bool = False,
-        no_error_status_code : bool = False) -> Any:
+        no_error_status_code : bool = False,
+        use_cache : bool = True, revalidate : bool = False) -> Any:
         """Gets html text and status_code from the specified url by get request
 
+        If resolution context of the install is active, every url is fetched only once during the install.
+
         Args:
             url (str)                   : Url which we will use for getting information
             cookies                     : Specific cookies for request
             is_json (bool)              : Transorm request.text to json or not. Defaults to False.
             no_error_status_code (bool) : Will not throw an error if status_code not equal to 200.
+            use_cache (bool)            : Use and fill metadata cache if it is enabled. Defaults to True.
+            revalidate (bool)           : Revalidate cached answer by conditional request even if it is still fresh. Defaults to False.
 
         Returns:
             str
@@ -36,21 +105,113 @@ class RequestsGetter(): # pylint: disable=too-few-public-methods
 
         """
 
+        context = ResolutionContext.get_current()
+
+        if context is None:
+            request_text = RequestsGetter.__get_text(url, no_error_status_code, use_cache, revalidate)
+        else:
+            key = (url, no_error_status_code, 'revalidate') if revalidate else (url, no_error_status_code)
+            request_text = context.resolve(key, lambda: RequestsGetter.__get_text(url, no_error_status_code, use_cache, revalidate))
+
+        return RequestsGetter.__transform_text(request_text, is_json)
+
+    @staticmethod
+    def __get_text(url : str, no_error_status_code : bool, use_cache : bool, revalidate : bool = False) -> str:
+        """Private function for getting text of the url from mirror, metadata cache or network"""
+
         status_code : int = 0
         request_text : str = ''
         request : Optional[Response] = None
+        cache_entry : Optional[dict] = None
+        ttl : int = 0
+
+        headers = dict(RequestsGetter._headers)
 
-        request = requests.get(url=url, headers=RequestsGetter._headers)
+        source_url = url
+        url = Mirror.rewrite_url(url)
+
+        if Mirror.is_file_url(url):
+            return RequestsGetter.__get_text_from_file(url, no_error_status_code)
+
+        use_cache = use_cache and MetadataCache.is_enabled() and not Mirror.is_recording()
+
+        if use_cache:
+
+            ttl = MetadataCache.get_ttl(url)
+            cache_entry = MetadataCache.load(url)
+
+            if cache_entry:
+
+                if MetadataCache.is_fresh(cache_entry, ttl) and not revalidate:
+                    return cache_entry['text']
+
+                if cache_entry.get('etag'):
+                    headers['If-None-Match'] = cache_entry['etag']
+                if cache_entry.get('last_modified'):
+                    headers['If-Modified-Since'] = cache_entry['last_modified']
+
+        is_github_api = GithubRateLimiter.is_github_api(url)
+
+        if is_github_api:
+            headers.update(GithubRateLimiter.get_headers())
+            GithubRateLimiter.acquire(conditional='If-None-Match' in headers or 'If-Modified-Since' in headers)
+
+        Cancellation.check()
+        ResolutionContext.count_network_call()
+        request = RequestsGetter.get_session().get(url=url, headers=headers, timeout=RequestsGetter.get_timeout())
+
+        if is_github_api:
+            GithubRateLimiter.update(request.headers)
         status_code = request.status_code
         request_text = request.text
 
+        if status_code == 304 and cache_entry:
+
+            cache_entry['stored_at'] = time.time()
+            MetadataCache.save(url, cache_entry)
+
+            return cache_entry['text']
+
         if status_code != 200 and not no_error_status_code:
 
             message_run = (f'url: {url} status_code: {status_code}'
                             f'not equal to 200 request_text: {request.text}')
             raise StatusCodeNotEqualException(message_run)
 
+        if status_code == 200 and Mirror.is_recording():
+            Mirror.record(source_url, request.content)
+
+        etag = request.headers.get('ETag', '')
+        last_modified = request.headers.get('Last-Modified', '')
+
+        if use_cache and status_code == 200 and (ttl > 0 or etag or last_modified):
+
+            cache_entry = dict(text=request_text, etag=etag, last_modified=last_modified, stored_at=time.time())
+            MetadataCache.save(url, cache_entry)
+
+        return request_text
+
+    @staticmethod
+    def __get_text_from_file(url : str, no_error_status_code : bool) -> str:
+        """Private function for reading text of file:// url the same way as response of http server"""
+
+        file_path = Path(Mirror.get_file_path(url))
+
+        if not file_path.is_file():
+
+            if no_error_status_code:
+                return ''
+
+            message_run = f'url: {url} status_code: 404 not equal to 200 file does not exist'
+            raise StatusCodeNotEqualException(message_run)
+
+        return file_path.read_text(encoding='utf-8')
+
+    @staticmethod
+    def __transform_text(request_text : str, is_json : bool) -> Any:
+        """Private function for transforming request text to json if needed"""
+
         if is_json:
-            request_text = request.json()
+            return json.loads(request_text)
 
         return request_text
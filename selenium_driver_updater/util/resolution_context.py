@@ -0,0 +1,105 @@
+#Standart library imports
+from typing import Any, Callable, Optional
+from contextvars import ContextVar
+import threading
+
+_current_context : ContextVar[Optional['ResolutionContext']] = ContextVar('resolution_context', default=None)
+
+class ResolutionContext():
+    """Class for remembering upstream answers during one install of a driver
+
+    Every url which was fetched while context is active is fetched only once, all next requests
+    of the same url get remembered answer. Context also counts how many network calls were made
+    and how long the install waited for rate limits.
+
+    Attributes:
+        network_calls (int) : Number of requests which went to the network while context was active.
+        waited (float)      : Seconds which were spent waiting for rate limits while context was active.
+    """
+
+    def __init__(self):
+
+        self.network_calls : int = 0
+        self.waited : float = 0.0
+
+        self._answers : dict = {}
+        self._lock = threading.Lock()
+        self._token : Any = None
+
+    def __enter__(self):
+        self._token = _current_context.set(self)
+        return self
+
+    def __exit__(self, *args):
+        _current_context.reset(self._token)
+
+    @staticmethod
+    def get_current() -> Optional['ResolutionContext']:
+        """Gets context of current install or None if there is no active context"""
+
+        return _current_context.get()
+
+    @staticmethod
+    def count_network_call(count : int = 1) -> None:
+        """Adds network calls to the counter of current context if it is active
+
+        Args:
+            count (int) : Number of network calls. Defaults to 1.
+
+        """
+
+        context = _current_context.get()
+
+        if context is not None:
+            with context._lock:
+                context.network_calls += count
+
+    @staticmethod
+    def get_waited() -> float:
+        """Gets seconds spent waiting for rate limits in current context or 0 if there is no active context"""
+
+        context = _current_context.get()
+
+        if context is None:
+            return 0.0
+
+        with context._lock:
+            return context.waited
+
+    @staticmethod
+    def add_wait(seconds : float) -> None:
+        """Adds seconds of waiting for rate limit to current context if it is active
+
+        Args:
+            seconds (float) : Seconds of waiting.
+
+        """
+
+        context = _current_context.get()
+
+        if context is not None:
+            with context._lock:
+                context.waited += seconds
+
+    def resolve(self, key : Any, fetch : Callable[[], Any]) -> Any:
+        """Gets remembered answer by key or fetches and remembers it
+
+        Args:
+            key (Any)           : Hashable key of the answer, usually url.
+            fetch (Callable)    : Function which gets the answer if it was not remembered yet.
+
+        Returns:
+            Any
+
+            answer (Any)    : Remembered or fetched answer.
+
+        """
+
+        with self._lock:
+            if key in self._answers:
+                return self._answers[key]
+
+        answer = fetch()
+
+        with self._lock:
+            return self._answers.setdefault(key, answer)
@@ -0,0 +1,117 @@
+#pylint: disable=logging-fstring-interpolation
+#Standart library imports
+from typing import Any, Optional
+import threading
+
+#Third party imports
+from requests.exceptions import RequestException
+
+#Local imports
+from selenium_driver_updater._setting import setting
+from selenium_driver_updater.util.requests_getter import RequestsGetter
+from selenium_driver_updater.util.metadata_cache import MetadataCache
+from selenium_driver_updater.util.mirror import Mirror
+from selenium_driver_updater.util.logger import logger
+from selenium_driver_updater.util.exceptions import StatusCodeNotEqualException
+
+class VersionCatalog():
+    """Class for checking which chromedriver versions and platforms exist in Chrome for Testing
+
+    Catalog is a compact index {version: [platforms]} that is kept in memory and in metadata cache.
+    Downloads of published version never change, so entries of the index do not expire.
+    """
+
+    _cache_key = 'catalog:chromedriver'
+
+    _index : Optional[dict] = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def is_available(version : str, platform : str) -> bool:
+        """Checks if chromedriver of specific version exists for specific platform
+
+        Args:
+            version (str)   : Version of chromedriver like "120.0.6099.109".
+            platform (str)  : Platform of chromedriver like "linux64" or "mac-arm64".
+
+        Returns:
+            bool
+
+            is_available (bool) : True if chromedriver can be downloaded.
+
+        """
+
+        index = VersionCatalog.__get_index()
+
+        if version in index and not Mirror.is_recording():
+            return platform in index[version]
+
+        try:
+
+            platforms = VersionCatalog.__get_platforms_by_version(version)
+
+        except StatusCodeNotEqualException:
+
+            return False
+
+        except RequestException:
+
+            logger.warning(f'Could not get downloads of chromedriver {version}, trying to get them via all known good versions')
+            VersionCatalog.__update_index(VersionCatalog.__get_platforms_of_all_versions())
+            platforms = VersionCatalog.__get_index().get(version, [])
+
+        else:
+
+            VersionCatalog.__update_index({version: platforms})
+
+        return platform in platforms
+
+    @staticmethod
+    def __get_platforms_by_version(version : str) -> list:
+        """Private function for getting platforms of one version via small per-version endpoint"""
+
+        url = str(setting["ChromeDriver"]["LinkVersionDownloads"]).format(version)
+        json_data = RequestsGetter.get_result_by_request(url=url, is_json=True, use_cache=False)
+
+        return VersionCatalog.__get_platforms(json_data)
+
+    @staticmethod
+    def __get_platforms_of_all_versions() -> dict:
+        """Private function for getting platforms of all versions via known-good-versions-with-downloads.json"""
+
+        url = str(setting["ChromeDriver"]["LinkCheckVersionIsValid"])
+        json_data = RequestsGetter.get_result_by_request(url=url, is_json=True, use_cache=False)
+
+        return {data.get('version'): VersionCatalog.__get_platforms(data) for data in json_data.get('versions', [])}
+
+    @staticmethod
+    def __get_platforms(json_data : Any) -> list:
+        """Private function for getting platforms of chromedriver downloads from version data"""
+
+        return [download.get('platform') for download in json_data.get('downloads', {}).get('chromedriver', [])]
+
+    @staticmethod
+    def __get_index() -> dict:
+        """Private function for getting index from memory or metadata cache"""
+
+        with VersionCatalog._lock:
+
+            if VersionCatalog._index is None:
+
+                entry = MetadataCache.load(VersionCatalog._cache_key) if MetadataCache.is_enabled() else None
+                VersionCatalog._index = dict(entry.get('versions', {})) if entry else {}
+
+            return VersionCatalog._index
+
+    @staticmethod
+    def __update_index(versions : dict) -> None:
+        """Private function for adding versions to index and saving it to metadata cache"""
+
+        index = VersionCatalog.__get_index()
+
+        with VersionCatalog._lock:
+
+            index.update(versions)
+
+            if MetadataCache.is_enabled():
+                MetadataCache.save(VersionCatalog._cache_key, dict(versions=index))